@@ -1,4 +1,5 @@
 
+import glob
 import os
 from Itview.Manifest import QtCore, QtGui
 from Itview import QT4Color
@@ -7,9 +8,44 @@ from Itview import constants as C
 DISP_OVERLAY_ENV_NAME = 'TABLETHELPER_NOHIDE_OVERLAYS'
 KEY_OVERRIDE_NAME     = 'TABLETHELPER_KEY_OVERRIDE'
 
+# Environment is read once at import, it does not change at runtime.
+_DISP_OVERLAY_NOHIDE = bool(os.environ.get(DISP_OVERLAY_ENV_NAME))
+_KEY_OVERRIDE = os.environ.get(KEY_OVERRIDE_NAME, 'Ctrl+Alt+T')
+_KEY_SEQ = QtGui.QKeySequence(_KEY_OVERRIDE)
+
 ICON_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), 'icons')
 
+_EMPTY_ICON = QtGui.QIcon()
+_ICON_CACHE = {}
+
+# Each icon name is checked on disk once, missing icons share one empty
+# QIcon rather than retrying a failed image load on every call.
+def _icon(name):
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        path = os.path.join(ICON_PATH, name)
+        # Icon names carry no suffix, Qt probes the image formats itself.
+        if os.path.isfile(path) or glob.glob(path + '.*'):
+            icon = QtGui.QIcon(path)
+        else:
+            icon = _EMPTY_ICON
+        _ICON_CACHE[name] = icon
+    return icon
+
+# Size icon names indexed by (width - 1), built once for every width the
+# pen and eraser sliders can report.
+_PEN_BRUSH_ICONS = [
+    os.path.join("brushes", "brush_%d" % int(w / (C.MAX_ANNOTATION_PEN_WIDTH / 10)))
+    for w in range(C.MAX_ANNOTATION_PEN_WIDTH)]
+_ERASER_ICONS = [
+    os.path.join("erasers", "eraser_%d" % int(w / (C.MAX_ANNOTATION_ERASER_WIDTH / 10)))
+    for w in range(C.MAX_ANNOTATION_ERASER_WIDTH)]
+
+def _size_icon(icons, width):
+    """Size icon for width, clamped to the widths the table covers."""
+    return _icon(icons[min(max(int(width), 1), len(icons)) - 1])
+
 class TabletHelper(QtCore.QObject):
     TOGGLE_ON_COLOR = (0.63, 0.63, 0.63)
     def itvPluginInitialize(self, info):
@@ -20,23 +56,21 @@ class TabletHelper(QtCore.QObject):
         self.__audioWaveformPlugin = False
         self.__menu = None
         self.__plugins = None
+        self._pluginActionsByName = {}
         self.__photoPlugin = False
         self.__frameOverlay = False
         self.__textOverlay = False
-        self.annotationColor = []
-        self.__menu = None
-        self.__plugins = None
         self.__audioScrubbing = False
         self.__toggleMask = False
         self.__orientHorizontal = False
-        self.annotationColor = []
-        self.annotationColor.append((1.0, 1.0, 1.0))
-        self.annotationColor.append((1.0, 0.0, 0.0))
-        self.annotationColor.append((0.9, 0.5, 0.0))
-        self.annotationColor.append((0.3, 1.0, 0.9))
+        self.annotationColor = (
+            (1.0, 1.0, 1.0),
+            (1.0, 0.0, 0.0),
+            (0.9, 0.5, 0.0),
+            (0.3, 1.0, 0.9))
+        self._nColors = len(self.annotationColor)
         self.defaultAnnoColor = self.annotationColor[0]
         self.colorIter = 0
-        self.modeActions = []
 
         TabletHelper.PREF_PLUGIN = 'TabletHelper'
         TabletHelper.PREF_TOOLBAR_POSITION_X = '{}/geometry/x'.format(TabletHelper.PREF_PLUGIN)
@@ -55,71 +89,85 @@ class TabletHelper(QtCore.QObject):
 
     def itvAttachMenu_v3(self, menus):
         self.__menu = menus
-        keySeq = os.environ.get(KEY_OVERRIDE_NAME, 'Ctrl+Alt+T')
         menu = menus['Plugins']
-        menu.addAction("Tablet Helper", self.toolbarCallback,
-                        QtGui.QKeySequence(keySeq))
+        menu.addAction("Tablet Helper", self.toolbarCallback, _KEY_SEQ)
+        self.__updatePluginActions()
+        menu.aboutToShow.connect(self.__updatePluginActions)
+
+    def __updatePluginActions(self):
+        menu = self.__menu['Plugins']
+        self._pluginActionsByName = \
+            {str(action.text()): action for action in menu.actions()}
+
+    def __getPluginAction(self, name):
+        action = self._pluginActionsByName.get(name)
+        if action is None:
+            # Plugins can register their menu entries after we attached
+            self.__updatePluginActions()
+            action = self._pluginActionsByName.get(name)
+        return action
 
     def itvProcessCommandLine(self, options):
         if options.TabletHelper_activate is not None:
             self.toolbarCallback()
 
     def __initActions(self):
-        self.colorAction = QtGui.QAction(QtGui.QIcon("{icons}/applications-graphics".format(icons=ICON_PATH)), "Cycle Annotation Color", self)
-        self.clearAnnoAction = QtGui.QAction(QtGui.QIcon("{icons}/edit-clear".format(icons=ICON_PATH)), "Clear Annotations", self)
-        self.undoAnnoAction = QtGui.QAction(QtGui.QIcon("{icons}/edit-undo".format(icons=ICON_PATH)), "Undo Annotation", self)
-        self.redoAnnoAction = QtGui.QAction(QtGui.QIcon("{icons}/edit-redo".format(icons=ICON_PATH)), "Redo Annotation", self)
-        self.muteAction = QtGui.QAction(QtGui.QIcon("{icons}/audio-volume-muted".format(icons=ICON_PATH)), "Mute Audio", self)
-        self.nextClipAction = QtGui.QAction(QtGui.QIcon("{icons}/go-next".format(icons=ICON_PATH)), "Next Clip", self)#go-last-view
-        self.prevClipAction = QtGui.QAction(QtGui.QIcon("{icons}/go-previous".format(icons=ICON_PATH)), "Previous Clip", self)#go-first-view
-        self.nextAnnoAction = QtGui.QAction(QtGui.QIcon("{icons}/arrow-right-double".format(icons=ICON_PATH)), "Next Annotation", self)
-        self.prevAnnoAction = QtGui.QAction(QtGui.QIcon("{icons}/arrow-left-double".format(icons=ICON_PATH)), "Previous Annotation", self)
-        self.dimAction = QtGui.QAction(QtGui.QIcon("{icons}/help-hint".format(icons=ICON_PATH)), "Dim Lights", self)
-        self.audioWFAction = QtGui.QAction(QtGui.QIcon("{icons}/applications-multimedia".format(icons=ICON_PATH)), "Audio Waveforms", self)
-        self.colorSwatchAction = QtGui.QAction(QtGui.QIcon("{icons}/fill-color".format(icons=ICON_PATH)), "Color Swatch", self)
-        self.photoAction = QtGui.QAction(QtGui.QIcon("{icons}/preferences-desktop-user".format(icons=ICON_PATH)), "Photo Plugin", self)
-        self.frameAction = QtGui.QAction(QtGui.QIcon("{icons}/frame-overlay".format(icons=ICON_PATH)), "Display frame overlay", self)
-        self.textAction = QtGui.QAction(QtGui.QIcon("{icons}/text-overlay".format(icons=ICON_PATH)), "Display text overlay", self)
-        self.overlayAction = QtGui.QAction(QtGui.QIcon("{icons}/all-overlay".format(icons=ICON_PATH)), "Display all overlays", self)
-        self.scrubAction = QtGui.QAction(QtGui.QIcon("{icons}/applications-media-scrub".format(icons=ICON_PATH)), "Play audio while scrubbing", self)
-        self.maskAction = QtGui.QAction(QtGui.QIcon("{icons}/insert-image".format(icons=ICON_PATH)), "Toggle Mask", self)
-        self.penAction = QtGui.QAction(QtGui.QIcon("{icons}/draw-freehand".format(icons=ICON_PATH)), "Pen Tool", self)
-        self.eraserAction = QtGui.QAction(QtGui.QIcon("{icons}/draw-eraser".format(icons=ICON_PATH)), "Eraser Tool", self)
-        self.colorPickAction = QtGui.QAction(QtGui.QIcon("{icons}/color-picker".format(icons=ICON_PATH)), "Color Picker", self)
-        self.orientAction = QtGui.QAction(QtGui.QIcon("{icons}/orient-horizontal".format(icons=ICON_PATH)), "Change Toolbar Orientation", self)
+        self.colorAction = QtGui.QAction(_icon("applications-graphics"), "Cycle Annotation Color", self)
+        self.clearAnnoAction = QtGui.QAction(_icon("edit-clear"), "Clear Annotations", self)
+        self.undoAnnoAction = QtGui.QAction(_icon("edit-undo"), "Undo Annotation", self)
+        self.redoAnnoAction = QtGui.QAction(_icon("edit-redo"), "Redo Annotation", self)
+        self.muteAction = QtGui.QAction(_icon("audio-volume-muted"), "Mute Audio", self)
+        self.nextClipAction = QtGui.QAction(_icon("go-next"), "Next Clip", self)#go-last-view
+        self.prevClipAction = QtGui.QAction(_icon("go-previous"), "Previous Clip", self)#go-first-view
+        self.nextAnnoAction = QtGui.QAction(_icon("arrow-right-double"), "Next Annotation", self)
+        self.prevAnnoAction = QtGui.QAction(_icon("arrow-left-double"), "Previous Annotation", self)
+        self.dimAction = QtGui.QAction(_icon("help-hint"), "Dim Lights", self)
+        self.audioWFAction = QtGui.QAction(_icon("applications-multimedia"), "Audio Waveforms", self)
+        self.colorSwatchAction = QtGui.QAction(_icon("fill-color"), "Color Swatch", self)
+        self.photoAction = QtGui.QAction(_icon("preferences-desktop-user"), "Photo Plugin", self)
+        self.frameAction = QtGui.QAction(_icon("frame-overlay"), "Display frame overlay", self)
+        self.textAction = QtGui.QAction(_icon("text-overlay"), "Display text overlay", self)
+        self.overlayAction = QtGui.QAction(_icon("all-overlay"), "Display all overlays", self)
+        self.scrubAction = QtGui.QAction(_icon("applications-media-scrub"), "Play audio while scrubbing", self)
+        self.maskAction = QtGui.QAction(_icon("insert-image"), "Toggle Mask", self)
+        self.penAction = QtGui.QAction(_icon("draw-freehand"), "Pen Tool", self)
+        self.eraserAction = QtGui.QAction(_icon("draw-eraser"), "Eraser Tool", self)
+        self.colorPickAction = QtGui.QAction(_icon("color-picker"), "Color Picker", self)
+        self.orientAction = QtGui.QAction(_icon("orient-horizontal"), "Change Toolbar Orientation", self)
 
         self.createPenSizeSlider()
         self.createEraserSlider()
         self.createContrastSlider()
         self.__itview_api.SIG_INTERACTIVE_MODE_CHANGED.connect(self.syncSelect)
 
-        self.connect(self.colorAction, QtCore.SIGNAL("triggered()"), self.cycleColor)
-        self.connect(self.clearAnnoAction, QtCore.SIGNAL("triggered()"), self.__itview_api.clearAllAnnotations)
-        self.connect(self.undoAnnoAction, QtCore.SIGNAL("triggered()"), self.__itview_api.undoAnnotationStroke)
-        self.connect(self.redoAnnoAction, QtCore.SIGNAL("triggered()"), self.__itview_api.redoAnnotationStroke)
-        self.connect(self.muteAction, QtCore.SIGNAL("triggered()"), lambda: self.__itview_api.setAudioMute(not self.__itview_api.getAudioMute()))
-        self.connect(self.nextClipAction, QtCore.SIGNAL("triggered()"), self.__itview_api.gotoNextClip)
-        self.connect(self.prevClipAction, QtCore.SIGNAL("triggered()"), self.__itview_api.gotoPrevClip)
-        self.connect(self.nextAnnoAction, QtCore.SIGNAL("triggered()"), self.__itview_api.nextAnnotation)
-        self.connect(self.prevAnnoAction, QtCore.SIGNAL("triggered()"), self.__itview_api.prevAnnotation)
-        self.connect(self.dimAction, QtCore.SIGNAL("triggered()"), self.dimLights)
-        self.connect(self.audioWFAction, QtCore.SIGNAL("triggered()"), self.audioWaveformPlugin)
-        self.connect(self.colorSwatchAction, QtCore.SIGNAL("triggered()"), self.colorSwatch)
-        self.connect(self.photoAction, QtCore.SIGNAL("triggered()"), self.photoPlugin)
-        self.connect(self.frameAction, QtCore.SIGNAL("triggered()"), self.frameOverlay)
-        self.connect(self.textAction, QtCore.SIGNAL("triggered()"), self.textOverlay)
-        self.connect(self.overlayAction, QtCore.SIGNAL("triggered()"), self.allOverlay)
-        self.connect(self.scrubAction, QtCore.SIGNAL("triggered()"), self.audioScrub)
-        self.connect(self.maskAction, QtCore.SIGNAL("triggered()"), self.toggleMask)
-        self.connect(self.penAction, QtCore.SIGNAL("triggered()"), self.penSelect)
-        self.connect(self.eraserAction, QtCore.SIGNAL("triggered()"), self.eraserSelect)
-        self.connect(self.colorPickAction, QtCore.SIGNAL("triggered()"), self.__itview_api.SIG_ANNOTATION_PEN_COLOR_TOOL_SELECTED.emit)
-        self.connect(self.orientAction, QtCore.SIGNAL("triggered()"), self.orientChange)
-        self.connect(self.contrastAction, QtCore.SIGNAL("triggered()"), self.contrastSet)
+        self.colorAction.triggered.connect(self.cycleColor)
+        self.clearAnnoAction.triggered.connect(self.__itview_api.clearAllAnnotations)
+        self.undoAnnoAction.triggered.connect(self.__itview_api.undoAnnotationStroke)
+        self.redoAnnoAction.triggered.connect(self.__itview_api.redoAnnotationStroke)
+        self.muteAction.triggered.connect(self._toggleMute)
+        self.nextClipAction.triggered.connect(self.__itview_api.gotoNextClip)
+        self.prevClipAction.triggered.connect(self.__itview_api.gotoPrevClip)
+        self.nextAnnoAction.triggered.connect(self.__itview_api.nextAnnotation)
+        self.prevAnnoAction.triggered.connect(self.__itview_api.prevAnnotation)
+        self.dimAction.triggered.connect(self.dimLights)
+        self.audioWFAction.triggered.connect(self.audioWaveformPlugin)
+        self.colorSwatchAction.triggered.connect(self.colorSwatch)
+        self.photoAction.triggered.connect(self.photoPlugin)
+        self.frameAction.triggered.connect(self.frameOverlay)
+        self.textAction.triggered.connect(self.textOverlay)
+        self.overlayAction.triggered.connect(self.allOverlay)
+        self.scrubAction.triggered.connect(self.audioScrub)
+        self.maskAction.triggered.connect(self.toggleMask)
+        self.penAction.triggered.connect(self.penSelect)
+        self.eraserAction.triggered.connect(self.eraserSelect)
+        self.colorPickAction.triggered.connect(self.__itview_api.SIG_ANNOTATION_PEN_COLOR_TOOL_SELECTED.emit)
+        self.orientAction.triggered.connect(self.orientChange)
 
         self.__itview_api.SIG_VOLUME_MUTE_CHANGED.connect(self.muteHandler)
 
-        self.modeActions.extend([self.penAction, self.eraserAction])
+        self._modeByConst = {
+            C.ITR_MODE_PEN: self.penAction,
+            C.ITR_MODE_ERASE: self.eraserAction}
 
     def __initToolbar(self):
         self.__initActions()
@@ -153,17 +201,14 @@ class TabletHelper(QtCore.QObject):
         self.__toolbar.setWindowFlags(QtCore.Qt.Tool|QtCore.Qt.WindowStaysOnTopHint|\
                QtCore.Qt.FramelessWindowHint|QtCore.Qt.X11BypassWindowManagerHint)
 
-        self.__toolbar.widgetForAction(self.photoAction).setAutoFillBackground(True)
-        self.__toolbar.widgetForAction(self.scrubAction).setAutoFillBackground(True)
-        self.__toolbar.widgetForAction(self.maskAction).setAutoFillBackground(True)
-        self.__toolbar.widgetForAction(self.audioWFAction).setAutoFillBackground(True)
-        self.__toolbar.widgetForAction(self.photoAction).setAutoFillBackground(True)
-        self.__toolbar.widgetForAction(self.textAction).setAutoFillBackground(True)
-        self.__toolbar.widgetForAction(self.colorAction).setAutoFillBackground(True)
-        self.__toolbar.widgetForAction(self.penAction).setAutoFillBackground(True)
-        self.__toolbar.widgetForAction(self.eraserAction).setAutoFillBackground(True)
-        frameWidget = self.__toolbar.widgetForAction(self.frameAction)
-        frameWidget.setAutoFillBackground(True)
+        self._actionWidgets = {
+            action: self.__toolbar.widgetForAction(action)
+            for action in self.__toolbar.actions()}
+        for action in (self.photoAction, self.scrubAction, self.maskAction,
+                       self.audioWFAction, self.textAction, self.colorAction,
+                       self.penAction, self.eraserAction, self.frameAction):
+            self._actionWidgets[action].setAutoFillBackground(True)
+        frameWidget = self._actionWidgets[self.frameAction]
 
         self.__toolbar.setIconSize(QtCore.QSize(16, 16))
 
@@ -173,11 +218,13 @@ class TabletHelper(QtCore.QObject):
                              palette.green() / float(255))
         self.muteHandler(self.__itview_api.getAudioMute())
 
-        for action in self.__toolbar.actions():
-            widget = self.__toolbar.widgetForAction(action)
+        for widget in self._actionWidgets.values():
             widget.setFocusPolicy(QtCore.Qt.NoFocus)
 
     def drawToolbar(self, orientation=QtCore.Qt.Vertical):
+        if self.__toolbar.orientation() == orientation and \
+           not self.__toolbar.isHidden():
+            return
         self.__toolbar.hide()
         self.__toolbar.setOrientation(orientation)
         self.__toolbar.show()
@@ -194,17 +241,10 @@ class TabletHelper(QtCore.QObject):
             self.__toolbar.setMovable(True)
             self.__toolbar.setFocusPolicy(QtCore.Qt.NoFocus)
 
-            orient, _ = self.__itview_api.readPreferencesEntry(
-                TabletHelper.PREF_TOOLBAR_ORIENTATION, default_value=QtCore.Qt.Vertical)
-            orient = int(orient)
+            orient, x_coor, y_coor = self.__readPreferences()
             self.__orientHorizontal = orient == QtCore.Qt.Horizontal
             self.drawToolbar(orient)
 
-            x_coor, _ = self.__itview_api.readPreferencesEntry(
-                TabletHelper.PREF_TOOLBAR_POSITION_X, default_value=None)
-            y_coor, _ = self.__itview_api.readPreferencesEntry(
-                TabletHelper.PREF_TOOLBAR_POSITION_Y, default_value=None)
-
             if x_coor is None and y_coor is None:
                 # Initial placement of toolbar
                 desktop = QtGui.QDesktopWidget().screenGeometry(
@@ -226,7 +266,7 @@ class TabletHelper(QtCore.QObject):
             self.penWidth(self.__itview_api.getAnnotationPenWidth())
 
             self.orientIconSet()
-            if not os.environ.get(DISP_OVERLAY_ENV_NAME, False):
+            if not _DISP_OVERLAY_NOHIDE:
                 userActions.overlay_frame.setOn(False)
                 userActions.overlay_frame.setOn(False)
                 userActions.overlay_text.setOn(False)
@@ -248,9 +288,7 @@ class TabletHelper(QtCore.QObject):
         colorWidget.setPalette(palette)
 
     def cycleColor(self):
-        self.colorIter += 1
-        if self.colorIter == len(self.annotationColor):
-            self.colorIter = 0
+        self.colorIter = (self.colorIter + 1) % self._nColors
         color = self.annotationColor[self.colorIter]
         qcolor = QtGui.QColor(*map(lambda x: int(x*255), color))
         self.__itview_api.setAnnotationPenColor(color)
@@ -267,11 +305,11 @@ class TabletHelper(QtCore.QObject):
             # print "Dimming the lights..."
             cc.setSlope([0.65,0.65,0.65])
             cc.setSat(0.5)
-            qicon = QtGui.QIcon("{icons}/help-hint-dull".format(icons=ICON_PATH))
+            qicon = _icon("help-hint-dull")
         else:
             cc.setSlope([1,1,1])
             cc.setSat(1)
-            qicon = QtGui.QIcon("{icons}/help-hint".format(icons=ICON_PATH))
+            qicon = _icon("help-hint")
             # print "Raising the lights..."
         self.__itview_api.setCurrentColorCorrection(cc)
         self.dimAction.setIcon(qicon)
@@ -311,11 +349,10 @@ class TabletHelper(QtCore.QObject):
         palette.setColor(widget.backgroundRole(), qcolor)
         widget.setPalette(palette)
 
-        actions = self.__plugins.actions()
-        for action in actions:
-            if str(action.text()) == "Audio Waveform Timeline":
-                action.activate(QtGui.QAction.Trigger)
-                return
+        action = self.__getPluginAction("Audio Waveform Timeline")
+        if action is not None:
+            action.activate(QtGui.QAction.Trigger)
+            return
         audioWidget = self.__toolbar.widgetForAction(self.audioWFAction)
         QtGui.QMessageBox.warning(
             audioWidget,
@@ -323,14 +360,15 @@ class TabletHelper(QtCore.QObject):
             "Audio Waveform (gltimeline) plugin not loaded correctly")
 
     def colorSwatch(self):
-        cur = map(lambda x: int(x * 255), self.__itview_api.getAnnotationPenColor())
+        api = self.__itview_api
+        cur = map(lambda x: int(x * 255), api.getAnnotationPenColor())
         color = QtGui.QColorDialog.getColor(
             QtGui.QColor(*cur),
-            self.__itview_api.getDialogParent(),
+            api.getDialogParent(),
             "color picker")
         if not color.isValid(): return
         qcolor = (color.red() / 255.0, color.green() / 255.0, color.blue() / 255.0)
-        self.__itview_api.setAnnotationPenColor(qcolor)
+        api.setAnnotationPenColor(qcolor)
         widget = self.__toolbar.widgetForAction(self.colorAction)
         palette = widget.palette()
         palette.setColor(widget.backgroundRole(), color)
@@ -347,11 +385,10 @@ class TabletHelper(QtCore.QObject):
         palette.setColor(widget.backgroundRole(), qcolor)
         widget.setPalette(palette)
 
-        actions = self.__plugins.actions()
-        for action in actions:
-            if str(action.text()) == "Photo":
-                action.activate(QtGui.QAction.Trigger)
-                return
+        action = self.__getPluginAction("Photo")
+        if action is not None:
+            action.activate(QtGui.QAction.Trigger)
+            return
         photoWidget = self.__toolbar.widgetForAction(self.photoAction)
         QtGui.QMessageBox.warning(
             photoWidget,
@@ -369,7 +406,6 @@ class TabletHelper(QtCore.QObject):
         palette.setColor(widget.backgroundRole(), qcolor)
         widget.setPalette(palette)
 
-        self.__itview_api.getDisplayFrameOverlay()
         self.__itview_api.setDisplayFrameOverlay(self.__frameOverlay)
 
     def textOverlay(self):
@@ -383,7 +419,6 @@ class TabletHelper(QtCore.QObject):
         palette.setColor(widget.backgroundRole(), qcolor)
         widget.setPalette(palette)
 
-        self.__itview_api.getDisplayTextOverlay()
         self.__itview_api.setDisplayTextOverlay(self.__textOverlay)
 
     def allOverlay(self):
@@ -395,12 +430,16 @@ class TabletHelper(QtCore.QObject):
             self.frameOverlay()
             self.textOverlay()
 
+    def _toggleMute(self):
+        api = self.__itview_api
+        api.setAudioMute(not api.getAudioMute())
+
     @QtCore.Slot(bool)
     def muteHandler(self, muted):
         if muted:
-            self.muteAction.setIcon(QtGui.QIcon("{icons}/audio-volume-muted".format(icons=ICON_PATH)))
+            self.muteAction.setIcon(_icon("audio-volume-muted"))
         else:
-            self.muteAction.setIcon(QtGui.QIcon("{icons}/audio-volume-high".format(icons=ICON_PATH)))
+            self.muteAction.setIcon(_icon("audio-volume-high"))
 
     def createPenSizeSlider(self):
         penSizeMenu = QtGui.QMenu('')
@@ -433,40 +472,39 @@ class TabletHelper(QtCore.QObject):
         self.__itview_api.SIG_ANNOTATION_ERASER_WIDTH_CHANGED.connect(self.eraserWidth)
 
     def syncSelect(self, mode):
-        if mode == C.ITR_MODE_PEN:
-            self.setInteractiveMode(self.penAction)
-        if mode == C.ITR_MODE_ERASE:
-            self.setInteractiveMode(self.eraserAction)
+        action = self._modeByConst.get(mode)
+        if action is not None:
+            self.setInteractiveMode(action)
 
     def penSelect(self):
-        if self.__itview_api.getInteractiveMode() == C.ITR_MODE_PEN:
-            self.__itview_api.setInteractiveMode(C.ITR_MODE_DEFAULT)
+        api = self.__itview_api
+        if api.getInteractiveMode() == C.ITR_MODE_PEN:
+            api.setInteractiveMode(C.ITR_MODE_DEFAULT)
             self.setInteractiveMode(None)
         else:
-            self.__itview_api.setInteractiveMode(C.ITR_MODE_PEN)
+            api.setInteractiveMode(C.ITR_MODE_PEN)
             self.setInteractiveMode(self.penAction)
 
     def eraserSelect(self):
-        if self.__itview_api.getInteractiveMode() == C.ITR_MODE_ERASE:
-            self.__itview_api.setInteractiveMode(C.ITR_MODE_DEFAULT)
+        api = self.__itview_api
+        if api.getInteractiveMode() == C.ITR_MODE_ERASE:
+            api.setInteractiveMode(C.ITR_MODE_DEFAULT)
             self.setInteractiveMode(None)
         else:
-            self.__itview_api.setInteractiveMode(C.ITR_MODE_ERASE)
+            api.setInteractiveMode(C.ITR_MODE_ERASE)
             self.setInteractiveMode(self.eraserAction)
 
     def penWidth(self, width):
         self.__itview_api.setAnnotationPenWidth(int(width))
         self.penSizeAction.setIcon(
-            QtGui.QIcon("{icons}/brushes/brush_{w}".format(icons=ICON_PATH,
-                         w=(width-1)/(C.MAX_ANNOTATION_PEN_WIDTH/10))))
+            _size_icon(_PEN_BRUSH_ICONS, width))
         self.__penWidth_slider.setValue(width)
         self.setInteractiveMode(self.penAction)
 
     def eraserWidth(self, width):
         self.__itview_api.setAnnotationEraserWidth(int(width))
         self.eraserSizeAction.setIcon(
-            QtGui.QIcon("{icons}/erasers/eraser_{w}".format(icons=ICON_PATH,
-                         w=(width-1)/(C.MAX_ANNOTATION_ERASER_WIDTH/10))))
+            _size_icon(_ERASER_ICONS, width))
         self.__eraseWidth_slider.setValue(width)
         self.setInteractiveMode(self.eraserAction)
 
@@ -482,44 +520,60 @@ class TabletHelper(QtCore.QObject):
         self.contrastAction = QtGui.QPushButton('', None)
         self.contrastAction.setToolTip("Contrast")
         self.contrastAction.setMenu(contrastMenu)
-        self.contrastAction.setIcon(QtGui.QIcon("{icons}/contrast".format(icons=ICON_PATH)))
+        self.contrastAction.setIcon(_icon("contrast"))
 
     def setInteractiveMode(self, curr_action):
-        for action in self.modeActions:
-            if action is curr_action:
-                qcolor = QtGui.QColor(*map(lambda x: int(x * 255), self.TOGGLE_ON_COLOR))
-            else:
-                qcolor = QtGui.QColor(*map(lambda x: int(x * 255), self.defaultColor))
-            widget = self.__toolbar.widgetForAction(action)
-            palette = widget.palette()
-            palette.setColor(widget.backgroundRole(), qcolor)
-            widget.setPalette(palette)
+        self._setToggleBg(self.penAction, curr_action is self.penAction)
+        self._setToggleBg(self.eraserAction, curr_action is self.eraserAction)
+
+    def _setToggleBg(self, action, on):
+        color = self.TOGGLE_ON_COLOR if on else self.defaultColor
+        qcolor = QtGui.QColor(*map(lambda x: int(x * 255), color))
+        widget = self.__toolbar.widgetForAction(action)
+        palette = widget.palette()
+        palette.setColor(widget.backgroundRole(), qcolor)
+        widget.setPalette(palette)
 
     def orientChange(self):
         self.__orientHorizontal = not self.__orientHorizontal
         if self.__orientHorizontal:
-            self.drawToolbar(QtCore.Qt.Horizontal)
+            orientation = QtCore.Qt.Horizontal
         else:
-            self.drawToolbar(QtCore.Qt.Vertical)
+            orientation = QtCore.Qt.Vertical
+        if self.__toolbar.orientation() != orientation:
+            self.drawToolbar(orientation)
         self.orientIconSet()
 
     def orientIconSet(self):
         if self.__toolbar.orientation() == QtCore.Qt.Horizontal:
             self.orientAction.setIcon(
-                QtGui.QIcon("{icons}/orient-vertical".format(icons=ICON_PATH)))
+                _icon("orient-vertical"))
         else:
             self.orientAction.setIcon(
-                QtGui.QIcon("{icons}/orient-horizontal".format(icons=ICON_PATH)))
+                _icon("orient-horizontal"))
 
     def contrastSet(self, value):
+        api = self.__itview_api
         contrastValue = value / 100.0
         if contrastValue == 0.0:
-            lastMixMode = self.__itview_api.getBackgroundMixMode()
-            self.__itview_api.setBackgroundMixMode(lastMixMode)
+            lastMixMode = api.getBackgroundMixMode()
+            api.setBackgroundMixMode(lastMixMode)
 
-        self.__itview_api.setMixColorValue(
+        api.setMixColorValue(
             C.CONTRAST_MIX_COLOR, contrastValue)
 
+    def __readPreferences(self):
+        # Only needed when the toolbar is being shown, hiding it never
+        # touches the preferences store.
+        api = self.__itview_api
+        orient, _ = api.readPreferencesEntry(
+            TabletHelper.PREF_TOOLBAR_ORIENTATION, default_value=QtCore.Qt.Vertical)
+        x_coor, _ = api.readPreferencesEntry(
+            TabletHelper.PREF_TOOLBAR_POSITION_X, default_value=None)
+        y_coor, _ = api.readPreferencesEntry(
+            TabletHelper.PREF_TOOLBAR_POSITION_Y, default_value=None)
+        return int(orient), x_coor, y_coor
+
     def savePreferences(self):
         self.__itview_api.writePreferencesEntry(
             TabletHelper.PREF_TOOLBAR_POSITION_X,
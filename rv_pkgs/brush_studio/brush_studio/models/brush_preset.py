@@ -4,12 +4,33 @@ Brush preset configuration.
 Stores complete brush settings including base parameters and sensor modulation.
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, fields, MISSING
+from typing import Callable, Dict, List, Optional
 import json
+import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not available, use stdlib json
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Shared stdlib encoder for to_json, built once rather than per call
+_encode_json = json.JSONEncoder(indent=2).encode
+
+# Interned RGBA tuples, so presets holding the same color share one tuple
+_COLOR_CACHE: Dict[tuple, tuple] = {}
+
+
+def _intern_color(color) -> tuple:
+    """Return the shared tuple equal to an RGBA color sequence."""
+    color = tuple(color)
+    return _COLOR_CACHE.setdefault(color, color)
+
+
+@dataclass(**_SLOTS)
 class SensorConfig:
     """
     Configuration for sensor modulation of a brush parameter.
@@ -18,9 +39,107 @@ class SensorConfig:
     enabled: bool = True
     strength: float = 1.0  # 0.0-1.0
     curve: str = 'linear'  # 'linear', 'ease_in', 'ease_out', 'ease_in_out'
+    
+    def to_dict(self) -> dict:
+        """Convert sensor config to dictionary for JSON serialization."""
+        return {
+            'sensor_type': self.sensor_type,
+            'enabled': self.enabled,
+            'strength': self.strength,
+            'curve': self.curve,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'SensorConfig':
+        """Create sensor config from dictionary."""
+        return _sensor_config_from_dict(cls, data)
+
+
+def _make_from_dict(dataclass_type: type, converters: Optional[Dict[str, Callable]] = None) -> Callable:
+    """
+    Generate a from_dict loader specialised to a dataclass's fields.
+    
+    The loader is compiled once from the field list, so loading a dict is
+    straight-line attribute assignment: no field reflection, kwargs
+    expansion or __init__ call per object.
+    
+    Args:
+        dataclass_type: Dataclass to generate the loader for
+        converters: Optional per-field callables applied to values present
+                    in the dict (defaults are used as-is)
+    
+    Returns:
+        Function (cls, data) -> instance of cls
+    """
+    converters = converters or {}
+    namespace = {'_new': object.__new__}
+    lines = ['def from_dict(cls, data):', '    obj = _new(cls)', '    get = data.get']
+    for f in fields(dataclass_type):
+        name = f.name
+        if f.default is not MISSING:
+            namespace[f'_default_{name}'] = f.default
+            default = f'_default_{name}'
+        elif f.default_factory is not MISSING:
+            namespace[f'_factory_{name}'] = f.default_factory
+            default = f'_factory_{name}()'
+        else:
+            default = None
+        
+        if name in converters:
+            namespace[f'_convert_{name}'] = converters[name]
+            value = f'_convert_{name}(data[{name!r}])'
+            if default is not None:
+                value = f'{value} if {name!r} in data else {default}'
+        elif default is None:
+            value = f'data[{name!r}]'
+        elif f.default is not MISSING:
+            value = f'get({name!r}, {default})'
+        else:
+            value = f'data[{name!r}] if {name!r} in data else {default}'
+        lines.append(f'    obj.{name} = {value}')
+    lines.append('    return obj')
+    
+    exec('\n'.join(lines), namespace)
+    return namespace['from_dict']
 
 
-@dataclass
+_sensor_config_from_dict = _make_from_dict(SensorConfig)
+
+
+def _sensor_configs_from_list(items) -> List[SensorConfig]:
+    """Convert a list of sensor config dicts (or configs) to SensorConfigs."""
+    return [
+        item if isinstance(item, SensorConfig) else SensorConfig.from_dict(item)
+        for item in items
+    ]
+
+
+def _sensor_config_hook(data: dict):
+    """json object_hook that builds SensorConfigs while parsing."""
+    if 'sensor_type' in data:
+        return _sensor_config_from_dict(SensorConfig, data)
+    return data
+
+
+def read_preset_json(filepath: str) -> dict:
+    """
+    Read the raw preset dictionary from a JSON file.
+    
+    Args:
+        filepath: Path to JSON file
+    
+    Returns:
+        Parsed dictionary, suitable for BrushPreset.from_dict
+    """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+@dataclass(**_SLOTS)
 class BrushPreset:
     """
     Complete brush configuration.
@@ -50,6 +169,9 @@ class BrushPreset:
     flow_modulation: List[SensorConfig] = field(default_factory=list)
     rotation_modulation: List[SensorConfig] = field(default_factory=list)
     
+    def __post_init__(self):
+        self.color = _intern_color(self.color)
+    
     def to_dict(self) -> dict:
         """
         Convert preset to dictionary for JSON serialization.
@@ -57,8 +179,21 @@ class BrushPreset:
         Returns:
             Dictionary representation
         """
-        data = asdict(self)
-        return data
+        return {
+            'name': self.name,
+            'icon_path': self.icon_path,
+            'size': self.size,
+            'opacity': self.opacity,
+            'flow': self.flow,
+            'hardness': self.hardness,
+            'spacing': self.spacing,
+            'color': self.color,
+            'texture_type': self.texture_type,
+            'size_modulation': [s.to_dict() for s in self.size_modulation],
+            'opacity_modulation': [s.to_dict() for s in self.opacity_modulation],
+            'flow_modulation': [s.to_dict() for s in self.flow_modulation],
+            'rotation_modulation': [s.to_dict() for s in self.rotation_modulation],
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'BrushPreset':
@@ -71,19 +206,7 @@ class BrushPreset:
         Returns:
             BrushPreset instance
         """
-        # Convert sensor configs
-        for key in ['size_modulation', 'opacity_modulation', 'flow_modulation', 'rotation_modulation']:
-            if key in data and isinstance(data[key], list):
-                data[key] = [
-                    SensorConfig(**item) if isinstance(item, dict) else item
-                    for item in data[key]
-                ]
-        
-        # Convert color tuple
-        if 'color' in data and isinstance(data['color'], list):
-            data['color'] = tuple(data['color'])
-        
-        return cls(**data)
+        return _preset_from_dict(cls, data)
     
     def to_json(self, filepath: str):
         """
@@ -92,8 +215,13 @@ class BrushPreset:
         Args:
             filepath: Path to save file
         """
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+            return
+        
         with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+            f.write(_encode_json(self.to_dict()))
     
     @classmethod
     def from_json(cls, filepath: str) -> 'BrushPreset':
@@ -106,9 +234,12 @@ class BrushPreset:
         Returns:
             BrushPreset instance
         """
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        if orjson is None:
+            # Sensor configs are built by the parser, from_dict passes them through
+            with open(filepath, 'r') as f:
+                return cls.from_dict(json.load(f, object_hook=_sensor_config_hook))
+        
+        return cls.from_dict(read_preset_json(filepath))
     
     def add_size_sensor(self, sensor_type: str, enabled: bool = True, strength: float = 1.0, curve: str = 'linear'):
         """Add sensor modulation for size parameter."""
@@ -126,3 +257,11 @@ class BrushPreset:
         """Add sensor modulation for rotation parameter."""
         self.rotation_modulation.append(SensorConfig(sensor_type, enabled, strength, curve))
 
+
+_preset_from_dict = _make_from_dict(BrushPreset, {
+    'color': _intern_color,
+    'size_modulation': _sensor_configs_from_list,
+    'opacity_modulation': _sensor_configs_from_list,
+    'flow_modulation': _sensor_configs_from_list,
+    'rotation_modulation': _sensor_configs_from_list,
+})
@@ -4,12 +4,35 @@ Brush stroke data model.
 Stores stroke points and metadata for a single brush stroke.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Tuple
-from brush_studio.models.sensor_data import SensorData
+from dataclasses import dataclass, field, fields, InitVar
+from typing import Dict, List, Tuple
+import sys
+import numpy as np
+from brush_studio.models.sensor_data import SensorData, SENSOR_FIELDS
 
 
-@dataclass
+# Initial number of point rows allocated per stroke (grows by doubling)
+_INITIAL_CAPACITY = 64
+
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Read-only float32 color arrays shared by all strokes of the same color
+_COLOR_ARRAYS: Dict[tuple, np.ndarray] = {}
+
+
+def _color_array(color) -> np.ndarray:
+    """Return the shared read-only float32 array for an RGBA color."""
+    key = tuple(color.tolist()) if isinstance(color, np.ndarray) else tuple(color)
+    array = _COLOR_ARRAYS.get(key)
+    if array is None:
+        array = np.array(key, dtype=np.float32)
+        array.flags.writeable = False
+        _COLOR_ARRAYS[key] = array
+    return array
+
+
+@dataclass(**_SLOTS)
 class StrokePoint:
     """
     Single point in a brush stroke with sensor data.
@@ -30,11 +53,18 @@ class BrushStroke:
     
     Stores all points in a stroke along with the brush preset
     used and timestamp information.
+    
+    Points are kept as structure-of-arrays: `xy` holds one (x, y) row per
+    point, `sensors` one row of SENSOR_FIELDS readings per point and
+    `timestamps` the absolute time of each point. Only the first `count`
+    rows are valid. Coordinates, sensor readings and `color` are float32,
+    ready for GPU upload; timestamps stay float64 as float32 cannot hold
+    epoch seconds precisely. Pass `expected_points` when the stroke length
+    is known up front to allocate all rows at once.
     """
     
-    points: List[StrokePoint] = field(default_factory=list)
     preset_name: str = "Basic"
-    color: Tuple[float, float, float, float] = (0.0, 0.0, 0.0, 1.0)  # RGBA color used for this stroke
+    color: np.ndarray = field(default=(0.0, 0.0, 0.0, 1.0), compare=False)  # RGBA color used for this stroke
     texture_type: str = "soft_circle"  # Brush tip texture used
     size: float = 25.0  # Size used for this stroke
     opacity: float = 1.0  # Opacity used
@@ -43,6 +73,40 @@ class BrushStroke:
     frame: int = 0
     start_time: float = 0.0
     end_time: float = 0.0
+    expected_points: InitVar[int] = _INITIAL_CAPACITY
+    
+    xy: np.ndarray = field(init=False, repr=False, compare=False)
+    sensors: np.ndarray = field(init=False, repr=False, compare=False)
+    timestamps: np.ndarray = field(init=False, repr=False, compare=False)
+    count: int = field(init=False, default=0, compare=False)
+    
+    def __post_init__(self, expected_points: int):
+        capacity = max(expected_points, 1)
+        self.color = _color_array(self.color)
+        self.xy = np.empty((capacity, 2), dtype=np.float32)
+        self.sensors = np.empty((capacity, len(SENSOR_FIELDS)), dtype=np.float32)
+        self.timestamps = np.empty(capacity, dtype=np.float64)
+    
+    def __eq__(self, other):
+        """
+        Compare metadata and points.
+        
+        Defined explicitly because the generated __eq__ cannot compare the
+        color and point arrays; only the first `count` point rows are
+        compared.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        
+        n = self.count
+        return (
+            all(getattr(self, f.name) == getattr(other, f.name) for f in fields(self) if f.compare)
+            and np.array_equal(self.color, other.color)
+            and n == other.count
+            and np.array_equal(self.xy[:n], other.xy[:n])
+            and np.array_equal(self.sensors[:n], other.sensors[:n])
+            and np.array_equal(self.timestamps[:n], other.timestamps[:n])
+        )
     
     def add_point(self, x: float, y: float, sensor_data: SensorData):
         """
@@ -52,12 +116,72 @@ class BrushStroke:
             x, y: Normalized coordinates (0-1)
             sensor_data: Sensor readings at this point
         """
-        point = StrokePoint(x, y, sensor_data.copy())
-        self.points.append(point)
+        n = self.count
+        if n == len(self.xy):
+            self._grow()
+        
+        self.xy[n] = (x, y)
+        self.sensors[n] = [getattr(sensor_data, name) for name in SENSOR_FIELDS]
+        self.timestamps[n] = sensor_data.timestamp
+        self.count = n + 1
+    
+    def add_points(self, xy: np.ndarray, sensors: np.ndarray, timestamp: float):
+        """
+        Add several points to stroke at once.
+        
+        Args:
+            xy: Array of shape (N, 2) of normalized coordinates (0-1)
+            sensors: Array of shape (N, len(SENSOR_FIELDS)) of sensor
+                     readings, in SENSOR_FIELDS column order
+            timestamp: Absolute time of all the points
+        """
+        n = self.count
+        end = n + len(xy)
+        while end > len(self.xy):
+            self._grow()
+        
+        self.xy[n:end] = xy
+        self.sensors[n:end] = sensors
+        self.timestamps[n:end] = timestamp
+        self.count = end
+    
+    def _grow(self):
+        """Double the point capacity, keeping existing rows."""
+        n = self.count
+        capacity = max(_INITIAL_CAPACITY, 2 * len(self.xy))
+        
+        xy = np.empty((capacity, 2), dtype=self.xy.dtype)
+        xy[:n] = self.xy[:n]
+        sensors = np.empty((capacity, self.sensors.shape[1]), dtype=self.sensors.dtype)
+        sensors[:n] = self.sensors[:n]
+        timestamps = np.empty(capacity, dtype=self.timestamps.dtype)
+        timestamps[:n] = self.timestamps[:n]
+        
+        self.xy = xy
+        self.sensors = sensors
+        self.timestamps = timestamps
+    
+    @property
+    def points(self) -> List[StrokePoint]:
+        """
+        Points of the stroke as StrokePoint objects.
+        
+        Built on demand from the point arrays; modifying the returned
+        objects does not modify the stroke.
+        """
+        n = self.count
+        return [
+            StrokePoint(x, y, SensorData(*readings, timestamp=timestamp))
+            for (x, y), readings, timestamp in zip(
+                self.xy[:n].tolist(),
+                self.sensors[:n].tolist(),
+                self.timestamps[:n].tolist()
+            )
+        ]
     
     def get_num_points(self) -> int:
         """Get number of points in stroke."""
-        return len(self.points)
+        return self.count
     
     def get_bounds(self) -> Tuple[float, float, float, float]:
         """
@@ -66,15 +190,15 @@ class BrushStroke:
         Returns:
             Tuple of (min_x, min_y, max_x, max_y)
         """
-        if not self.points:
+        if self.count == 0:
             return (0, 0, 0, 0)
         
-        xs = [p.x for p in self.points]
-        ys = [p.y for p in self.points]
+        xy = self.xy[:self.count]
+        min_x, min_y = xy.min(axis=0).tolist()
+        max_x, max_y = xy.max(axis=0).tolist()
         
-        return (min(xs), min(ys), max(xs), max(ys))
+        return (min_x, min_y, max_x, max_y)
     
     def clear(self):
         """Clear all points from stroke."""
-        self.points.clear()
-
+        self.count = 0
@@ -4,6 +4,7 @@ Canvas model for frame-based brush stroke storage.
 Manages brush strokes across multiple frames.
 """
 
+from bisect import bisect_left, insort
 from typing import Dict, List, Optional
 from brush_studio.models.brush_stroke import BrushStroke
 
@@ -20,6 +21,8 @@ class Canvas:
         """Initialize canvas."""
         self.strokes_by_frame: Dict[int, List[BrushStroke]] = {}
         self.current_stroke: Optional[BrushStroke] = None
+        # Keys of strokes_by_frame kept in sorted order
+        self._sorted_frames: List[int] = []
     
     def start_stroke(
         self, 
@@ -67,16 +70,31 @@ class Canvas:
         if self.current_stroke is None:
             return
         
-        frame = self.current_stroke.frame
-        if frame not in self.strokes_by_frame:
-            self.strokes_by_frame[frame] = []
+        strokes = self._frame_strokes(self.current_stroke.frame)
         
         # Only add if stroke has points
         if self.current_stroke.get_num_points() > 0:
-            self.strokes_by_frame[frame].append(self.current_stroke)
+            strokes.append(self.current_stroke)
         
         self.current_stroke = None
     
+    def add_stroke(self, stroke: BrushStroke):
+        """
+        Add a finished stroke to its frame.
+        
+        Args:
+            stroke: Stroke to add (stored under stroke.frame)
+        """
+        self._frame_strokes(stroke.frame).append(stroke)
+    
+    def _frame_strokes(self, frame: int) -> List[BrushStroke]:
+        """Get the stroke list for a frame, creating it if needed."""
+        strokes = self.strokes_by_frame.get(frame)
+        if strokes is None:
+            strokes = self.strokes_by_frame[frame] = []
+            insort(self._sorted_frames, frame)
+        return strokes
+    
     def get_strokes(self, frame: int) -> List[BrushStroke]:
         """
         Get all strokes for a frame.
@@ -99,7 +117,7 @@ class Canvas:
         Returns:
             True if frame has strokes
         """
-        return frame in self.strokes_by_frame and len(self.strokes_by_frame[frame]) > 0
+        return bool(self.strokes_by_frame.get(frame))
     
     def clear_frame(self, frame: int):
         """
@@ -110,10 +128,12 @@ class Canvas:
         """
         if frame in self.strokes_by_frame:
             del self.strokes_by_frame[frame]
+            del self._sorted_frames[bisect_left(self._sorted_frames, frame)]
     
     def clear_all(self):
         """Clear all strokes from all frames."""
         self.strokes_by_frame.clear()
+        self._sorted_frames.clear()
         self.current_stroke = None
     
     def get_all_frames(self) -> List[int]:
@@ -123,5 +143,5 @@ class Canvas:
         Returns:
             Sorted list of frame numbers
         """
-        return sorted(self.strokes_by_frame.keys())
+        return list(self._sorted_frames)
 
@@ -4,11 +4,15 @@ Sensor data container for brush dynamics.
 Stores all sensor readings at a point in time during a brush stroke.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+import sys
 import time as time_module
 
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class SensorData:
     """
     Container for all sensor readings at a point in time.
@@ -37,16 +41,22 @@ class SensorData:
     
     def copy(self) -> 'SensorData':
         """Create a copy of this sensor data."""
-        return SensorData(
-            pressure=self.pressure,
-            tilt_x=self.tilt_x,
-            tilt_y=self.tilt_y,
-            rotation=self.rotation,
-            speed=self.speed,
-            distance=self.distance,
-            time=self.time,
-            x=self.x,
-            y=self.y,
-            timestamp=self.timestamp
-        )
+        # Assign attributes directly rather than re-running __init__ with
+        # ten keyword arguments
+        new = object.__new__(SensorData)
+        new.pressure = self.pressure
+        new.tilt_x = self.tilt_x
+        new.tilt_y = self.tilt_y
+        new.rotation = self.rotation
+        new.speed = self.speed
+        new.distance = self.distance
+        new.time = self.time
+        new.x = self.x
+        new.y = self.y
+        new.timestamp = self.timestamp
+        return new
+
 
+# Sensor reading names in field order, excluding the timestamp
+# (column order of BrushStroke.sensors)
+SENSOR_FIELDS = tuple(f.name for f in fields(SensorData) if f.name != 'timestamp')
@@ -1,22 +1,32 @@
 """
-Canvas persistence - save/load FBO textures as PNG files.
+Canvas persistence - save/load FBO textures as raw NumPy arrays.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
+import os
 import numpy as np
 
-try:
-    from PIL import Image
-except ImportError:
-    Image = None  # PIL not available
+
+# Worker threads used to delete frame files in clear_all
+_CLEAR_WORKERS = 8
+
+# Frame file suffixes removed by clear_all: the current .npy format and
+# .png files left over from the previous 8-bit PNG format
+_FRAME_SUFFIXES = (".npy", ".png")
+
+# Parent directory of all session storage directories
+_STORAGE_ROOT = Path.home() / ".rv" / "BrushStudio"
 
 
 class CanvasStorage:
     """
-    Saves and loads canvas FBO textures as PNG files.
+    Saves and loads canvas FBO textures as .npy files.
     
-    Stores per-frame canvas data in user's home directory.
+    Stores per-frame canvas data in user's home directory. Pixels are
+    written as RGBA float16, half the size of the float32 FBO readback and
+    well beyond 8-bit precision, with no image encode/decode.
     """
     
     def __init__(self, session_id: str = "default"):
@@ -27,72 +37,69 @@ class CanvasStorage:
             session_id: Unique session identifier
         """
         self.session_id = session_id
-        self.storage_dir = Path.home() / ".rv" / "BrushStudio" / session_id
+        self.storage_dir = _STORAGE_ROOT / session_id
         self.storage_dir.mkdir(parents=True, exist_ok=True)
     
+    def _frame_path(self, frame: int) -> Path:
+        """Get file path for a frame's canvas data."""
+        return self.storage_dir / f"frame_{frame:06d}.npy"
+    
     def save_frame(self, frame: int, pixel_data: np.ndarray):
         """
-        Save frame canvas to PNG.
+        Save frame canvas to disk.
         
         Args:
             frame: Frame number
             pixel_data: RGBA float array (height, width, 4)
         """
-        if Image is None:
-            print("Warning: PIL not available, cannot save canvas")
-            return
-        
-        # Convert float [0-1] to uint8 [0-255]
-        pixel_data_uint8 = (pixel_data * 255).astype(np.uint8)
-        
-        # Create PIL image
-        img = Image.fromarray(pixel_data_uint8, mode='RGBA')
-        
-        # Save to PNG
-        filepath = self.storage_dir / f"frame_{frame:06d}.png"
-        img.save(filepath, 'PNG')
+        np.save(self._frame_path(frame), pixel_data.astype(np.float16, copy=False))
     
-    def load_frame(self, frame: int) -> Optional[np.ndarray]:
+    def load_frame(self, frame: int, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
-        Load frame canvas from PNG.
+        Load frame canvas from disk.
         
         Args:
             frame: Frame number
+            out: Optional preallocated float32 (height, width, 4) array to
+                 load into, so repeated loads reuse one buffer
         
         Returns:
-            RGBA float array or None if not found
+            RGBA float32 array (out, if given) or None if not found
         """
-        if Image is None:
-            return None
-        
-        filepath = self.storage_dir / f"frame_{frame:06d}.png"
+        filepath = self._frame_path(frame)
         if not filepath.exists():
             return None
         
-        # Load PNG
-        img = Image.open(filepath)
-        
-        # Convert to numpy array
-        pixel_data_uint8 = np.array(img)
+        # Promote back to float32 for the GL_FLOAT texture upload, reading
+        # the float16 file through a memory map so it is converted in one pass
+        data = np.load(filepath, mmap_mode='r')
+        if out is None:
+            return np.array(data, dtype=np.float32)
         
-        # Convert uint8 [0-255] to float [0-1]
-        pixel_data = pixel_data_uint8.astype(np.float32) / 255.0
-        
-        return pixel_data
+        np.copyto(out, data)
+        return out
     
     def has_frame(self, frame: int) -> bool:
         """Check if frame has saved data."""
-        filepath = self.storage_dir / f"frame_{frame:06d}.png"
-        return filepath.exists()
+        return self._frame_path(frame).exists()
     
     def delete_frame(self, frame: int):
         """Delete saved frame data."""
-        filepath = self.storage_dir / f"frame_{frame:06d}.png"
+        filepath = self._frame_path(frame)
         if filepath.exists():
             filepath.unlink()
     
     def clear_all(self):
-        """Delete all saved frames."""
-        for png_file in self.storage_dir.glob("frame_*.png"):
-            png_file.unlink()
+        """Delete all saved frames, including frames in the previous format."""
+        with os.scandir(self.storage_dir) as entries:
+            paths = [
+                entry.path for entry in entries
+                if entry.name.startswith("frame_") and entry.name.endswith(_FRAME_SUFFIXES)
+            ]
+        if not paths:
+            return
+        
+        # Unlinking is syscall-bound, overlap it across a few threads
+        with ThreadPoolExecutor(max_workers=_CLEAR_WORKERS) as executor:
+            list(executor.map(os.unlink, paths))
 
@@ -4,9 +4,13 @@ Brush preset manager.
 Loads, saves, and manages brush presets.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
-from brush_studio.models.brush_preset import BrushPreset
+from brush_studio.models.brush_preset import BrushPreset, read_preset_json
+
+
+# Parsed preset files shared by all managers: path -> (mtime, data)
+_preset_data_cache: Dict[str, Tuple[float, dict]] = {}
 
 
 class PresetManager:
@@ -31,11 +35,33 @@ class PresetManager:
         
         for json_file in self.preset_dir.glob("*.json"):
             try:
-                preset = BrushPreset.from_json(str(json_file))
+                preset = BrushPreset.from_dict(self._read_preset_data(str(json_file)))
                 self.presets[preset.name] = preset
             except Exception as e:
                 print(f"Warning: Failed to load preset {json_file}: {e}")
     
+    def _read_preset_data(self, filepath: str) -> dict:
+        """
+        Read preset data, reusing the parsed file if it is unchanged.
+        
+        Each manager still gets its own BrushPreset instances built from
+        the cached data, since presets are modified by the UI.
+        
+        Args:
+            filepath: Path to preset JSON file
+        
+        Returns:
+            Parsed preset dictionary
+        """
+        mtime = Path(filepath).stat().st_mtime
+        cached = _preset_data_cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        data = read_preset_json(filepath)
+        _preset_data_cache[filepath] = (mtime, data)
+        return data
+    
     def get_preset(self, name: str) -> Optional[BrushPreset]:
         """
         Get preset by name.
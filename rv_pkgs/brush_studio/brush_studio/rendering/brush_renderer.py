@@ -5,7 +5,7 @@ Coordinates FBOManager, ShaderManager, and brush textures to render
 pressure-sensitive brush strokes to GPU framebuffers.
 """
 
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 import numpy as np
 from OpenGL.GL import *
 
@@ -14,12 +14,60 @@ try:
 except ImportError:
     rvc = None
 
-from brush_studio.rendering.fbo_manager import FBOManager, FBO
+from brush_studio.rendering.fbo_manager import FBOManager, FBO, invalidate_framebuffer_binding
 from brush_studio.rendering.shader_manager import ShaderManager
 from brush_studio.rendering.brush_textures import BrushTextureGenerator
+from brush_studio.rendering.stream_buffer import StreamBuffer
 from brush_studio.utils.coordinate_transform import itview_to_screen
 
 
+# Corner offsets of the brush stamp quad (triangle strip order)
+_STAMP_CORNERS = np.array([
+    -0.5, -0.5,
+    0.5, -0.5,
+    -0.5, 0.5,
+    0.5, 0.5,
+], dtype=np.float32)
+
+# Stamp instance layout. The center stays float32 for sub-pixel placement
+# on large images; size and opacity are half floats and the atlas
+# rectangle is normalized 16-bit integers.
+_STAMP_INSTANCE_DTYPE = np.dtype([
+    ('center', np.float32, 2),
+    ('size', np.float16),
+    ('opacity', np.float16),
+    ('uv_rect', np.uint16, 4),
+])
+
+# Bytes per stamp instance
+_STAMP_INSTANCE_BYTES = _STAMP_INSTANCE_DTYPE.itemsize
+
+# Per-instance vertex attributes as (location, components, type, normalized,
+# field): brush_center, brush_size, brush_opacity, brush_uv_rect
+_STAMP_INSTANCE_ATTRIBUTES = (
+    (1, 2, GL_FLOAT, GL_FALSE, 'center'),
+    (2, 1, GL_HALF_FLOAT, GL_FALSE, 'size'),
+    (3, 1, GL_HALF_FLOAT, GL_FALSE, 'opacity'),
+    (4, 4, GL_UNSIGNED_SHORT, GL_TRUE, 'uv_rect'),
+)
+
+# Scale of normalized 16-bit integer attributes
+_UNORM16_MAX = 65535
+
+# Vertex buffer binding index of the instance stream (separate attribute format)
+_STAMP_INSTANCE_BINDING = 1
+
+# Initial number of queued stamp rows allocated (grows by doubling)
+_STAMP_QUEUE_CAPACITY = 1024
+
+# Brush texture atlas layout: grid of square tiles, one per texture type
+_ATLAS_TILE_SIZE = 256
+_ATLAS_GRID = 4
+
+# Atlas rectangle used by stamps without a brush texture
+_NO_TEXTURE_UV_RECT = (0.0, 0.0, 1.0, 1.0)
+
+
 class BrushRenderer:
     """
     Main rendering engine for brush strokes.
@@ -37,6 +85,18 @@ class BrushRenderer:
         self.brush_stamp_program: Optional[int] = None
         self.composite_program: Optional[int] = None
         
+        # Brush stamp uniform locations (resolved once the program is compiled)
+        self._loc_projection: int = -1
+        self._loc_brush_color: int = -1
+        self._loc_hardness: int = -1
+        self._loc_use_texture: int = -1
+        self._loc_brush_texture: int = -1
+        
+        # Composite uniform locations
+        self._loc_composite_projection: int = -1
+        self._loc_canvas_texture: int = -1
+        self._loc_global_opacity: int = -1
+        
         # Current state
         self.source_name: Optional[str] = None
         self.geometry: Optional[List] = None
@@ -44,41 +104,100 @@ class BrushRenderer:
         self.image_width: int = 1920
         self.image_height: int = 1080
         
-        # Brush textures (lazy initialization)
-        self.brush_textures: dict = {}
+        # Brush texture atlas (lazy initialization) and tile rectangle per type
+        self.brush_atlas: Optional[int] = None
+        self.brush_atlas_uvs: Dict[str, Tuple[float, float, float, float]] = {}
         
-        # VBO for quad rendering
+        # VBO for quad rendering (screen-space canvas quad)
         self.quad_vbo: Optional[int] = None
         self.quad_vao: Optional[int] = None
+        self._quad_geometry_key: Optional[Tuple] = None  # Geometry the quad was built for
+        
+        # Instanced brush stamps: static corner VBO plus streaming instance VBO
+        self.stamp_corner_vbo: Optional[int] = None
+        self.stamp_stream: Optional[StreamBuffer] = None
+        self.stamp_vao: Optional[int] = None
+        self._stamp_vertex_binding: bool = False  # Separate attribute format available
+        self._direct_state_access: bool = False  # GL 4.5 DSA available
         
         # Current stroke state
         self.is_drawing: bool = False
         self.current_preset = None
+        self._active_use_texture: bool = False
+        self._active_uv_rect: Tuple[int, int, int, int] = (0, 0, _UNORM16_MAX, _UNORM16_MAX)
+        
+        # Stamps queued since the last flush, drawn with a single instanced
+        # draw call. All queued stamps share frame, color, hardness and
+        # whether they are textured; each carries its own atlas tile. One
+        # instance row per stamp, of which the first _stamp_count are queued.
+        self._stamp_instances = np.empty(_STAMP_QUEUE_CAPACITY, dtype=_STAMP_INSTANCE_DTYPE)
+        self._stamp_count: int = 0
+        self._stamp_state: Optional[Tuple] = None
+        
+        # GL state set by this renderer during a drawing pass. Only valid
+        # between _begin_gl_state and _end_gl_state, as RV changes GL state
+        # between our calls.
+        self._gl_state: Dict[str, object] = {}
     
     def initialize_shaders(self):
         """Initialize shader programs."""
+        # Compile everything in one go, off the first stroke's path
+        if self.brush_stamp_program is None or self.composite_program is None:
+            self.shader_manager.precompile((
+                ("brush_stamp.vert", "brush_stamp.frag", "brush_stamp"),
+                ("composite.vert", "composite.frag", "composite"),
+            ))
+        
         if self.brush_stamp_program is None:
             self.brush_stamp_program = self.shader_manager.compile_shader_from_file(
                 "brush_stamp.vert",
                 "brush_stamp.frag",
                 "brush_stamp"
             )
-        
-        # Note: composite shader not needed for initial implementation
-        # (we'll render FBO texture directly)
+            
+            get_location = self.shader_manager.get_uniform_location
+            program = self.brush_stamp_program
+            self._loc_projection = get_location(program, "projection")
+            self._loc_brush_color = get_location(program, "brush_color")
+            self._loc_hardness = get_location(program, "hardness")
+            self._loc_use_texture = get_location(program, "use_texture")
+            self._loc_brush_texture = get_location(program, "brush_texture")
+            
+            # Stamps always use the 0-1 normalized projection, so upload it once
+            projection = self._create_ortho_matrix(0, 1, 0, 1, -1, 1)
+            self.shader_manager.invalidate_program()
+            self.shader_manager.use_program(program)
+            self.shader_manager.set_uniform_matrix4_loc(self._loc_projection, projection)
+            self.shader_manager.use_program(0)
+        
+        if self.composite_program is None:
+            self.composite_program = self.shader_manager.compile_shader_from_file(
+                "composite.vert",
+                "composite.frag",
+                "composite"
+            )
+            
+            get_location = self.shader_manager.get_uniform_location
+            program = self.composite_program
+            self._loc_composite_projection = get_location(program, "projection")
+            self._loc_canvas_texture = get_location(program, "canvas_texture")
+            self._loc_global_opacity = get_location(program, "global_opacity")
     
     def initialize_quad_geometry(self):
         """Initialize quad geometry for rendering."""
         if self.quad_vao is not None:
             return  # Already initialized
         
-        # Quad vertices (covering full normalized space 0-1)
+        # Modify buffers and bind textures without bind-to-edit where possible
+        self._direct_state_access = bool(glBindTextureUnit)
+        
+        # Canvas quad vertices (triangle strip), positions set by render_frame
         vertices = np.array([
-            # Position (x, y)
-            0.0, 0.0,
-            1.0, 0.0,
-            1.0, 1.0,
-            0.0, 1.0,
+            # Position (x, y), texture coordinates (u, v)
+            0.0, 0.0, 0.0, 0.0,
+            1.0, 0.0, 1.0, 0.0,
+            0.0, 1.0, 0.0, 1.0,
+            1.0, 1.0, 1.0, 1.0,
         ], dtype=np.float32)
         
         # Create VAO and VBO
@@ -87,13 +206,50 @@ class BrushRenderer:
         
         glBindVertexArray(self.quad_vao)
         glBindBuffer(GL_ARRAY_BUFFER, self.quad_vbo)
-        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_DYNAMIC_DRAW)
         
-        # Position attribute
+        # Position and texture coordinate attributes
         glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 4 * 4, ctypes.c_void_p(0))
+        glEnableVertexAttribArray(1)
+        glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, 4 * 4, ctypes.c_void_p(2 * 4))
+        
+        # Stamp VAO: per-vertex quad corners, per-instance stamp parameters
+        # streamed each flush
+        self.stamp_vao = glGenVertexArrays(1)
+        self.stamp_corner_vbo = glGenBuffers(1)
+        self.stamp_stream = StreamBuffer()
+        
+        glBindVertexArray(self.stamp_vao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.stamp_corner_vbo)
+        glBufferData(GL_ARRAY_BUFFER, _STAMP_CORNERS.nbytes, _STAMP_CORNERS, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(0)  # position
         glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 2 * 4, ctypes.c_void_p(0))
         
+        stride = _STAMP_INSTANCE_BYTES
+        self._stamp_vertex_binding = bool(glVertexAttribFormat)
+        if self._stamp_vertex_binding:
+            # Separate attribute format (GL 4.3): the layout is set once and
+            # each flush only moves the stream binding to its data
+            for location, components, gl_type, normalized, name in _STAMP_INSTANCE_ATTRIBUTES:
+                offset = _STAMP_INSTANCE_DTYPE.fields[name][1]
+                glEnableVertexAttribArray(location)
+                glVertexAttribFormat(location, components, gl_type, normalized, offset)
+                glVertexAttribBinding(location, _STAMP_INSTANCE_BINDING)
+            glVertexBindingDivisor(_STAMP_INSTANCE_BINDING, 1)
+            glBindVertexBuffer(_STAMP_INSTANCE_BINDING, self.stamp_stream.buffer_id, 0, stride)
+        else:
+            glBindBuffer(GL_ARRAY_BUFFER, self.stamp_stream.buffer_id)
+            for location, components, gl_type, normalized, name in _STAMP_INSTANCE_ATTRIBUTES:
+                offset = _STAMP_INSTANCE_DTYPE.fields[name][1]
+                glEnableVertexAttribArray(location)
+                glVertexAttribPointer(
+                    location, components, gl_type, normalized, stride, ctypes.c_void_p(offset)
+                )
+                glVertexAttribDivisor(location, 1)
+        
         glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
     
     def set_source_transform(self, source_name: str):
         """
@@ -115,6 +271,9 @@ class BrushRenderer:
                     self.image_height = info[1]
             except Exception:
                 pass
+        
+        # Rebuild the canvas quad on the next render
+        self._quad_geometry_key = None
     
     def begin_stroke(self, preset, frame: int):
         """
@@ -132,54 +291,106 @@ class BrushRenderer:
         self.initialize_shaders()
         self.initialize_quad_geometry()
         
-        # Get or create FBO for this frame
-        fbo = self.fbo_manager.get_or_create_fbo(
-            frame,
-            self.image_width,
-            self.image_height
-        )
+        # Resolve the brush tip once for all stamps of the stroke
+        texture_type = getattr(preset, 'texture_type', None)
+        self._active_use_texture = bool(texture_type)
+        if texture_type:
+            _, uv_rect = self.get_brush_texture(texture_type)
+        else:
+            uv_rect = _NO_TEXTURE_UV_RECT
+        self._active_uv_rect = tuple(round(value * _UNORM16_MAX) for value in uv_rect)
+        
+        # The frame's FBO is created by the first stamp flush, so strokes
+        # that never stamp do not allocate a full-size canvas
     
-    def get_brush_texture(self, texture_type: str) -> int:
+    def get_brush_texture(self, texture_type: str) -> Tuple[int, Tuple[float, float, float, float]]:
         """
-        Get or create brush texture by type.
+        Get brush texture by type, building the brush atlas on first use.
+        
+        All brush textures share one atlas texture, so stamps of different
+        types can be drawn together.
         
         Args:
             texture_type: Type of texture (e.g., 'soft_circle', 'star')
         
         Returns:
-            OpenGL texture ID
+            Tuple of (atlas texture ID, (u0, v0, u1, v1) tile rectangle)
+        """
+        if self.brush_atlas is None:
+            self._create_brush_atlas()
+        
+        # Fallback to soft_circle for unknown types
+        uv_rect = self.brush_atlas_uvs.get(texture_type)
+        if uv_rect is None:
+            uv_rect = self.brush_atlas_uvs['soft_circle']
+        
+        return self.brush_atlas, uv_rect
+    
+    def _create_brush_atlas(self):
+        """
+        Generate all brush textures and upload them as one atlas.
+        
+        Textures are generated straight into a mapped pixel unpack buffer,
+        so the upload reads from driver memory without a staging copy.
         """
-        # Check cache
-        if texture_type in self.brush_textures:
-            return self.brush_textures[texture_type]
-        
-        # Map texture type to generator method
-        texture_generators = {
-            'soft_circle': self.texture_generator.create_soft_circle,
-            'hard_circle': self.texture_generator.create_hard_circle,
-            'noise': self.texture_generator.create_noise_texture,
-            'square_hard': self.texture_generator.create_square_hard,
-            'square_soft': self.texture_generator.create_square_soft,
-            'triangle': self.texture_generator.create_triangle,
-            'star': self.texture_generator.create_star,
-            'splatter': self.texture_generator.create_splatter,
-            'stipple': self.texture_generator.create_stipple,
-            'grainy': self.texture_generator.create_grainy,
-            'scratchy': self.texture_generator.create_scratchy,
-            'diamond': self.texture_generator.create_diamond,
-        }
-        
-        # Get generator (with fallback to soft_circle)
-        if texture_type not in texture_generators:
-            texture_type = 'soft_circle'  # Fallback
-        
-        generator_func = texture_generators[texture_type]
-        texture_id, _ = generator_func()
-        
-        # Cache texture
-        self.brush_textures[texture_type] = texture_id
-        
-        return texture_id
+        atlas_size = _ATLAS_GRID * _ATLAS_TILE_SIZE
+        nbytes = atlas_size * atlas_size * np.dtype(np.uint16).itemsize
+        
+        upload_buffer = glGenBuffers(1)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, upload_buffer)
+        glBufferData(GL_PIXEL_UNPACK_BUFFER, nbytes, None, GL_STREAM_DRAW)
+        pointer = glMapBufferRange(
+            GL_PIXEL_UNPACK_BUFFER, 0, nbytes,
+            GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT
+        )
+        address = ctypes.cast(pointer, ctypes.c_void_p).value
+        data = np.ctypeslib.as_array(
+            (ctypes.c_uint16 * (atlas_size * atlas_size)).from_address(address)
+        ).reshape(atlas_size, atlas_size)
+        
+        # Mapped memory is uninitialized; unused tiles must stay empty
+        data.fill(0)
+        origins = self.texture_generator.build_all_into(data, _ATLAS_TILE_SIZE)
+        del data
+        glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+        
+        # Inset by half a texel so linear filtering stays inside each tile
+        inset = 0.5
+        for texture_type, (x, y) in origins.items():
+            self.brush_atlas_uvs[texture_type] = (
+                (x + inset) / atlas_size,
+                (y + inset) / atlas_size,
+                (x + _ATLAS_TILE_SIZE - inset) / atlas_size,
+                (y + _ATLAS_TILE_SIZE - inset) / atlas_size
+            )
+        
+        self.brush_atlas = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.brush_atlas)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        
+        # Immutable storage when available; the atlas is never resized
+        if glTexStorage2D:
+            glTexStorage2D(GL_TEXTURE_2D, 1, GL_R16, atlas_size, atlas_size)
+            glTexSubImage2D(
+                GL_TEXTURE_2D, 0, 0, 0,
+                atlas_size, atlas_size,
+                GL_RED, GL_UNSIGNED_SHORT, None
+            )
+        else:
+            glTexImage2D(
+                GL_TEXTURE_2D, 0, GL_R16,
+                atlas_size, atlas_size, 0,
+                GL_RED, GL_UNSIGNED_SHORT, None
+            )
+        
+        glBindTexture(GL_TEXTURE_2D, 0)
+        
+        # The upload has been queued from the buffer, which can go now
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+        glDeleteBuffers(1, [upload_buffer])
     
     def stamp_brush(
         self,
@@ -194,6 +405,10 @@ class BrushRenderer:
         """
         Stamp brush at given location to FBO.
         
+        Stamps are queued and drawn in batches; the queue is flushed when
+        the stamp state changes, at the end of the stroke and before the
+        frame is rendered.
+        
         Args:
             x, y: Position in normalized itview space (0-1)
             size: Brush size in pixels
@@ -202,6 +417,127 @@ class BrushRenderer:
             hardness: Edge hardness (0-1)
             frame: Frame number
         """
+        # Texture type is per stamp, so stamps of different types share a batch
+        state = (frame, tuple(color), hardness, self._active_use_texture)
+        if state != self._stamp_state:
+            self._flush_stamps()
+            self._stamp_state = state
+        
+        # Convert size from pixels to normalized space
+        size_norm = size / self.image_width
+        
+        # One instance per stamp; the vertex shader expands it to a quad
+        n = self._stamp_count
+        if n == len(self._stamp_instances):
+            self._grow_stamp_queue()
+        
+        self._stamp_instances[n] = ((x, y), size_norm, opacity, self._active_uv_rect)
+        self._stamp_count = n + 1
+    
+    def stamp_brushes(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        sizes: np.ndarray,
+        opacities: np.ndarray,
+        color: Tuple[float, float, float, float],
+        hardness: float,
+        frame: int
+    ):
+        """
+        Stamp brush at several locations, as stamp_brush does for one.
+        
+        Args:
+            xs, ys: Positions in normalized itview space (0-1)
+            sizes: Brush sizes in pixels
+            opacities: Brush opacities (0-1)
+            color: RGBA color tuple
+            hardness: Edge hardness (0-1)
+            frame: Frame number
+        """
+        state = (frame, tuple(color), hardness, self._active_use_texture)
+        if state != self._stamp_state:
+            self._flush_stamps()
+            self._stamp_state = state
+        
+        n = self._stamp_count
+        end = n + len(xs)
+        while end > len(self._stamp_instances):
+            self._grow_stamp_queue()
+        
+        instances = self._stamp_instances[n:end]
+        instances['center'][:, 0] = xs
+        instances['center'][:, 1] = ys
+        instances['size'] = np.asarray(sizes) / self.image_width
+        instances['opacity'] = opacities
+        instances['uv_rect'] = self._active_uv_rect
+        self._stamp_count = end
+    
+    def _grow_stamp_queue(self):
+        """Double the stamp queue capacity, keeping queued rows."""
+        n = self._stamp_count
+        instances = np.empty(2 * len(self._stamp_instances), dtype=_STAMP_INSTANCE_DTYPE)
+        instances[:n] = self._stamp_instances[:n]
+        self._stamp_instances = instances
+    
+    def _begin_gl_state(self):
+        """Start a drawing pass, assuming nothing about the current GL state."""
+        self._gl_state = {'blend': None, 'bound_texture_2d': None}
+        self.shader_manager.invalidate_program()
+        invalidate_framebuffer_binding()
+    
+    def _end_gl_state(self):
+        """End a drawing pass, resetting the GL state it changed."""
+        if self._gl_state.get('bound_texture_2d'):
+            if self._direct_state_access:
+                glBindTextureUnit(0, 0)
+            else:
+                glBindTexture(GL_TEXTURE_2D, 0)
+        self.shader_manager.use_program(0)
+        if self._gl_state.get('blend'):
+            glDisable(GL_BLEND)
+        self._gl_state = {}
+    
+    def _enable_blend(self):
+        """Enable alpha blending unless this pass already did."""
+        if self._gl_state['blend']:
+            return
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        self._gl_state['blend'] = True
+    
+    def _bind_texture_2d(self, texture: int):
+        """Bind texture to unit 0 unless it is already bound there."""
+        if self._gl_state['bound_texture_2d'] == texture:
+            return
+        if self._direct_state_access:
+            glBindTextureUnit(0, texture)
+        else:
+            glActiveTexture(GL_TEXTURE0)
+            glBindTexture(GL_TEXTURE_2D, texture)
+        self._gl_state['bound_texture_2d'] = texture
+    
+    def _flush_stamps(self):
+        """Draw all queued stamps to their frame's FBO in one instanced draw."""
+        if not self._stamp_count:
+            return
+        
+        self._begin_gl_state()
+        self._draw_stamps()
+        self._end_gl_state()
+    
+    def _draw_stamps(self):
+        """Draw queued stamps within a drawing pass (see _flush_stamps)."""
+        if not self._stamp_count:
+            return
+        
+        frame, color, hardness, use_texture = self._stamp_state
+        
+        # Flushes can happen mid-render, so restore the caller's target.
+        # Read it first: creating or clearing FBOs below may rebind.
+        previous_fbo = glGetIntegerv(GL_DRAW_FRAMEBUFFER_BINDING)
+        previous_viewport = glGetIntegerv(GL_VIEWPORT)
+        
         # Get FBO for this frame
         fbo = self.fbo_manager.get_or_create_fbo(
             frame,
@@ -213,100 +549,70 @@ class BrushRenderer:
         fbo.bind()
         
         # Setup blending for accumulation
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        self._enable_blend()
         
         # Use brush stamp shader
         self.shader_manager.use_program(self.brush_stamp_program)
         
-        # Get and bind brush texture if current preset has one
-        if self.current_preset and hasattr(self.current_preset, 'texture_type'):
-            texture_id = self.get_brush_texture(self.current_preset.texture_type)
-            glActiveTexture(GL_TEXTURE0)
-            glBindTexture(GL_TEXTURE_2D, texture_id)
-            use_texture = 1
-        else:
-            use_texture = 0
-        
-        # Setup orthographic projection (0-1 normalized space)
-        projection = self._create_ortho_matrix(0, 1, 0, 1, -1, 1)
-        self.shader_manager.set_uniform_matrix4(
-            self.brush_stamp_program,
-            "projection",
-            projection
-        )
+        # Bind the brush atlas if the stamps are textured
+        if use_texture:
+            self._bind_texture_2d(self.brush_atlas)
         
-        # Set uniforms
-        self.shader_manager.set_uniform_vec4(
-            self.brush_stamp_program,
-            "brush_color",
-            color
-        )
-        self.shader_manager.set_uniform_float(
-            self.brush_stamp_program,
-            "hardness",
-            hardness
-        )
-        self.shader_manager.set_uniform_int(
-            self.brush_stamp_program,
-            "use_texture",
-            use_texture
-        )
+        # Set uniforms (the projection is set once in initialize_shaders)
+        self.shader_manager.set_uniform_vec4_loc(self._loc_brush_color, color)
+        self.shader_manager.set_uniform_float_loc(self._loc_hardness, hardness)
+        self.shader_manager.set_uniform_int_loc(self._loc_use_texture, int(use_texture))
         if use_texture:
-            self.shader_manager.set_uniform_int(
-                self.brush_stamp_program,
-                "brush_texture",
+            self.shader_manager.set_uniform_int_loc(
+                self._loc_brush_texture,
                 0  # Texture unit 0
             )
         
-        # Convert size from pixels to normalized space
-        size_norm = size / self.image_width
-        
-        # Create quad for brush stamp (centered at brush position)
-        vertices = np.array([
-            # Position (offset from center), brush_center, brush_size, brush_opacity
-            -0.5, -0.5, x, y, size_norm, opacity,
-            0.5, -0.5, x, y, size_norm, opacity,
-            0.5, 0.5, x, y, size_norm, opacity,
-            -0.5, 0.5, x, y, size_norm, opacity,
-        ], dtype=np.float32)
-        
-        # Create temporary VBO for this stamp
-        vbo = glGenBuffers(1)
-        vao = glGenVertexArrays(1)
-        
-        glBindVertexArray(vao)
-        glBindBuffer(GL_ARRAY_BUFFER, vbo)
-        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STREAM_DRAW)
+        instances = self._stamp_instances[:self._stamp_count]
+        
+        # Stream and draw all stamps, in as few chunks as the buffer allows.
+        # The stream offset is applied by rebinding the instance stream, or
+        # through the base instance without separate attribute format.
+        glBindVertexArray(self.stamp_vao)
+        chunk_stamps = (self.stamp_stream.segment_size - _STAMP_INSTANCE_BYTES) // _STAMP_INSTANCE_BYTES
+        for start in range(0, len(instances), chunk_stamps):
+            chunk = instances[start:start + chunk_stamps]
+            offset = self.stamp_stream.write(chunk, _STAMP_INSTANCE_BYTES)
+            if self._stamp_vertex_binding:
+                glBindVertexBuffer(
+                    _STAMP_INSTANCE_BINDING, self.stamp_stream.buffer_id,
+                    offset, _STAMP_INSTANCE_BYTES
+                )
+                glDrawArraysInstanced(GL_TRIANGLE_STRIP, 0, 4, len(chunk))
+            elif offset:
+                glDrawArraysInstancedBaseInstance(
+                    GL_TRIANGLE_STRIP, 0, 4, len(chunk), offset // _STAMP_INSTANCE_BYTES
+                )
+            else:
+                glDrawArraysInstanced(GL_TRIANGLE_STRIP, 0, 4, len(chunk))
         
-        # Setup vertex attributes
-        stride = 6 * 4  # 6 floats per vertex
-        glEnableVertexAttribArray(0)  # position
-        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(0))
-        glEnableVertexAttribArray(1)  # brush_center
-        glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(2 * 4))
-        glEnableVertexAttribArray(2)  # brush_size
-        glVertexAttribPointer(2, 1, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(4 * 4))
-        glEnableVertexAttribArray(3)  # brush_opacity
-        glVertexAttribPointer(3, 1, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(5 * 4))
-        
-        # Draw quad
-        glDrawArrays(GL_TRIANGLE_FAN, 0, 4)
-        
-        # Cleanup
         glBindVertexArray(0)
-        glDeleteBuffers(1, [vbo])
-        glDeleteVertexArrays(1, [vao])
-        
-        # Unbind FBO
-        fbo.unbind()
-        glDisable(GL_BLEND)
         
-        # Mark FBO as dirty
-        fbo.is_dirty = True
+        # Restore previous render target
+        glBindFramebuffer(GL_FRAMEBUFFER, previous_fbo)
+        glViewport(*previous_viewport)
+        invalidate_framebuffer_binding()
+        
+        # Grow the FBO's dirty rectangle by the stamps' bounds
+        radius = instances['size'].astype(np.float32)[:, None] * 0.5
+        low = (instances['center'] - radius).min(axis=0)
+        high = (instances['center'] + radius).max(axis=0)
+        x0 = min(max(int(np.floor(low[0] * fbo.width)), 0), fbo.width)
+        y0 = min(max(int(np.floor(low[1] * fbo.height)), 0), fbo.height)
+        x1 = max(min(int(np.ceil(high[0] * fbo.width)), fbo.width), x0)
+        y1 = max(min(int(np.ceil(high[1] * fbo.height)), fbo.height), y0)
+        fbo.mark_dirty((x0, y0, x1, y1))
+        
+        self._stamp_count = 0
     
     def end_stroke(self):
         """End current brush stroke."""
+        self._flush_stamps()
         self.is_drawing = False
         self.current_preset = None
     
@@ -320,48 +626,91 @@ class BrushRenderer:
         Args:
             frame: Frame number to render
         """
+        # Nothing to draw or composite, e.g. when playing frames without strokes
+        if not self._stamp_count and not self.fbo_manager.is_frame_dirty(frame):
+            return
+        
+        self._begin_gl_state()
+        
+        # Draw stamps queued since the last flush
+        self._draw_stamps()
+        self._render_canvas(frame)
+        
+        self._end_gl_state()
+    
+    def _render_canvas(self, frame: int):
+        """Composite the frame's FBO within a drawing pass (see render_frame)."""
         # Check if FBO exists for this frame
         fbo = self.fbo_manager.get_fbo(frame)
         if fbo is None or not fbo.is_dirty:
             return  # No strokes on this frame
         
-        # Setup OpenGL state
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        # Get geometry for coordinate transformation
+        if not self.geometry:
+            return
+        
+        self.initialize_shaders()
+        self.initialize_quad_geometry()
+        
+        # Composite only the canvas region that has been drawn to
+        x0, y0, x1, y1 = fbo.dirty_rect or (0, 0, fbo.width, fbo.height)
+        uv_rect = (x0 / fbo.width, y0 / fbo.height, x1 / fbo.width, y1 / fbo.height)
+        
+        # Corners only move on pan/zoom/rotate, so reuse them for the same geometry
+        geometry_key = (tuple(map(tuple, self.geometry)), uv_rect)
+        if geometry_key != self._quad_geometry_key:
+            self._update_quad_vertices(uv_rect)
+            self._quad_geometry_key = geometry_key
+        
+        # Setup OpenGL state (blending is usually still on from the stamps)
+        self._enable_blend()
         
         # Bind FBO texture
-        fbo.bind_texture(0)
+        self._bind_texture_2d(fbo.texture_id)
         
-        # Use simple texture rendering
-        # (We'll render the texture directly without shader for simplicity)
-        glEnable(GL_TEXTURE_2D)
+        # Screen-space projection matching the viewport
+        _, _, width, height = glGetIntegerv(GL_VIEWPORT)
+        projection = self._create_ortho_matrix(0, width, 0, height, -1, 1)
         
-        # Get geometry for coordinate transformation
-        if not self.geometry:
-            return
+        self.shader_manager.use_program(self.composite_program)
+        self.shader_manager.set_uniform_matrix4_loc(self._loc_composite_projection, projection)
+        self.shader_manager.set_uniform_int_loc(self._loc_canvas_texture, 0)
+        self.shader_manager.set_uniform_float_loc(self._loc_global_opacity, 1.0)
+        
+        # Render textured quad
+        glBindVertexArray(self.quad_vao)
+        glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
+        glBindVertexArray(0)
+    
+    def _update_quad_vertices(self, uv_rect: Tuple[float, float, float, float]):
+        """
+        Upload the canvas quad for a region of the canvas.
+        
+        Args:
+            uv_rect: Canvas region (u0, v0, u1, v1) in normalized itview space
+        """
+        u0, v0, u1, v1 = uv_rect
         
         # Calculate screen coordinates for quad corners
-        bl = itview_to_screen(self.geometry, 0, 0)  # Bottom-left
-        br = itview_to_screen(self.geometry, 1, 0)  # Bottom-right
-        tr = itview_to_screen(self.geometry, 1, 1)  # Top-right
-        tl = itview_to_screen(self.geometry, 0, 1)  # Top-left
+        bl = itview_to_screen(self.geometry, u0, v0)  # Bottom-left
+        br = itview_to_screen(self.geometry, u1, v0)  # Bottom-right
+        tr = itview_to_screen(self.geometry, u1, v1)  # Top-right
+        tl = itview_to_screen(self.geometry, u0, v1)  # Top-left
         
-        # Render textured quad
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 0)
-        glVertex2f(bl[0], bl[1])
-        glTexCoord2f(1, 0)
-        glVertex2f(br[0], br[1])
-        glTexCoord2f(1, 1)
-        glVertex2f(tr[0], tr[1])
-        glTexCoord2f(0, 1)
-        glVertex2f(tl[0], tl[1])
-        glEnd()
-        
-        # Cleanup
-        glDisable(GL_TEXTURE_2D)
-        fbo.unbind_texture()
-        glDisable(GL_BLEND)
+        vertices = np.array([
+            bl[0], bl[1], u0, v0,
+            br[0], br[1], u1, v0,
+            tl[0], tl[1], u0, v1,
+            tr[0], tr[1], u1, v1,
+        ], dtype=np.float32)
+        
+        if self._direct_state_access:
+            glNamedBufferSubData(self.quad_vbo, 0, vertices.nbytes, vertices)
+            return
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.quad_vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, vertices.nbytes, vertices)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
     
     def clear_frame(self, frame: int):
         """
@@ -370,6 +719,7 @@ class BrushRenderer:
         Args:
             frame: Frame number
         """
+        self._flush_stamps()
         self.fbo_manager.clear_frame(frame)
     
     def _create_ortho_matrix(
@@ -405,6 +755,9 @@ class BrushRenderer:
     
     def cleanup(self):
         """Cleanup OpenGL resources."""
+        self._stamp_count = 0
+        self._stamp_state = None
+        
         self.fbo_manager.destroy_all()
         self.shader_manager.cleanup()
         
@@ -415,4 +768,22 @@ class BrushRenderer:
         if self.quad_vbo is not None:
             glDeleteBuffers(1, [self.quad_vbo])
             self.quad_vbo = None
+            self._quad_geometry_key = None
+        
+        if self.stamp_vao is not None:
+            glDeleteVertexArrays(1, [self.stamp_vao])
+            self.stamp_vao = None
+        
+        if self.brush_atlas is not None:
+            glDeleteTextures([self.brush_atlas])
+            self.brush_atlas = None
+            self.brush_atlas_uvs.clear()
+        
+        if self.stamp_corner_vbo is not None:
+            glDeleteBuffers(1, [self.stamp_corner_vbo])
+            self.stamp_corner_vbo = None
+        
+        if self.stamp_stream is not None:
+            self.stamp_stream.destroy()
+            self.stamp_stream = None
 
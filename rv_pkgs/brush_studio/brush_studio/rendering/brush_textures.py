@@ -2,19 +2,486 @@
 Procedural brush texture generation.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os
 import numpy as np
-from typing import Tuple
+from typing import Dict, Tuple
 from OpenGL.GL import *
 
+try:
+    import numba
+except ImportError:
+    numba = None  # numba not available, generators use their numpy paths
+
+
+# Blur kernel of the grainy texture: a gaussian of sigma 0.5, truncated
+# at 4 sigma
+_GRAIN_BLUR_WEIGHTS = np.exp(-2.0 * np.arange(-2, 3) ** 2)
+_GRAIN_BLUR_WEIGHTS /= _GRAIN_BLUR_WEIGHTS.sum()
+
+# Brush tip texture types, in a stable order (e.g. for atlas tiles)
+BRUSH_TEXTURE_TYPES = (
+    'soft_circle',
+    'hard_circle',
+    'noise',
+    'square_hard',
+    'square_soft',
+    'triangle',
+    'star',
+    'splatter',
+    'stipple',
+    'grainy',
+    'scratchy',
+    'diamond',
+)
+
+
+# Largest value of a normalized 16-bit texel
+_UNORM16_MAX = 65535
+
+
+def _to_unorm16(data: np.ndarray) -> np.ndarray:
+    """
+    Quantize float alpha values to normalized 16-bit texels.
+    
+    Args:
+        data: Float alpha array in the 0-1 range
+    
+    Returns:
+        Uint16 array of the same shape
+    """
+    texels = np.clip(data, 0.0, 1.0) * _UNORM16_MAX
+    return np.rint(texels, out=texels).astype(np.uint16)
+
+
+def _upload_texture(data: np.ndarray, wrap: int = GL_CLAMP_TO_EDGE) -> int:
+    """
+    Upload single-channel float texture data to a new OpenGL texture.
+    
+    The texture is stored as GL_R16 (normalized 16-bit), which is ample
+    precision for an alpha mask at half the size of GL_R32F.
+    
+    Args:
+        data: Float32 alpha array of shape (size, size)
+        wrap: Texture wrap mode
+    
+    Returns:
+        OpenGL texture ID
+    """
+    size = data.shape[0]
+    
+    texture_id = glGenTextures(1)
+    glBindTexture(GL_TEXTURE_2D, texture_id)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, wrap)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, wrap)
+    
+    # Rows are tightly packed 16-bit texels, which for odd sizes breaks
+    # the default 4-byte row alignment
+    previous_alignment = glGetIntegerv(GL_UNPACK_ALIGNMENT)
+    glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+    glTexImage2D(
+        GL_TEXTURE_2D, 0, GL_R16,
+        size, size, 0,
+        GL_RED, GL_UNSIGNED_SHORT, _to_unorm16(data)
+    )
+    glPixelStorei(GL_UNPACK_ALIGNMENT, previous_alignment)
+    
+    glBindTexture(GL_TEXTURE_2D, 0)
+    
+    return texture_id
+
+
+def _coord_grid(size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get pixel coordinates for broadcasting over a square texture.
+    
+    Args:
+        size: Texture size in pixels (square)
+    
+    Returns:
+        Tuple of (y, x) integer arrays of shapes (size, 1) and (1, size)
+    """
+    y, x = np.ogrid[:size, :size]
+    return y, x
+
+
+def _box_filter(data: np.ndarray, radius: int) -> np.ndarray:
+    """
+    Average data over a (2 * radius + 1)-wide box along both axes.
+    
+    Each axis is a difference of running sums, so the cost does not grow
+    with the radius. Borders reflect (np.pad's 'symmetric' mode).
+    
+    Args:
+        data: 2D float32 array
+        radius: Box radius in pixels
+    
+    Returns:
+        Filtered float32 array
+    """
+    width = 2 * radius + 1
+    for _ in range(2):
+        # One extra leading sample so window i is sums[i + width] - sums[i]
+        padded = np.pad(data, ((0, 0), (radius + 1, radius)), mode='symmetric')
+        sums = np.cumsum(padded, axis=1, dtype=np.float64)
+        data = ((sums[:, width:] - sums[:, :-width]) / width).astype(np.float32).T
+    return np.ascontiguousarray(data)
+
+
+def _separable_filter(data: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Correlate data with a short 1D kernel along both axes.
+    
+    Borders reflect (np.pad's 'symmetric' mode).
+    
+    Args:
+        data: 2D float32 array
+        weights: 1D kernel of odd length
+    
+    Returns:
+        Filtered float32 array
+    """
+    reach = len(weights) // 2
+    for _ in range(2):
+        width = data.shape[1]
+        padded = np.pad(data, ((0, 0), (reach, reach)), mode='symmetric')
+        total = np.zeros(data.shape, dtype=np.float64)
+        for k, weight in enumerate(weights.tolist()):
+            total += weight * padded[:, k:k + width]
+        data = total.astype(np.float32).T
+    return np.ascontiguousarray(data)
+
+
+def _jit(function):
+    """Compile a pixel loop with numba when available."""
+    if numba is None:
+        return function
+    return numba.njit(cache=True)(function)
+
+
+def _composite_max(data: np.ndarray, stamps: np.ndarray, x0: np.ndarray, y0: np.ndarray):
+    """
+    Composite stamps into data, keeping the maximum per pixel.
+    
+    Stamp rectangles are clipped to the texture for all stamps at once;
+    only the per-stamp np.maximum over the clipped slices loops.
+    
+    Args:
+        data: Float32 alpha array to draw into
+        stamps: Alpha array of shape (N, height, width), or a single
+                (height, width) stamp shared by every position
+        x0, y0: Integer pixel positions of the stamps' top-left corners
+                (may be outside data)
+    """
+    height, width = stamps.shape[-2:]
+    
+    # Clip the stamps to the texture
+    sx0 = np.maximum(0, -x0)
+    sy0 = np.maximum(0, -y0)
+    sx1 = np.minimum(width, data.shape[1] - x0)
+    sy1 = np.minimum(height, data.shape[0] - y0)
+    visible = np.nonzero((sx1 > sx0) & (sy1 > sy0))[0]
+    
+    shared = stamps.ndim == 2
+    for i, x, y, u0, v0, u1, v1 in zip(
+        visible.tolist(),
+        x0[visible].tolist(), y0[visible].tolist(),
+        sx0[visible].tolist(), sy0[visible].tolist(),
+        sx1[visible].tolist(), sy1[visible].tolist()
+    ):
+        stamp = stamps if shared else stamps[i]
+        region = data[y + v0:y + v1, x + u0:x + u1]
+        np.maximum(region, stamp[v0:v1, u0:u1], out=region)
+
+
+def _rasterize_splatter(data, centers_x, centers_y, particle_sizes, intensities):
+    """
+    Draw soft round particles into data, keeping the maximum per pixel.
+    
+    All particle stamps are computed at once; only compositing them
+    loops over particles.
+    
+    Args:
+        data: Float32 alpha array to draw into
+        centers_x, centers_y: Integer particle centers in pixels
+        particle_sizes: Particle radii in pixels
+        intensities: Particle peak alpha values
+    """
+    extent = int(particle_sizes.max())
+    dy, dx = np.ogrid[-extent:extent + 1, -extent:extent + 1]
+    dist_from_center = np.sqrt(dx * dx + dy * dy)
+    
+    # One stamp per particle, with a linear falloff to its radius
+    sizes = particle_sizes[:, None, None]
+    stamps = np.where(
+        dist_from_center < sizes,
+        intensities[:, None, None] * (1.0 - dist_from_center / sizes),
+        0.0
+    )
+    
+    _composite_max(data, stamps, centers_x - extent, centers_y - extent)
+
+
+@_jit
+def _shade_grainy(noise, weights, center, radius, out):
+    """
+    Shade the grainy texture from its noise in compiled loops.
+    
+    Grain and circular falloff are computed per pixel, then blurred
+    vertically and horizontally, with no numpy temporaries in between.
+    Blur borders reflect, as in _separable_filter.
+    
+    Args:
+        noise: Float32 uniform noise of shape (size, size)
+        weights: Normalized 1D blur kernel of odd length
+        center: Center of the circular falloff in pixels
+        radius: Radius of the circular falloff in pixels
+        out: Float32 array of shape (size, size) to write into
+    """
+    size = noise.shape[0]
+    reach = len(weights) // 2
+    radius_sq = radius * radius
+    
+    shaded = np.empty((size, size), dtype=np.float64)
+    for y in range(size):
+        dy = y - center
+        for x in range(size):
+            dx = x - center
+            dist_sq = dx * dx + dy * dy
+            falloff = 1.0 - dist_sq / radius_sq if dist_sq < radius_sq else 0.0
+            shaded[y, x] = (noise[y, x] * 0.7 + 0.3) * falloff
+    
+    column_blurred = np.empty((size, size), dtype=np.float32)
+    for y in range(size):
+        for x in range(size):
+            total = 0.0
+            for k in range(-reach, reach + 1):
+                source = y + k
+                if source < 0:
+                    source = -source - 1
+                elif source >= size:
+                    source = 2 * size - source - 1
+                total += weights[k + reach] * shaded[source, x]
+            column_blurred[y, x] = total
+    
+    for y in range(size):
+        for x in range(size):
+            total = 0.0
+            for k in range(-reach, reach + 1):
+                source = x + k
+                if source < 0:
+                    source = -source - 1
+                elif source >= size:
+                    source = 2 * size - source - 1
+                total += weights[k + reach] * column_blurred[y, source]
+            out[y, x] = total
+
+
+def _rasterize_scratches(data, starts_x, starts_y, cos_angles, sin_angles,
+                         lengths, widths, intensities, center, radius):
+    """
+    Draw straight scratches into data, keeping the maximum per pixel.
+    
+    Scratches fade across their width and towards the edge of the
+    circle of the given center and radius. Every (scratch, step, offset)
+    sample is computed at once and composited with one np.maximum.at.
+    
+    Args:
+        data: Float32 alpha array to draw into
+        starts_x, starts_y: Integer scratch start points in pixels
+        cos_angles, sin_angles: Cosine and sine of each scratch direction
+        lengths: Scratch lengths in pixel steps
+        widths: Scratch half-widths in pixels
+        intensities: Scratch peak alpha values
+        center: Center of the circular boundary in pixels
+        radius: Radius of the circular boundary in pixels
+    """
+    size = data.shape[0]
+    extents = widths.astype(np.int64)
+    max_extent = int(extents.max())
+    
+    # Axes: scratch, step along the scratch, offset across it
+    steps = np.arange(lengths.max())[None, :, None]
+    offsets = np.arange(-max_extent, max_extent + 1)[None, None, :]
+    cos_angles = cos_angles[:, None, None]
+    sin_angles = sin_angles[:, None, None]
+    
+    # Truncate toward zero, as int() does
+    px = np.trunc(starts_x[:, None, None] + steps * cos_angles).astype(np.int64)
+    py = np.trunc(starts_y[:, None, None] + steps * sin_angles).astype(np.int64)
+    x = px + np.trunc(offsets * sin_angles).astype(np.int64)
+    y = py - np.trunc(offsets * cos_angles).astype(np.int64)
+    
+    dist_from_center = np.sqrt((x - center) ** 2 + (y - center) ** 2)
+    valid = (
+        (steps < lengths[:, None, None])
+        & (np.abs(offsets) <= extents[:, None, None])
+        & (x >= 0) & (x < size) & (y >= 0) & (y < size)
+        & (dist_from_center < radius)
+    )
+    
+    falloff = 1.0 - (dist_from_center / radius) ** 2
+    width_falloff = 1.0 - np.abs(offsets) / widths[:, None, None]
+    values = intensities[:, None, None] * falloff * width_falloff
+    
+    np.maximum.at(data, (y[valid], x[valid]), values[valid].astype(data.dtype))
 
 class BrushTextureGenerator:
     """
     Generates procedural brush textures.
     
     Creates various brush tip patterns (soft circle, hard circle,
-    pencil texture, etc.) as OpenGL textures.
+    pencil texture, etc.). generate_* methods return the pixel data,
+    create_* methods also upload it as an OpenGL texture.
     """
     
+    @staticmethod
+    def generate(texture_type: str, size: int = 256) -> np.ndarray:
+        """
+        Generate brush texture data by type.
+        
+        Textures are deterministic, so each type and size is generated
+        once and the same read-only array is returned afterwards.
+        
+        Args:
+            texture_type: Type of texture (e.g., 'soft_circle', 'star'),
+                          unknown types fall back to 'soft_circle'
+            size: Texture size in pixels (square)
+        
+        Returns:
+            Read-only float32 alpha array of shape (size, size)
+        """
+        if texture_type not in _GENERATORS:
+            texture_type = 'soft_circle'
+        return _generate_cached(texture_type, size)
+    
+    @staticmethod
+    def generate_all(size: int = 256) -> Dict[str, np.ndarray]:
+        """
+        Generate every brush texture, in parallel across threads.
+        
+        The generators spend their time in numpy, which releases the GIL,
+        so independent textures overlap on multi-core CPUs.
+        
+        Args:
+            size: Texture size in pixels (square)
+        
+        Returns:
+            Dictionary mapping texture type to its read-only float32 array,
+            in BRUSH_TEXTURE_TYPES order
+        """
+        count = len(BRUSH_TEXTURE_TYPES)
+        with ThreadPoolExecutor(max_workers=min(count, os.cpu_count() or 1)) as executor:
+            textures = executor.map(BrushTextureGenerator.generate, BRUSH_TEXTURE_TYPES, [size] * count)
+            return dict(zip(BRUSH_TEXTURE_TYPES, textures))
+    
+    @staticmethod
+    def build_all_into(atlas: np.ndarray, tile_size: int = 256) -> Dict[str, Tuple[int, int]]:
+        """
+        Generate every brush texture into tiles of an atlas array.
+        
+        Tiles are filled row by row in BRUSH_TEXTURE_TYPES order. A uint16
+        atlas receives normalized 16-bit texels, ready for a GL_R16 upload.
+        
+        Args:
+            atlas: Float32 or uint16 array whose sides are multiples of
+                   tile_size, with room for len(BRUSH_TEXTURE_TYPES) tiles
+            tile_size: Tile size in pixels (square)
+        
+        Returns:
+            Dictionary mapping texture type to its tile's (x, y) pixel origin
+        """
+        columns = atlas.shape[1] // tile_size
+        origins = {}
+        
+        textures = BrushTextureGenerator.generate_all(tile_size)
+        for tile, (texture_type, tile_data) in enumerate(textures.items()):
+            x = (tile % columns) * tile_size
+            y = (tile // columns) * tile_size
+            if atlas.dtype == np.uint16:
+                tile_data = _to_unorm16(tile_data)
+            atlas[y:y + tile_size, x:x + tile_size] = tile_data
+            origins[texture_type] = (x, y)
+        
+        return origins
+    
+    @staticmethod
+    def create_all(size: int = 256) -> Tuple[int, Dict[str, int]]:
+        """
+        Create every brush texture as one layer of an OpenGL texture array.
+        
+        Storage for all layers is allocated once and each texture is
+        uploaded into its layer, in BRUSH_TEXTURE_TYPES order.
+        
+        Args:
+            size: Texture size in pixels (square)
+        
+        Returns:
+            Tuple of (texture_id, dictionary mapping texture type to layer)
+        """
+        layers = {texture_type: layer for layer, texture_type in enumerate(BRUSH_TEXTURE_TYPES)}
+        
+        texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D_ARRAY, texture_id)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        
+        if glTexStorage3D:
+            glTexStorage3D(GL_TEXTURE_2D_ARRAY, 1, GL_R16, size, size, len(layers))
+        else:
+            glTexImage3D(
+                GL_TEXTURE_2D_ARRAY, 0, GL_R16,
+                size, size, len(layers), 0,
+                GL_RED, GL_UNSIGNED_SHORT, None
+            )
+        
+        # Rows are tightly packed 16-bit texels (see _upload_texture)
+        previous_alignment = glGetIntegerv(GL_UNPACK_ALIGNMENT)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        textures = BrushTextureGenerator.generate_all(size)
+        for texture_type, layer in layers.items():
+            data = _to_unorm16(textures[texture_type])
+            glTexSubImage3D(
+                GL_TEXTURE_2D_ARRAY, 0,
+                0, 0, layer, size, size, 1,
+                GL_RED, GL_UNSIGNED_SHORT, data
+            )
+        glPixelStorei(GL_UNPACK_ALIGNMENT, previous_alignment)
+        
+        glBindTexture(GL_TEXTURE_2D_ARRAY, 0)
+        
+        return texture_id, layers
+    
+    @staticmethod
+    def generate_soft_circle(size: int = 256) -> np.ndarray:
+        """
+        Generate soft circular brush texture with smooth falloff.
+        
+        Args:
+            size: Texture size in pixels (square)
+        
+        Returns:
+            Float32 alpha array of shape (size, size)
+        """
+        center = size / 2.0
+        radius = size / 2.0
+        
+        y, x = _coord_grid(size)
+        dx = x - center
+        dy = y - center
+        
+        # Smooth falloff; (dist / radius)^2 needs no sqrt
+        dist_sq = dx * dx + dy * dy
+        radius_sq = radius * radius
+        data = np.where(dist_sq < radius_sq, 1.0 - dist_sq / radius_sq, 0.0)
+        
+        return data.astype(np.float32)
+    
     @staticmethod
     def create_soft_circle(size: int = 256) -> Tuple[int, np.ndarray]:
         """
@@ -26,39 +493,32 @@ class BrushTextureGenerator:
         Returns:
             Tuple of (texture_id, pixel_data)
         """
-        # Create texture data
-        data = np.zeros((size, size), dtype=np.float32)
+        data = BrushTextureGenerator.generate('soft_circle', size)
+        return _upload_texture(data), data
+    
+    @staticmethod
+    def generate_hard_circle(size: int = 256) -> np.ndarray:
+        """
+        Generate hard-edged circular brush texture.
+        
+        Args:
+            size: Texture size in pixels (square)
+        
+        Returns:
+            Float32 alpha array of shape (size, size)
+        """
         center = size / 2.0
-        radius = size / 2.0
+        radius = size / 2.0 - 1.0  # Slight inset for antialiasing
         
-        for y in range(size):
-            for x in range(size):
-                dx = x - center
-                dy = y - center
-                dist = np.sqrt(dx * dx + dy * dy)
-                
-                # Smooth falloff
-                if dist < radius:
-                    alpha = 1.0 - (dist / radius) ** 2
-                    data[y, x] = max(0.0, alpha)
-        
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        y, x = _coord_grid(size)
+        dx = x - center
+        dy = y - center
+        dist = np.sqrt(dx * dx + dy * dy)
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        # Hard edge with 1-pixel antialiasing
+        data = np.clip(radius + 1.0 - dist, 0.0, 1.0)
         
-        return texture_id, data
+        return data.astype(np.float32)
     
     @staticmethod
     def create_hard_circle(size: int = 256) -> Tuple[int, np.ndarray]:
@@ -71,40 +531,38 @@ class BrushTextureGenerator:
         Returns:
             Tuple of (texture_id, pixel_data)
         """
-        data = np.zeros((size, size), dtype=np.float32)
-        center = size / 2.0
-        radius = size / 2.0 - 1.0  # Slight inset for antialiasing
-        
-        for y in range(size):
-            for x in range(size):
-                dx = x - center
-                dy = y - center
-                dist = np.sqrt(dx * dx + dy * dy)
-                
-                # Hard edge with minimal antialiasing
-                if dist < radius:
-                    data[y, x] = 1.0
-                elif dist < radius + 1.0:
-                    # 1-pixel antialiasing
-                    data[y, x] = radius + 1.0 - dist
-        
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        data = BrushTextureGenerator.generate('hard_circle', size)
+        return _upload_texture(data), data
+    
+    @staticmethod
+    def generate_noise_texture(size: int = 256, scale: float = 0.1) -> np.ndarray:
+        """
+        Generate noisy brush texture (for pencil, charcoal effects).
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        Args:
+            size: Texture size in pixels (square)
+            scale: Noise scale (lower = coarser)
         
-        return texture_id, data
+        Returns:
+            Float32 alpha array of shape (size, size)
+        """
+        # Generate random noise
+        rng = np.random.default_rng(42)  # Reproducible
+        data = rng.random((size, size), dtype=np.float32)
+        
+        # Approximate a gaussian blur for smoother noise with three box
+        # blurs, whose cost does not grow with the (large) sigma. Each box
+        # of radius r adds variance r * (r + 1) / 3.
+        sigma = scale * size
+        box_radius = max(1, int(round((np.sqrt(4.0 * sigma * sigma + 1.0) - 1.0) / 2.0)))
+        for _ in range(3):
+            data = _box_filter(data, box_radius)
+        
+        # Normalize to 0-1 in place
+        data -= data.min()
+        data /= data.max()
+        
+        return data
     
     @staticmethod
     def create_noise_texture(size: int = 256, scale: float = 0.1) -> Tuple[int, np.ndarray]:
@@ -118,34 +576,33 @@ class BrushTextureGenerator:
         Returns:
             Tuple of (texture_id, pixel_data)
         """
-        # Generate random noise
-        np.random.seed(42)  # Reproducible
-        data = np.random.rand(size, size).astype(np.float32)
+        data = BrushTextureGenerator.generate_noise_texture(size, scale)
+        return _upload_texture(data, GL_REPEAT), data
+    
+    @staticmethod
+    def generate_square_hard(size: int = 256) -> np.ndarray:
+        """
+        Generate hard-edged square brush texture.
         
-        # Apply gaussian blur for smoother noise
-        from scipy.ndimage import gaussian_filter
-        data = gaussian_filter(data, sigma=scale * size)
+        Args:
+            size: Texture size in pixels (square)
         
-        # Normalize to 0-1
-        data = (data - data.min()) / (data.max() - data.min())
+        Returns:
+            Float32 alpha array of shape (size, size)
+        """
+        center = size / 2.0
+        half_size = size / 2.0 - 1.0  # Slight inset for antialiasing
         
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        y, x = _coord_grid(size)
+        dx = np.abs(x - center)
+        dy = np.abs(y - center)
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        # Hard edge square with 1-pixel antialiasing
+        fade_x = np.clip(half_size + 1.0 - dx, 0.0, 1.0)
+        fade_y = np.clip(half_size + 1.0 - dy, 0.0, 1.0)
+        data = np.minimum(fade_x, fade_y)
         
-        return texture_id, data
+        return data.astype(np.float32)
     
     @staticmethod
     def create_square_hard(size: int = 256) -> Tuple[int, np.ndarray]:
@@ -158,41 +615,32 @@ class BrushTextureGenerator:
         Returns:
             Tuple of (texture_id, pixel_data)
         """
-        data = np.zeros((size, size), dtype=np.float32)
+        data = BrushTextureGenerator.generate('square_hard', size)
+        return _upload_texture(data), data
+    
+    @staticmethod
+    def generate_square_soft(size: int = 256) -> np.ndarray:
+        """
+        Generate soft-edged square brush texture with gradient falloff.
+        
+        Args:
+            size: Texture size in pixels (square)
+        
+        Returns:
+            Float32 alpha array of shape (size, size)
+        """
         center = size / 2.0
-        half_size = size / 2.0 - 1.0  # Slight inset for antialiasing
+        half_size = size / 2.0
         
-        for y in range(size):
-            for x in range(size):
-                dx = abs(x - center)
-                dy = abs(y - center)
-                
-                # Hard edge square
-                if dx < half_size and dy < half_size:
-                    data[y, x] = 1.0
-                elif dx < half_size + 1.0 and dy < half_size + 1.0:
-                    # 1-pixel antialiasing
-                    fade_x = max(0.0, half_size + 1.0 - dx)
-                    fade_y = max(0.0, half_size + 1.0 - dy)
-                    data[y, x] = min(fade_x, fade_y)
-        
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        y, x = _coord_grid(size)
+        dx = np.abs(x - center)
+        dy = np.abs(y - center)
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        # Soft falloff from center
+        max_dist = np.maximum(dx, dy)
+        data = np.where(max_dist < half_size, 1.0 - (max_dist / half_size) ** 2, 0.0)
         
-        return texture_id, data
+        return data.astype(np.float32)
     
     @staticmethod
     def create_square_soft(size: int = 256) -> Tuple[int, np.ndarray]:
@@ -205,51 +653,20 @@ class BrushTextureGenerator:
         Returns:
             Tuple of (texture_id, pixel_data)
         """
-        data = np.zeros((size, size), dtype=np.float32)
-        center = size / 2.0
-        half_size = size / 2.0
-        
-        for y in range(size):
-            for x in range(size):
-                dx = abs(x - center)
-                dy = abs(y - center)
-                
-                # Soft falloff from center
-                max_dist = max(dx, dy)
-                if max_dist < half_size:
-                    alpha = 1.0 - (max_dist / half_size) ** 2
-                    data[y, x] = max(0.0, alpha)
-        
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
-        
-        glBindTexture(GL_TEXTURE_2D, 0)
-        
-        return texture_id, data
+        data = BrushTextureGenerator.generate('square_soft', size)
+        return _upload_texture(data), data
     
     @staticmethod
-    def create_triangle(size: int = 256) -> Tuple[int, np.ndarray]:
+    def generate_triangle(size: int = 256) -> np.ndarray:
         """
-        Create triangular brush texture.
+        Generate triangular brush texture.
         
         Args:
             size: Texture size in pixels (square)
         
         Returns:
-            Tuple of (texture_id, pixel_data)
+            Float32 alpha array of shape (size, size)
         """
-        data = np.zeros((size, size), dtype=np.float32)
         center_x = size / 2.0
         center_y = size / 2.0
         radius = size / 2.0 - 2.0
@@ -259,52 +676,52 @@ class BrushTextureGenerator:
         v2_x, v2_y = center_x - radius * 0.866, center_y + radius * 0.5
         v3_x, v3_y = center_x + radius * 0.866, center_y + radius * 0.5
         
-        def sign(px, py, x1, y1, x2, y2):
-            return (px - x2) * (y1 - y2) - (x1 - x2) * (py - y2)
-        
-        for y in range(size):
-            for x in range(size):
-                # Check if point is inside triangle
-                d1 = sign(x, y, v1_x, v1_y, v2_x, v2_y)
-                d2 = sign(x, y, v2_x, v2_y, v3_x, v3_y)
-                d3 = sign(x, y, v3_x, v3_y, v1_x, v1_y)
-                
-                has_neg = (d1 < 0) or (d2 < 0) or (d3 < 0)
-                has_pos = (d1 > 0) or (d2 > 0) or (d3 > 0)
-                
-                if not (has_neg and has_pos):
-                    data[y, x] = 1.0
-        
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        # Side of each edge as a*(x - x2) + b*(y - y2), with the edge
+        # coefficients computed once. Both products are per row or per
+        # column, leaving a single add per pixel; anchoring at (x2, y2)
+        # keeps pixels exactly on an edge at zero.
+        y, x = _coord_grid(size)
+        sides = []
+        for (x1, y1), (x2, y2) in (
+            ((v1_x, v1_y), (v2_x, v2_y)),
+            ((v2_x, v2_y), (v3_x, v3_y)),
+            ((v3_x, v3_y), (v1_x, v1_y)),
+        ):
+            a = y1 - y2
+            b = x2 - x1
+            sides.append(a * (x - x2) + b * (y - y2))
+        d1, d2, d3 = sides
+        
+        # Inside when on the same side of all three edges
+        inside = ((d1 >= 0) & (d2 >= 0) & (d3 >= 0)) | ((d1 <= 0) & (d2 <= 0) & (d3 <= 0))
+        
+        return inside.astype(np.float32)
+    
+    @staticmethod
+    def create_triangle(size: int = 256) -> Tuple[int, np.ndarray]:
+        """
+        Create triangular brush texture.
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        Args:
+            size: Texture size in pixels (square)
         
-        return texture_id, data
+        Returns:
+            Tuple of (texture_id, pixel_data)
+        """
+        data = BrushTextureGenerator.generate('triangle', size)
+        return _upload_texture(data), data
     
     @staticmethod
-    def create_star(size: int = 256) -> Tuple[int, np.ndarray]:
+    def generate_star(size: int = 256) -> np.ndarray:
         """
-        Create 5-pointed star brush texture.
+        Generate 5-pointed star brush texture.
         
         Args:
             size: Texture size in pixels (square)
         
         Returns:
-            Tuple of (texture_id, pixel_data)
+            Float32 alpha array of shape (size, size)
         """
-        data = np.zeros((size, size), dtype=np.float32)
         center_x = size / 2.0
         center_y = size / 2.0
         outer_radius = size / 2.0 - 2.0
@@ -326,49 +743,28 @@ class BrushTextureGenerator:
                 center_y + inner_radius * np.sin(angle)
             ))
         
-        def point_in_polygon(x, y, vertices):
-            n = len(vertices)
-            inside = False
-            p1x, p1y = vertices[0]
-            for i in range(1, n + 1):
-                p2x, p2y = vertices[i % n]
-                if y > min(p1y, p2y):
-                    if y <= max(p1y, p2y):
-                        if x <= max(p1x, p2x):
-                            if p1y != p2y:
-                                xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                            if p1x == p2x or x <= xinters:
-                                inside = not inside
-                p1x, p1y = p2x, p2y
-            return inside
-        
-        for y in range(size):
-            for x in range(size):
-                if point_in_polygon(x, y, vertices):
-                    data[y, x] = 1.0
-        
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
-        
-        glBindTexture(GL_TEXTURE_2D, 0)
+        # Even-odd point in polygon test, one edge at a time over all pixels
+        y, x = _coord_grid(size)
+        inside = np.zeros((size, size), dtype=bool)
+        n = len(vertices)
+        for i in range(n):
+            p1x, p1y = vertices[i]
+            p2x, p2y = vertices[(i + 1) % n]
+            if p1y == p2y:
+                continue  # Horizontal edges are never crossed
+            
+            crosses = (y > min(p1y, p2y)) & (y <= max(p1y, p2y)) & (x <= max(p1x, p2x))
+            if p1x != p2x:
+                xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                crosses &= x <= xinters
+            inside ^= crosses
         
-        return texture_id, data
+        return inside.astype(np.float32)
     
     @staticmethod
-    def create_splatter(size: int = 256) -> Tuple[int, np.ndarray]:
+    def create_star(size: int = 256) -> Tuple[int, np.ndarray]:
         """
-        Create splatter brush texture with random particle scatter.
+        Create 5-pointed star brush texture.
         
         Args:
             size: Texture size in pixels (square)
@@ -376,58 +772,47 @@ class BrushTextureGenerator:
         Returns:
             Tuple of (texture_id, pixel_data)
         """
+        data = BrushTextureGenerator.generate('star', size)
+        return _upload_texture(data), data
+    
+    @staticmethod
+    def generate_splatter(size: int = 256) -> np.ndarray:
+        """
+        Generate splatter brush texture with random particle scatter.
+        
+        Args:
+            size: Texture size in pixels (square)
+        
+        Returns:
+            Float32 alpha array of shape (size, size)
+        """
         data = np.zeros((size, size), dtype=np.float32)
         center = size / 2.0
         radius = size / 2.0
         
-        # Generate random splatter particles
-        np.random.seed(123)  # Reproducible
+        # Generate random splatter particles, one row of (angle, distance,
+        # size, intensity) per particle
+        rng = np.random.default_rng(123)  # Reproducible
         num_particles = 80
+        angles, dists, particle_sizes, intensities = rng.uniform(
+            (0, 0, 2, 0.3),
+            (2 * np.pi, radius * 0.9, 8, 1.0),
+            (num_particles, 4)
+        ).T
         
-        for _ in range(num_particles):
-            # Random position within circle
-            angle = np.random.uniform(0, 2 * np.pi)
-            dist = np.random.uniform(0, radius * 0.9)
-            px = int(center + dist * np.cos(angle))
-            py = int(center + dist * np.sin(angle))
-            
-            # Random particle size
-            particle_size = np.random.uniform(2, 8)
-            intensity = np.random.uniform(0.3, 1.0)
-            
-            # Draw particle with soft edges
-            for dy in range(int(-particle_size), int(particle_size) + 1):
-                for dx in range(int(-particle_size), int(particle_size) + 1):
-                    x = px + dx
-                    y = py + dy
-                    if 0 <= x < size and 0 <= y < size:
-                        dist_from_center = np.sqrt(dx * dx + dy * dy)
-                        if dist_from_center < particle_size:
-                            falloff = 1.0 - (dist_from_center / particle_size)
-                            data[y, x] = max(data[y, x], intensity * falloff)
-        
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        # Random position within circle
+        centers_x = (center + dists * np.cos(angles)).astype(np.int64)
+        centers_y = (center + dists * np.sin(angles)).astype(np.int64)
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        # Draw particles with soft edges
+        _rasterize_splatter(data, centers_x, centers_y, particle_sizes, intensities)
         
-        return texture_id, data
+        return data
     
     @staticmethod
-    def create_stipple(size: int = 256) -> Tuple[int, np.ndarray]:
+    def create_splatter(size: int = 256) -> Tuple[int, np.ndarray]:
         """
-        Create stipple brush texture with dotted pattern.
+        Create splatter brush texture with random particle scatter.
         
         Args:
             size: Texture size in pixels (square)
@@ -435,6 +820,20 @@ class BrushTextureGenerator:
         Returns:
             Tuple of (texture_id, pixel_data)
         """
+        data = BrushTextureGenerator.generate('splatter', size)
+        return _upload_texture(data), data
+    
+    @staticmethod
+    def generate_stipple(size: int = 256) -> np.ndarray:
+        """
+        Generate stipple brush texture with dotted pattern.
+        
+        Args:
+            size: Texture size in pixels (square)
+        
+        Returns:
+            Float32 alpha array of shape (size, size)
+        """
         data = np.zeros((size, size), dtype=np.float32)
         center = size / 2.0
         radius = size / 2.0
@@ -443,47 +842,26 @@ class BrushTextureGenerator:
         dot_spacing = 12
         dot_size = 3
         
-        for y in range(0, size, dot_spacing):
-            for x in range(0, size, dot_spacing):
-                # Check if dot is within circular boundary
-                dx = x - center
-                dy = y - center
-                dist_from_center = np.sqrt(dx * dx + dy * dy)
-                
-                if dist_from_center < radius * 0.9:
-                    # Draw dot with soft edges
-                    for dy_dot in range(-dot_size, dot_size + 1):
-                        for dx_dot in range(-dot_size, dot_size + 1):
-                            px = x + dx_dot
-                            py = y + dy_dot
-                            if 0 <= px < size and 0 <= py < size:
-                                dot_dist = np.sqrt(dx_dot * dx_dot + dy_dot * dy_dot)
-                                if dot_dist < dot_size:
-                                    falloff = 1.0 - (dot_dist / dot_size) ** 2
-                                    data[py, px] = max(data[py, px], falloff)
-        
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        # Every dot has the same soft-edged shape
+        dy_dot, dx_dot = np.ogrid[-dot_size:dot_size + 1, -dot_size:dot_size + 1]
+        dot_dist = np.sqrt(dx_dot * dx_dot + dy_dot * dy_dot)
+        dot = np.where(dot_dist < dot_size, 1.0 - (dot_dist / dot_size) ** 2, 0.0)
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        # Keep the dots within the circular boundary
+        ys, xs = np.ogrid[0:size:dot_spacing, 0:size:dot_spacing]
+        dx = xs - center
+        dy = ys - center
+        inside = np.sqrt(dx * dx + dy * dy) < radius * 0.9
         
-        return texture_id, data
+        rows, columns = np.nonzero(inside)
+        _composite_max(data, dot, columns * dot_spacing - dot_size, rows * dot_spacing - dot_size)
+        
+        return data
     
     @staticmethod
-    def create_grainy(size: int = 256) -> Tuple[int, np.ndarray]:
+    def create_stipple(size: int = 256) -> Tuple[int, np.ndarray]:
         """
-        Create fine-grained texture (like pencil lead).
+        Create stipple brush texture with dotted pattern.
         
         Args:
             size: Texture size in pixels (square)
@@ -491,168 +869,189 @@ class BrushTextureGenerator:
         Returns:
             Tuple of (texture_id, pixel_data)
         """
-        data = np.zeros((size, size), dtype=np.float32)
+        data = BrushTextureGenerator.generate('stipple', size)
+        return _upload_texture(data), data
+    
+    @staticmethod
+    def generate_grainy(size: int = 256) -> np.ndarray:
+        """
+        Generate fine-grained texture (like pencil lead).
+        
+        Args:
+            size: Texture size in pixels (square)
+        
+        Returns:
+            Float32 alpha array of shape (size, size)
+        """
         center = size / 2.0
         radius = size / 2.0
         
         # Generate fine grain noise
-        np.random.seed(456)  # Reproducible
-        noise = np.random.rand(size, size).astype(np.float32)
-        
-        # Apply to circular region with falloff
-        for y in range(size):
-            for x in range(size):
-                dx = x - center
-                dy = y - center
-                dist = np.sqrt(dx * dx + dy * dy)
-                
-                if dist < radius:
-                    # Soft circular falloff
-                    falloff = 1.0 - (dist / radius) ** 2
-                    # Fine grain with some smoothing
-                    grain_value = noise[y, x] * 0.7 + 0.3
-                    data[y, x] = grain_value * falloff
+        rng = np.random.default_rng(456)  # Reproducible
+        noise = rng.random((size, size), dtype=np.float32)
+        
+        if numba is not None:
+            data = np.empty((size, size), dtype=np.float32)
+            _shade_grainy(noise, _GRAIN_BLUR_WEIGHTS, center, radius, data)
+            return data
+        
+        # Soft circular falloff; (dist / radius)^2 needs no sqrt
+        y, x = _coord_grid(size)
+        dx = x - center
+        dy = y - center
+        dist_sq = dx * dx + dy * dy
+        radius_sq = radius * radius
+        falloff = np.where(dist_sq < radius_sq, 1.0 - dist_sq / radius_sq, 0.0)
+        
+        # Fine grain with some smoothing, computed in the existing buffers
+        noise *= 0.7
+        noise += 0.3
+        falloff *= noise
+        data = falloff.astype(np.float32)
         
         # Slight blur for pencil effect
-        from scipy.ndimage import gaussian_filter
-        data = gaussian_filter(data, sigma=0.5)
+        data = _separable_filter(data, _GRAIN_BLUR_WEIGHTS)
         
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        return data
+    
+    @staticmethod
+    def create_grainy(size: int = 256) -> Tuple[int, np.ndarray]:
+        """
+        Create fine-grained texture (like pencil lead).
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        Args:
+            size: Texture size in pixels (square)
         
-        return texture_id, data
+        Returns:
+            Tuple of (texture_id, pixel_data)
+        """
+        data = BrushTextureGenerator.generate('grainy', size)
+        return _upload_texture(data), data
     
     @staticmethod
-    def create_scratchy(size: int = 256) -> Tuple[int, np.ndarray]:
+    def generate_scratchy(size: int = 256) -> np.ndarray:
         """
-        Create rough, scratchy texture (like charcoal).
+        Generate rough, scratchy texture (like charcoal).
         
         Args:
             size: Texture size in pixels (square)
         
         Returns:
-            Tuple of (texture_id, pixel_data)
+            Float32 alpha array of shape (size, size)
         """
         data = np.zeros((size, size), dtype=np.float32)
         center = size / 2.0
         radius = size / 2.0
         
         # Generate scratchy pattern with elongated noise
-        np.random.seed(789)  # Reproducible
+        rng = np.random.default_rng(789)  # Reproducible
         
-        # Create directional scratches
+        # Create directional scratches, one row of (angle, start distance,
+        # direction, length, width, intensity) per scratch
         num_scratches = 30
-        for _ in range(num_scratches):
-            # Random position and angle
-            angle = np.random.uniform(0, 2 * np.pi)
-            start_dist = np.random.uniform(0, radius * 0.7)
-            sx = int(center + start_dist * np.cos(angle))
-            sy = int(center + start_dist * np.sin(angle))
-            
-            # Scratch direction
-            scratch_angle = np.random.uniform(0, 2 * np.pi)
-            scratch_length = int(np.random.uniform(10, 40))
-            scratch_width = np.random.uniform(1.5, 3.0)
-            intensity = np.random.uniform(0.4, 1.0)
-            
-            # Draw scratch
-            for step in range(scratch_length):
-                px = int(sx + step * np.cos(scratch_angle))
-                py = int(sy + step * np.sin(scratch_angle))
-                
-                # Draw scratch with width
-                for dw in range(int(-scratch_width), int(scratch_width) + 1):
-                    x = px + int(dw * np.sin(scratch_angle))
-                    y = py - int(dw * np.cos(scratch_angle))
-                    
-                    if 0 <= x < size and 0 <= y < size:
-                        # Check if within circular boundary
-                        dist_from_center = np.sqrt((x - center)**2 + (y - center)**2)
-                        if dist_from_center < radius:
-                            falloff = 1.0 - (dist_from_center / radius) ** 2
-                            width_falloff = 1.0 - abs(dw) / scratch_width
-                            data[y, x] = max(data[y, x], intensity * falloff * width_falloff)
+        angles, start_dists, scratch_angles, lengths, widths, intensities = rng.uniform(
+            (0, 0, 0, 10, 1.5, 0.4),
+            (2 * np.pi, radius * 0.7, 2 * np.pi, 40, 3.0, 1.0),
+            (num_scratches, 6)
+        ).T
+        
+        # Random start position within circle
+        starts_x = (center + start_dists * np.cos(angles)).astype(np.int64)
+        starts_y = (center + start_dists * np.sin(angles)).astype(np.int64)
+        cos_angles = np.cos(scratch_angles)
+        sin_angles = np.sin(scratch_angles)
+        lengths = lengths.astype(np.int64)
+        
+        # Draw scratches
+        _rasterize_scratches(
+            data, starts_x, starts_y, cos_angles, sin_angles,
+            lengths, widths, intensities, center, radius
+        )
         
         # Add base texture
-        base_noise = np.random.rand(size, size).astype(np.float32) * 0.3
-        data = np.clip(data + base_noise, 0.0, 1.0)
+        base_noise = rng.random((size, size), dtype=np.float32)
+        base_noise *= 0.3
+        data += base_noise
+        np.clip(data, 0.0, 1.0, out=data)
         
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        return data
+    
+    @staticmethod
+    def create_scratchy(size: int = 256) -> Tuple[int, np.ndarray]:
+        """
+        Create rough, scratchy texture (like charcoal).
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        Args:
+            size: Texture size in pixels (square)
         
-        return texture_id, data
+        Returns:
+            Tuple of (texture_id, pixel_data)
+        """
+        data = BrushTextureGenerator.generate('scratchy', size)
+        return _upload_texture(data), data
     
     @staticmethod
-    def create_diamond(size: int = 256) -> Tuple[int, np.ndarray]:
+    def generate_diamond(size: int = 256) -> np.ndarray:
         """
-        Create diamond/rhombus brush texture.
+        Generate diamond/rhombus brush texture.
         
         Args:
             size: Texture size in pixels (square)
         
         Returns:
-            Tuple of (texture_id, pixel_data)
+            Float32 alpha array of shape (size, size)
         """
-        data = np.zeros((size, size), dtype=np.float32)
         center = size / 2.0
         half_size = size / 2.0 - 2.0
         
         # Diamond is a square rotated 45 degrees
-        for y in range(size):
-            for x in range(size):
-                dx = abs(x - center)
-                dy = abs(y - center)
-                
-                # Diamond distance (Manhattan distance)
-                dist = dx + dy
-                
-                if dist < half_size:
-                    data[y, x] = 1.0
-                elif dist < half_size + 2.0:
-                    # Antialiasing
-                    data[y, x] = (half_size + 2.0 - dist) / 2.0
-        
-        # Upload to OpenGL
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_R32F,
-            size, size, 0,
-            GL_RED, GL_FLOAT, data
-        )
+        y, x = _coord_grid(size)
+        dx = np.abs(x - center)
+        dy = np.abs(y - center)
+        
+        # Diamond distance (Manhattan distance)
+        dist = dx + dy
+        
+        # Solid inside, 2-pixel antialiasing at the edge
+        data = np.clip((half_size + 2.0 - dist) / 2.0, 0.0, 1.0)
+        
+        return data.astype(np.float32)
+    
+    @staticmethod
+    def create_diamond(size: int = 256) -> Tuple[int, np.ndarray]:
+        """
+        Create diamond/rhombus brush texture.
         
-        glBindTexture(GL_TEXTURE_2D, 0)
+        Args:
+            size: Texture size in pixels (square)
         
-        return texture_id, data
+        Returns:
+            Tuple of (texture_id, pixel_data)
+        """
+        data = BrushTextureGenerator.generate('diamond', size)
+        return _upload_texture(data), data
+
+
+# Data generator for each brush texture type
+_GENERATORS = {
+    'soft_circle': BrushTextureGenerator.generate_soft_circle,
+    'hard_circle': BrushTextureGenerator.generate_hard_circle,
+    'noise': BrushTextureGenerator.generate_noise_texture,
+    'square_hard': BrushTextureGenerator.generate_square_hard,
+    'square_soft': BrushTextureGenerator.generate_square_soft,
+    'triangle': BrushTextureGenerator.generate_triangle,
+    'star': BrushTextureGenerator.generate_star,
+    'splatter': BrushTextureGenerator.generate_splatter,
+    'stipple': BrushTextureGenerator.generate_stipple,
+    'grainy': BrushTextureGenerator.generate_grainy,
+    'scratchy': BrushTextureGenerator.generate_scratchy,
+    'diamond': BrushTextureGenerator.generate_diamond,
+}
+
 
+@functools.lru_cache(maxsize=None)
+def _generate_cached(texture_type: str, size: int) -> np.ndarray:
+    """Generate texture data for a known type, shared as a read-only array."""
+    data = _GENERATORS[texture_type](size)
+    data.flags.writeable = False
+    return data
@@ -4,10 +4,68 @@ Framebuffer Object (FBO) manager for GPU canvas rendering.
 Manages per-frame FBOs with LRU caching for memory efficiency.
 """
 
-from typing import Dict, Optional, Tuple
-from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import ctypes
 from OpenGL.GL import *
+# Unchecked bindings for the binds issued per stamp; the wrapped versions
+# convert arguments and query glGetError on every call
+from OpenGL.raw.GL.VERSION.GL_1_0 import glViewport as _glViewport
+from OpenGL.raw.GL.VERSION.GL_1_1 import glBindTexture as _glBindTexture
+from OpenGL.raw.GL.VERSION.GL_1_3 import glActiveTexture as _glActiveTexture
+from OpenGL.raw.GL.VERSION.GL_3_0 import glBindFramebuffer as _glBindFramebuffer
+from OpenGL.raw.GL.VERSION.GL_4_5 import glBindTextureUnit as _glBindTextureUnit
 import numpy as np
+from brush_studio.rendering.stream_buffer import StreamBuffer
+
+
+# Canvas texture formats in order of preference, with bytes per pixel.
+# Half floats keep the range and precision needed for stroke
+# accumulation at half the memory and bandwidth of 32-bit floats.
+_CANVAS_FORMATS = (
+    (GL_RGBA16F, 4 * 2),
+    (GL_RGBA32F, 4 * 4),
+)
+
+# Pixel transfer types for read_pixels/upload_pixels, by numpy dtype name.
+# Half floats halve the bytes moved between host and GPU.
+_TRANSFER_TYPES = {
+    'float32': (GL_FLOAT, np.float32),
+    'float16': (GL_HALF_FLOAT, np.float16),
+}
+
+
+def _transfer_type(dtype: str) -> Tuple[int, type]:
+    """Return the (GL type, numpy type) pair for a transfer dtype name."""
+    if dtype not in _TRANSFER_TYPES:
+        raise ValueError(f"Unsupported pixel transfer dtype: {dtype}")
+    return _TRANSFER_TYPES[dtype]
+
+
+# Clear value for canvases (transparent black)
+_TRANSPARENT = np.zeros(4, dtype=np.float32)
+
+# Framebuffer bound through FBO.bind/unbind (with the viewport set by
+# bind), or None when unknown. Lets repeated binds be skipped.
+_bound_framebuffer: Optional[int] = None
+
+
+def invalidate_framebuffer_binding():
+    """
+    Forget which framebuffer is bound.
+    
+    Call when other code (RV, or direct GL calls) may have changed the
+    framebuffer binding or viewport, so the next FBO.bind/unbind always binds.
+    """
+    global _bound_framebuffer
+    _bound_framebuffer = None
+
+
+def _unbind_framebuffer(force: bool = False):
+    """Bind the default framebuffer unless it is known to be bound."""
+    global _bound_framebuffer
+    if force or _bound_framebuffer != 0:
+        _glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        _bound_framebuffer = 0
 
 
 class FBO:
@@ -29,12 +87,25 @@ class FBO:
         self.height = height
         self.fbo_id = None
         self.texture_id = None
+        self.internal_format = None  # Chosen canvas texture format
+        self.bytes_per_pixel = 0  # Size of a texel in the chosen canvas format
         self.is_dirty = False  # Whether canvas has been modified
+        self.dirty_rect: Optional[Tuple[int, int, int, int]] = None  # Modified pixels (x0, y0, x1, y1)
+        
+        # Pixel pack buffers for read_pixels_async, created on first use
+        self._pack_buffers: Optional[List[int]] = None
+        self._pack_index = 0  # Buffer the next read goes into
+        self._pack_pending = [False, False]  # Whether each buffer holds a read
         
         self._create()
     
     def _create(self):
         """Create OpenGL FBO and texture resources."""
+        # Clear with glClearTexSubImage where available (GL 4.4)
+        self._clear_texture = bool(glClearTexSubImage)
+        # Create and bind without bind-to-edit where available (GL 4.5)
+        self._direct_state_access = bool(glCreateFramebuffers)
+        
         # Generate texture
         self.texture_id = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, self.texture_id)
@@ -45,47 +116,75 @@ class FBO:
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
         
-        # Allocate texture storage (RGBA32F for high quality)
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_RGBA32F,
-            self.width, self.height, 0,
-            GL_RGBA, GL_FLOAT, None
-        )
-        
-        # Generate FBO
-        self.fbo_id = glGenFramebuffers(1)
-        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo_id)
-        
-        # Attach texture to FBO
-        glFramebufferTexture2D(
-            GL_FRAMEBUFFER,
-            GL_COLOR_ATTACHMENT0,
-            GL_TEXTURE_2D,
-            self.texture_id,
-            0
-        )
-        
-        # Check FBO completeness
-        status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
-        if status != GL_FRAMEBUFFER_COMPLETE:
+        # Generate FBO, without binding it (and so without disturbing the
+        # caller's framebuffer) when direct state access is available
+        if self._direct_state_access:
+            fbo_ids = np.zeros(1, dtype=np.uint32)
+            glCreateFramebuffers(1, fbo_ids)
+            self.fbo_id = int(fbo_ids[0])
+        else:
+            self.fbo_id = glGenFramebuffers(1)
+            glBindFramebuffer(GL_FRAMEBUFFER, self.fbo_id)
+        
+        # Allocate texture storage in the first color-renderable format
+        for internal_format, bytes_per_pixel in _CANVAS_FORMATS:
+            glTexImage2D(
+                GL_TEXTURE_2D, 0, internal_format,
+                self.width, self.height, 0,
+                GL_RGBA, GL_FLOAT, None
+            )
+            
+            # Attach texture to FBO and check FBO completeness
+            if self._direct_state_access:
+                glNamedFramebufferTexture(self.fbo_id, GL_COLOR_ATTACHMENT0, self.texture_id, 0)
+                status = glCheckNamedFramebufferStatus(self.fbo_id, GL_FRAMEBUFFER)
+            else:
+                glFramebufferTexture2D(
+                    GL_FRAMEBUFFER,
+                    GL_COLOR_ATTACHMENT0,
+                    GL_TEXTURE_2D,
+                    self.texture_id,
+                    0
+                )
+                status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+            
+            if status == GL_FRAMEBUFFER_COMPLETE:
+                self.internal_format = internal_format
+                self.bytes_per_pixel = bytes_per_pixel
+                break
+        else:
             raise RuntimeError(f"FBO incomplete: {status}")
         
-        # Clear to transparent
-        glClearColor(0.0, 0.0, 0.0, 0.0)
-        glClear(GL_COLOR_BUFFER_BIT)
+        # Clear to transparent, leaving the clear color state untouched
+        if self._direct_state_access:
+            glClearNamedFramebufferfv(self.fbo_id, GL_COLOR, 0, _TRANSPARENT)
+        else:
+            glClearBufferfv(GL_COLOR, 0, _TRANSPARENT)
+            _unbind_framebuffer(force=True)
         
-        # Unbind
-        glBindFramebuffer(GL_FRAMEBUFFER, 0)
         glBindTexture(GL_TEXTURE_2D, 0)
     
-    def bind(self):
-        """Bind this FBO for rendering."""
-        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo_id)
-        glViewport(0, 0, self.width, self.height)
+    def bind(self, force: bool = False):
+        """
+        Bind this FBO for rendering, unless it is already bound.
+        
+        Args:
+            force: Bind even if the FBO is known to be bound
+        """
+        global _bound_framebuffer
+        if force or _bound_framebuffer != self.fbo_id:
+            _glBindFramebuffer(GL_FRAMEBUFFER, self.fbo_id)
+            _glViewport(0, 0, self.width, self.height)
+            _bound_framebuffer = self.fbo_id
     
-    def unbind(self):
-        """Unbind this FBO (return to default framebuffer)."""
-        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+    def unbind(self, force: bool = False):
+        """
+        Unbind this FBO (return to default framebuffer).
+        
+        Args:
+            force: Bind the default framebuffer even if known to be bound
+        """
+        _unbind_framebuffer(force)
     
     def bind_texture(self, texture_unit: int = 0):
         """
@@ -94,78 +193,253 @@ class FBO:
         Args:
             texture_unit: OpenGL texture unit (0-31)
         """
-        glActiveTexture(GL_TEXTURE0 + texture_unit)
-        glBindTexture(GL_TEXTURE_2D, self.texture_id)
+        if self._direct_state_access:
+            # One call, leaving the active texture unit unchanged
+            _glBindTextureUnit(texture_unit, self.texture_id)
+        else:
+            _glActiveTexture(GL_TEXTURE0 + texture_unit)
+            _glBindTexture(GL_TEXTURE_2D, self.texture_id)
     
     def unbind_texture(self):
         """Unbind texture."""
-        glBindTexture(GL_TEXTURE_2D, 0)
+        _glBindTexture(GL_TEXTURE_2D, 0)
     
-    def clear(self):
-        """Clear FBO to transparent."""
-        self.bind()
-        glClearColor(0.0, 0.0, 0.0, 0.0)
-        glClear(GL_COLOR_BUFFER_BIT)
-        self.unbind()
+    def mark_dirty(self, rect: Optional[Tuple[int, int, int, int]] = None):
+        """
+        Mark pixels as modified, growing the dirty rectangle.
+        
+        Args:
+            rect: Modified pixels (x0, y0, x1, y1) with exclusive x1/y1,
+                  or None for the whole canvas
+        """
+        if rect is None:
+            rect = (0, 0, self.width, self.height)
+        
+        if self.is_dirty:
+            # Dirty without a rectangle means the whole canvas
+            x0, y0, x1, y1 = self.dirty_rect or (0, 0, self.width, self.height)
+            rect = (min(x0, rect[0]), min(y0, rect[1]), max(x1, rect[2]), max(y1, rect[3]))
+        
+        self.dirty_rect = rect
+        self.is_dirty = True
+    
+    def clear(self, unbind: bool = True):
+        """
+        Clear FBO to transparent, limited to the dirty rectangle if known.
+        
+        Args:
+            unbind: Return to the default framebuffer afterwards. Pass False
+                    when clearing several FBOs in a row and unbind once.
+        """
+        if self._clear_texture:
+            # Clear the texels directly, without binding the framebuffer;
+            # no clear value means zero (transparent)
+            x0, y0, x1, y1 = (0, 0, self.width, self.height)
+            if self.is_dirty and self.dirty_rect is not None:
+                x0, y0, x1, y1 = self.dirty_rect
+            glClearTexSubImage(
+                self.texture_id, 0,
+                x0, y0, 0, x1 - x0, y1 - y0, 1,
+                GL_RGBA, GL_FLOAT, None
+            )
+        else:
+            self._clear_bound(unbind)
+        
         self.is_dirty = False
+        self.dirty_rect = None
+        
+        # Drop pending asynchronous reads of the cleared pixels
+        self._pack_pending = [False, False]
+    
+    def _clear_bound(self, unbind: bool):
+        """Clear through the framebuffer, scissored to the dirty rectangle."""
+        self.bind()
+        
+        if self.is_dirty and self.dirty_rect is not None:
+            # Pixels outside the dirty rectangle are already transparent
+            x0, y0, x1, y1 = self.dirty_rect
+            scissor_enabled = glIsEnabled(GL_SCISSOR_TEST)
+            if scissor_enabled:
+                previous_scissor = glGetIntegerv(GL_SCISSOR_BOX)
+            glEnable(GL_SCISSOR_TEST)
+            glScissor(x0, y0, x1 - x0, y1 - y0)
+            glClearBufferfv(GL_COLOR, 0, _TRANSPARENT)
+            if scissor_enabled:
+                glScissor(*previous_scissor)
+            else:
+                glDisable(GL_SCISSOR_TEST)
+        else:
+            glClearBufferfv(GL_COLOR, 0, _TRANSPARENT)
+        
+        if unbind:
+            self.unbind()
     
-    def read_pixels(self) -> np.ndarray:
+    def read_pixels(self, dtype: str = 'float32', flip_y: bool = True) -> np.ndarray:
         """
         Read FBO pixels to numpy array.
         
+        The driver converts the canvas format to the requested type;
+        'float16' moves half the bytes of 'float32' and is exact for
+        half-float canvases.
+        
+        Args:
+            dtype: Transfer type, 'float32' or 'float16'
+            flip_y: Return rows top-down. If False, rows are returned in
+                    OpenGL's bottom-up order as a contiguous array, with
+                    no flipped view for consumers to copy.
+        
         Returns:
-            RGBA float array of shape (height, width, 4)
+            RGBA array of the given dtype with shape (height, width, 4)
         """
+        gl_type, np_type = _transfer_type(dtype)
+        data = np.empty((self.height, self.width, 4), dtype=np_type)
+        
         self.bind()
-        pixels = glReadPixels(
+        glReadPixels(
             0, 0, self.width, self.height,
-            GL_RGBA, GL_FLOAT
+            GL_RGBA, gl_type,
+            data
         )
         self.unbind()
         
-        # Convert to numpy array and reshape
-        data = np.frombuffer(pixels, dtype=np.float32)
-        data = data.reshape((self.height, self.width, 4))
+        if flip_y:
+            # Flip vertically (OpenGL bottom-left origin)
+            data = np.flipud(data)
         
-        # Flip vertically (OpenGL bottom-left origin)
-        data = np.flipud(data)
+        return data
+    
+    def read_pixels_async(self) -> Optional[np.ndarray]:
+        """
+        Start reading FBO pixels and return the pixels of the previous read.
         
+        Reads go into two pixel pack buffers used in turn, so the GPU copies
+        the pixels while rendering continues, and they are only mapped on
+        the following call instead of stalling the pipeline. Pixels are
+        therefore one call behind.
+        
+        Returns:
+            RGBA float array of shape (height, width, 4) from the previous
+            call, or None on the first call
+        """
+        nbytes = self.width * self.height * 4 * 4
+        if self._pack_buffers is None:
+            self._pack_buffers = list(glGenBuffers(2))
+            for buffer in self._pack_buffers:
+                glBindBuffer(GL_PIXEL_PACK_BUFFER, buffer)
+                glBufferData(GL_PIXEL_PACK_BUFFER, nbytes, None, GL_STREAM_READ)
+        
+        # Queue the read into the current buffer
+        self.bind()
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self._pack_buffers[self._pack_index])
+        glReadPixels(0, 0, self.width, self.height, GL_RGBA, GL_FLOAT, ctypes.c_void_p(0))
+        self.unbind()
+        self._pack_pending[self._pack_index] = True
+        self._pack_index ^= 1
+        
+        # Collect the read queued by the previous call
+        data = None
+        if self._pack_pending[self._pack_index]:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, self._pack_buffers[self._pack_index])
+            pointer = glMapBufferRange(GL_PIXEL_PACK_BUFFER, 0, nbytes, GL_MAP_READ_BIT)
+            address = ctypes.cast(pointer, ctypes.c_void_p).value
+            mapped = np.ctypeslib.as_array((ctypes.c_float * (nbytes // 4)).from_address(address))
+            
+            # Flip vertically (OpenGL bottom-left origin), copying out of the mapping
+            data = np.flipud(mapped.reshape((self.height, self.width, 4))).copy()
+            glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+            self._pack_pending[self._pack_index] = False
+        
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
         return data
     
-    def upload_pixels(self, data: np.ndarray):
+    def upload_pixels(self, data: np.ndarray, upload_buffer: Optional[StreamBuffer] = None,
+                      dtype: str = 'float32', flip_y: bool = True, full_replace: bool = False):
         """
         Upload pixel data to FBO texture.
         
+        With a persistent upload buffer (see FBOManager.get_upload_buffer)
+        the pixels are written straight into mapped memory and the
+        texture is updated from there, without a client-side copy that the
+        driver must consume before returning.
+        
         Args:
-            data: RGBA float array of shape (height, width, 4)
+            data: RGBA float array of shape (height, width, 4), converted to
+                  dtype if needed
+            upload_buffer: Optional GL_PIXEL_UNPACK_BUFFER stream to upload through
+            dtype: Transfer type, 'float32' or 'float16' (half the bytes)
+            flip_y: Whether data rows are top-down. Pass False for rows
+                    already in OpenGL's bottom-up order (e.g. from
+                    read_pixels(flip_y=False)); contiguous data of the
+                    transfer dtype is then uploaded without any copy.
+            full_replace: Respecify the whole texture with glTexImage2D
+                          instead of updating it with glTexSubImage2D.
+                          Some drivers then allocate fresh storage rather
+                          than waiting for or copying the texture in use.
         """
         if data.shape != (self.height, self.width, 4):
             raise ValueError(f"Data shape mismatch: {data.shape} vs ({self.height}, {self.width}, 4)")
         
-        # Flip vertically for OpenGL
-        data = np.flipud(data)
+        gl_type, np_type = _transfer_type(dtype)
+        if flip_y:
+            # Flip vertically for OpenGL (a view; copied once below)
+            data = data[::-1]
         
-        # Upload to texture
         glBindTexture(GL_TEXTURE_2D, self.texture_id)
-        glTexSubImage2D(
-            GL_TEXTURE_2D, 0, 0, 0,
-            self.width, self.height,
-            GL_RGBA, GL_FLOAT,
-            data
-        )
+        
+        if upload_buffer is not None and upload_buffer.is_persistent:
+            # Copy into the mapped buffer (flipping rows if requested)
+            nbytes = self.width * self.height * 4 * np.dtype(np_type).itemsize
+            offset, mapped = upload_buffer.reserve(nbytes, alignment=16)
+            np.copyto(mapped.view(np_type).reshape(data.shape), data)
+            
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, upload_buffer.buffer_id)
+            self._upload_texture(gl_type, ctypes.c_void_p(offset), full_replace)
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+        else:
+            # Flipped rows and other dtypes are copied (converted in one pass)
+            data = np.ascontiguousarray(data, dtype=np_type)
+            self._upload_texture(gl_type, data, full_replace)
+        
         glBindTexture(GL_TEXTURE_2D, 0)
         
-        self.is_dirty = True
+        self.mark_dirty()
+    
+    def _upload_texture(self, gl_type: int, pixels, full_replace: bool):
+        """Upload the whole bound texture from client memory or a PBO offset."""
+        if full_replace:
+            # Same format and size, so the FBO attachment stays complete
+            glTexImage2D(
+                GL_TEXTURE_2D, 0, self.internal_format,
+                self.width, self.height, 0,
+                GL_RGBA, gl_type,
+                pixels
+            )
+        else:
+            glTexSubImage2D(
+                GL_TEXTURE_2D, 0, 0, 0,
+                self.width, self.height,
+                GL_RGBA, gl_type,
+                pixels
+            )
     
     def destroy(self):
         """Destroy OpenGL resources."""
+        global _bound_framebuffer
         if self.fbo_id is not None:
             glDeleteFramebuffers(1, [self.fbo_id])
+            if _bound_framebuffer == self.fbo_id:
+                # Deleting a bound framebuffer reverts to the default one
+                _bound_framebuffer = 0
             self.fbo_id = None
         
         if self.texture_id is not None:
             glDeleteTextures([self.texture_id])
             self.texture_id = None
+        
+        if self._pack_buffers is not None:
+            glDeleteBuffers(2, self._pack_buffers)
+            self._pack_buffers = None
+            self._pack_pending = [False, False]
 
 
 class FBOManager:
@@ -173,7 +447,8 @@ class FBOManager:
     Manages per-frame FBOs with LRU caching.
     
     Creates FBOs lazily on first stroke and maintains an LRU cache
-    to limit memory usage with many frames.
+    to limit memory usage with many frames. Evicted FBOs are cleared and
+    reused for the next frame rather than destroyed.
     """
     
     def __init__(self, max_cached_frames: int = 50):
@@ -184,8 +459,11 @@ class FBOManager:
             max_cached_frames: Maximum number of frames to keep in cache
         """
         self.max_cached_frames = max_cached_frames
-        self.fbos: OrderedDict[int, FBO] = OrderedDict()
+        self.fbos: Dict[int, FBO] = {}  # In LRU order, most recently used last
+        self._last_frame: Optional[int] = None  # Last key of fbos, if known
         self.current_size: Optional[Tuple[int, int]] = None
+        self._free_pool: List[FBO] = []  # Cleared FBOs of current_size, ready for reuse
+        self._upload_buffer: Optional[StreamBuffer] = None  # Pixel upload ring, created on first use
     
     def get_or_create_fbo(self, frame: int, width: int, height: int) -> FBO:
         """
@@ -201,28 +479,71 @@ class FBOManager:
         """
         # Check if size changed (source image changed)
         if self.current_size != (width, height):
-            # Clear all FBOs (size mismatch)
-            self.clear_all()
+            # Cached and pooled FBOs and the upload buffer have the old
+            # size, so none of them can be reused
+            self.destroy_all()
             self.current_size = (width, height)
         
         # Check if FBO exists
-        if frame in self.fbos:
-            # Move to end (most recently used)
-            self.fbos.move_to_end(frame)
-            return self.fbos[frame]
+        fbo = self._touch(frame)
+        if fbo is not None:
+            return fbo
+        
+        # Enforce cache size limit (LRU eviction), keeping evicted FBOs
+        # for reuse instead of reallocating their storage
+        while self.fbos and len(self.fbos) >= self.max_cached_frames:
+            # Remove oldest (least recently used)
+            oldest_fbo = self.fbos.pop(next(iter(self.fbos)))
+            oldest_fbo.clear()
+            self._free_pool.append(oldest_fbo)
         
-        # Create new FBO
-        fbo = FBO(width, height)
+        # Reuse a pooled FBO, or create a new one
+        fbo = self._free_pool.pop() if self._free_pool else FBO(width, height)
         self.fbos[frame] = fbo
+        self._last_frame = frame
         
-        # Enforce cache size limit (LRU eviction)
-        while len(self.fbos) > self.max_cached_frames:
-            # Remove oldest (least recently used)
-            oldest_frame, oldest_fbo = self.fbos.popitem(last=False)
-            oldest_fbo.destroy()
+        return fbo
+    
+    def _touch(self, frame: int) -> Optional[FBO]:
+        """
+        Mark frame as most recently used.
+        
+        Dicts keep insertion order, so the FBO is reinserted at the end,
+        unless it already is the last entry (repeated lookups of the frame
+        being painted).
         
+        Returns:
+            FBO for frame, or None if there is none
+        """
+        fbo = self.fbos.get(frame)
+        if fbo is not None and frame != self._last_frame:
+            del self.fbos[frame]
+            self.fbos[frame] = fbo
+            self._last_frame = frame
         return fbo
     
+    def get_upload_buffer(self) -> StreamBuffer:
+        """
+        Get the pixel upload buffer for FBO.upload_pixels.
+        
+        A ring of persistently mapped segments, each holding one full
+        canvas of float RGBA pixels, shared by all FBOs of the current size.
+        
+        Returns:
+            GL_PIXEL_UNPACK_BUFFER stream for the current canvas size
+        """
+        if self._upload_buffer is None:
+            width, height = self.current_size
+            # Room to align each canvas to 16 bytes within its segment
+            self._upload_buffer = StreamBuffer(GL_PIXEL_UNPACK_BUFFER, width * height * 4 * 4 + 15)
+        return self._upload_buffer
+    
+    def _destroy_upload_buffer(self):
+        """Destroy the pixel upload buffer, if created."""
+        if self._upload_buffer is not None:
+            self._upload_buffer.destroy()
+            self._upload_buffer = None
+    
     def has_fbo(self, frame: int) -> bool:
         """
         Check if FBO exists for frame.
@@ -235,6 +556,19 @@ class FBOManager:
         """
         return frame in self.fbos
     
+    def is_frame_dirty(self, frame: int) -> bool:
+        """
+        Check if frame has strokes to composite, without touching the LRU order.
+        
+        Args:
+            frame: Frame number
+        
+        Returns:
+            True if an FBO exists for frame and has been drawn to
+        """
+        fbo = self.fbos.get(frame)
+        return fbo is not None and fbo.is_dirty
+    
     def get_fbo(self, frame: int) -> Optional[FBO]:
         """
         Get FBO for frame without creating.
@@ -245,10 +579,7 @@ class FBOManager:
         Returns:
             FBO if exists, None otherwise
         """
-        if frame in self.fbos:
-            self.fbos.move_to_end(frame)
-            return self.fbos[frame]
-        return None
+        return self._touch(frame)
     
     def clear_frame(self, frame: int):
         """
@@ -270,19 +601,34 @@ class FBOManager:
         if frame in self.fbos:
             fbo = self.fbos.pop(frame)
             fbo.destroy()
+            if frame == self._last_frame:
+                self._last_frame = None
     
     def clear_all(self):
         """Clear all FBOs."""
-        for fbo in self.fbos.values():
-            fbo.clear()
+        # Clean FBOs are already transparent
+        dirty = [fbo for fbo in self.fbos.values() if fbo.is_dirty]
+        for fbo in dirty:
+            fbo.clear(unbind=False)
+        if dirty:
+            _unbind_framebuffer()
     
     def destroy_all(self):
         """Destroy all FBOs and free GPU memory."""
         for fbo in self.fbos.values():
             fbo.destroy()
         self.fbos.clear()
+        self._last_frame = None
+        self._destroy_pool()
+        self._destroy_upload_buffer()
         self.current_size = None
     
+    def _destroy_pool(self):
+        """Destroy the FBOs kept for reuse."""
+        for fbo in self._free_pool:
+            fbo.destroy()
+        self._free_pool.clear()
+    
     def get_memory_usage(self) -> int:
         """
         Estimate memory usage in bytes.
@@ -290,12 +636,6 @@ class FBOManager:
         Returns:
             Estimated GPU memory usage
         """
-        if not self.current_size:
-            return 0
-        
-        width, height = self.current_size
-        bytes_per_pixel = 4 * 4  # RGBA32F = 4 channels * 4 bytes
-        bytes_per_fbo = width * height * bytes_per_pixel
-        
-        return len(self.fbos) * bytes_per_fbo
+        fbos = list(self.fbos.values()) + self._free_pool
+        return sum(fbo.width * fbo.height * fbo.bytes_per_pixel for fbo in fbos)
 
@@ -2,10 +2,23 @@
 GLSL shader compilation and management.
 """
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
 from pathlib import Path
+import hashlib
+import numpy as np
 from OpenGL.GL import *
-from OpenGL.GL.shaders import compileProgram, compileShader
+
+try:
+    from OpenGL.GL.KHR.parallel_shader_compile import (
+        glMaxShaderCompilerThreadsKHR, GL_COMPLETION_STATUS_KHR
+    )
+except ImportError:
+    glMaxShaderCompilerThreadsKHR = None
+    GL_COMPLETION_STATUS_KHR = None
+
+
+# Linked program binaries saved across sessions (GL_ARB_get_program_binary)
+_BINARY_CACHE_DIR = Path.home() / ".rv" / "BrushStudio" / "shader_cache"
 
 
 class ShaderManager:
@@ -15,10 +28,32 @@ class ShaderManager:
     Compiles and caches shader programs for efficient reuse.
     """
     
-    def __init__(self):
-        """Initialize shader manager."""
+    def __init__(self, binary_cache_dir: Optional[Path] = _BINARY_CACHE_DIR):
+        """
+        Initialize shader manager.
+        
+        Args:
+            binary_cache_dir: Directory for linked program binaries, or
+                              None to always compile from source
+        """
         self.programs: Dict[str, int] = {}
         self.shader_dir = Path(__file__).parent / "shaders"
+        self.binary_cache_dir = binary_cache_dir
+        
+        # Programs per (vertex source, fragment source), so identical
+        # sources under different names are compiled once
+        self._source_cache: Dict[Tuple[str, str], int] = {}
+        
+        # Programs whose compile and link may still be running in the
+        # driver: program -> (vertex shader, fragment shader, binary path)
+        self._pending: Dict[int, Tuple[int, int, Optional[Path]]] = {}
+        self._parallel_compile_checked = False
+        
+        # Last value sent per (program, uniform location), to skip redundant uploads
+        self._uniform_values: Dict[Tuple[int, int], object] = {}
+        # Uniform locations per (program, uniform name); fixed once linked
+        self._uniform_locations: Dict[Tuple[int, str], int] = {}
+        self._current_program: Optional[int] = 0
     
     def load_shader_file(self, filename: str) -> str:
         """
@@ -76,6 +111,21 @@ class ShaderManager:
         
         return program
     
+    def precompile(self, shaders: Iterable[Tuple[str, str, str]]):
+        """
+        Compile several shader programs up front.
+        
+        Front-loads driver compile and link time so that later
+        compile_shader_from_file calls for the same names are cache hits.
+        With KHR_parallel_shader_compile the programs compile concurrently
+        in driver threads.
+        
+        Args:
+            shaders: (vertex_file, fragment_file, program_name) tuples
+        """
+        for vertex_file, fragment_file, program_name in shaders:
+            self.compile_shader_from_file(vertex_file, fragment_file, program_name)
+    
     def compile_shader_from_source(
         self,
         vertex_source: str,
@@ -84,29 +134,180 @@ class ShaderManager:
         """
         Compile shader program from source code.
         
+        Programs are cached by source, and restored from a saved program
+        binary when one exists for these sources and this driver.
+        
+        Compile and link are only started here; their status is checked
+        (blocking if the driver is still busy) when the program is first
+        used or queried, so several programs can compile in parallel.
+        Compilation errors are therefore raised by use_program or
+        get_uniform_location (or finish_program).
+        
         Args:
             vertex_source: Vertex shader source
             fragment_source: Fragment shader source
         
         Returns:
-            Compiled shader program ID
+            Shader program ID
         """
-        try:
-            # Compile shaders
-            vertex_shader = compileShader(vertex_source, GL_VERTEX_SHADER)
-            fragment_shader = compileShader(fragment_source, GL_FRAGMENT_SHADER)
-            
-            # Link program
-            program = compileProgram(vertex_shader, fragment_shader)
-            
-            # Clean up individual shaders (no longer needed after linking)
-            glDeleteShader(vertex_shader)
-            glDeleteShader(fragment_shader)
-            
+        key = (vertex_source, fragment_source)
+        program = self._source_cache.get(key)
+        if program is not None:
             return program
         
-        except Exception as e:
-            raise RuntimeError(f"Shader compilation failed: {e}")
+        binary_path = self._binary_path(vertex_source, fragment_source)
+        program = self._load_program_binary(binary_path) if binary_path else None
+        if program is None:
+            program = self._start_program(vertex_source, fragment_source, binary_path)
+        
+        self._source_cache[key] = program
+        return program
+    
+    def _start_program(self, vertex_source: str, fragment_source: str,
+                       binary_path: Optional[Path]) -> int:
+        """Start compiling and linking a program without waiting for it."""
+        if not self._parallel_compile_checked:
+            self._parallel_compile_checked = True
+            if glMaxShaderCompilerThreadsKHR is not None and bool(glMaxShaderCompilerThreadsKHR):
+                # Let the driver pick the number of compiler threads
+                glMaxShaderCompilerThreadsKHR(0xFFFFFFFF)
+        
+        shaders = []
+        for source, shader_type in ((vertex_source, GL_VERTEX_SHADER),
+                                    (fragment_source, GL_FRAGMENT_SHADER)):
+            shader = glCreateShader(shader_type)
+            glShaderSource(shader, source)
+            glCompileShader(shader)
+            shaders.append(shader)
+        
+        program = glCreateProgram()
+        for shader in shaders:
+            glAttachShader(program, shader)
+        if binary_path:
+            # Some drivers only keep a retrievable binary when asked to
+            glProgramParameteri(program, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
+        glLinkProgram(program)
+        
+        self._pending[program] = (shaders[0], shaders[1], binary_path)
+        return program
+    
+    def is_program_ready(self, program: int) -> bool:
+        """
+        Check without blocking whether a program has finished compiling.
+        
+        Always True without KHR_parallel_shader_compile, as checking
+        would block anyway.
+        
+        Args:
+            program: Program ID
+        """
+        if program not in self._pending or GL_COMPLETION_STATUS_KHR is None:
+            return True
+        return bool(glGetProgramiv(program, GL_COMPLETION_STATUS_KHR))
+    
+    def finish_program(self, program: int):
+        """
+        Wait for a program to finish compiling and linking, and check it.
+        
+        Does nothing for programs that are already finished.
+        
+        Args:
+            program: Program ID
+        """
+        pending = self._pending.pop(program, None)
+        if pending is None:
+            return
+        vertex_shader, fragment_shader, binary_path = pending
+        
+        error = None
+        if not glGetProgramiv(program, GL_LINK_STATUS):
+            # Report the first failing stage
+            error = glGetProgramInfoLog(program)
+            for shader in (vertex_shader, fragment_shader):
+                if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+                    error = glGetShaderInfoLog(shader)
+                    break
+        
+        # Clean up individual shaders (no longer needed after linking)
+        for shader in (vertex_shader, fragment_shader):
+            glDetachShader(program, shader)
+            glDeleteShader(shader)
+        
+        if error is not None:
+            # Forget the program so a later compile call retries
+            self.programs = {name: p for name, p in self.programs.items() if p != program}
+            self._source_cache = {key: p for key, p in self._source_cache.items() if p != program}
+            glDeleteProgram(program)
+            raise RuntimeError(f"Shader compilation failed: {error}")
+        
+        if binary_path:
+            self._save_program_binary(program, binary_path)
+    
+    def _binary_path(self, vertex_source: str, fragment_source: str) -> Optional[Path]:
+        """
+        Path of the saved program binary for these sources.
+        
+        Binaries are only valid for the driver that produced them, so the
+        key includes the GL vendor, renderer and version strings.
+        
+        Returns:
+            Binary file path, or None if binaries are not supported or
+            the cache is disabled
+        """
+        if self.binary_cache_dir is None or not bool(glProgramBinary):
+            return None
+        
+        digest = hashlib.sha1()
+        for part in (glGetString(GL_VENDOR), glGetString(GL_RENDERER), glGetString(GL_VERSION)):
+            digest.update(part or b'')
+            digest.update(b'\x00')
+        digest.update(vertex_source.encode())
+        digest.update(b'\x00')
+        digest.update(fragment_source.encode())
+        return self.binary_cache_dir / f"{digest.hexdigest()}.bin"
+    
+    def _load_program_binary(self, path: Path) -> Optional[int]:
+        """
+        Create a program from a saved binary.
+        
+        Returns:
+            Program ID, or None if there is no binary or the driver
+            rejects it (e.g. after a driver update)
+        """
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if len(data) <= 4:
+            return None
+        
+        # First 4 bytes hold the binary format
+        binary_format = int(np.frombuffer(data, dtype=np.uint32, count=1)[0])
+        binary = np.frombuffer(data, dtype=np.uint8, offset=4)
+        
+        program = glCreateProgram()
+        glProgramBinary(program, binary_format, binary, len(binary))
+        if not glGetProgramiv(program, GL_LINK_STATUS):
+            glDeleteProgram(program)
+            return None
+        return program
+    
+    def _save_program_binary(self, program: int, path: Path):
+        """Save a linked program's binary, ignoring failures."""
+        length = int(glGetProgramiv(program, GL_PROGRAM_BINARY_LENGTH))
+        if length <= 0:
+            return
+        
+        written = np.zeros(1, dtype=np.int32)
+        binary_format = np.zeros(1, dtype=np.uint32)
+        binary = np.empty(length, dtype=np.uint8)
+        glGetProgramBinary(program, length, written, binary_format, binary)
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(binary_format.tobytes() + binary[:int(written[0])].tobytes())
+        except OSError:
+            pass
     
     def get_program(self, name: str) -> Optional[int]:
         """
@@ -122,17 +323,33 @@ class ShaderManager:
     
     def use_program(self, program: int):
         """
-        Activate shader program.
+        Activate shader program, skipping the call if it is already active.
         
         Args:
             program: Program ID
         """
+        if program == self._current_program:
+            return
+        if program in self._pending:
+            self.finish_program(program)
         glUseProgram(program)
+        self._current_program = program
+    
+    def invalidate_program(self):
+        """
+        Forget which program is active.
+        
+        Call when other code may have changed the program since the last
+        use_program, so the next use_program always binds.
+        """
+        self._current_program = None
     
     def get_uniform_location(self, program: int, name: str) -> int:
         """
         Get uniform location in shader program.
         
+        Locations are queried once per program and name, then cached.
+        
         Args:
             program: Program ID
             name: Uniform name
@@ -140,39 +357,100 @@ class ShaderManager:
         Returns:
             Uniform location
         """
-        location = glGetUniformLocation(program, name)
-        if location == -1:
-            # Warning: uniform not found (might be optimized out)
-            pass
+        key = (program, name)
+        location = self._uniform_locations.get(key)
+        if location is None:
+            self.finish_program(program)
+            location = glGetUniformLocation(program, name)
+            if location == -1:
+                # Warning: uniform not found (might be optimized out)
+                pass
+            self._uniform_locations[key] = location
         return location
     
     def set_uniform_float(self, program: int, name: str, value: float):
         """Set float uniform."""
-        location = self.get_uniform_location(program, name)
-        if location != -1:
-            glUniform1f(location, value)
+        self.set_uniform_float_loc(self.get_uniform_location(program, name), value)
     
     def set_uniform_int(self, program: int, name: str, value: int):
         """Set int uniform."""
-        location = self.get_uniform_location(program, name)
-        if location != -1:
-            glUniform1i(location, value)
+        self.set_uniform_int_loc(self.get_uniform_location(program, name), value)
     
     def set_uniform_vec4(self, program: int, name: str, value: tuple):
         """Set vec4 uniform."""
-        location = self.get_uniform_location(program, name)
-        if location != -1:
-            glUniform4f(location, value[0], value[1], value[2], value[3])
+        self.set_uniform_vec4_loc(self.get_uniform_location(program, name), value)
     
     def set_uniform_matrix4(self, program: int, name: str, matrix):
         """Set mat4 uniform."""
-        location = self.get_uniform_location(program, name)
-        if location != -1:
+        self.set_uniform_matrix4_loc(self.get_uniform_location(program, name), matrix)
+    
+    def set_uniform_matrix4_array(self, program: int, name: str, matrices: np.ndarray):
+        """Set mat4 array uniform."""
+        self.set_uniform_matrix4_array_loc(self.get_uniform_location(program, name), matrices)
+    
+    def _uniform_changed(self, location: int, value) -> bool:
+        """
+        Record a uniform value for the current program.
+        
+        Args:
+            location: Uniform location
+            value: Hashable/comparable form of the new value
+        
+        Returns:
+            True if the value differs from the last one sent
+        """
+        key = (self._current_program, location)
+        if self._uniform_values.get(key) == value:
+            return False
+        self._uniform_values[key] = value
+        return True
+    
+    def set_uniform_float_loc(self, location: int, value: float):
+        """Set float uniform of the current program by location."""
+        if location != -1 and self._uniform_changed(location, value):
+            glUniform1f(location, value)
+    
+    def set_uniform_int_loc(self, location: int, value: int):
+        """Set int uniform of the current program by location."""
+        if location != -1 and self._uniform_changed(location, value):
+            glUniform1i(location, value)
+    
+    def set_uniform_vec4_loc(self, location: int, value: tuple):
+        """Set vec4 uniform of the current program by location."""
+        if location != -1 and self._uniform_changed(location, tuple(value)):
+            glUniform4f(location, value[0], value[1], value[2], value[3])
+    
+    def set_uniform_matrix4_loc(self, location: int, matrix):
+        """Set mat4 uniform of the current program by location."""
+        if location != -1 and self._uniform_changed(location, np.asarray(matrix, dtype=np.float32).tobytes()):
             glUniformMatrix4fv(location, 1, GL_FALSE, matrix)
     
+    def set_uniform_matrix4_array_loc(self, location: int, matrices: np.ndarray):
+        """
+        Set mat4 array uniform of the current program by location.
+        
+        All matrices are uploaded in a single call.
+        
+        Args:
+            location: Location of the array's first element
+            matrices: Array of shape (K, 4, 4)
+        """
+        matrices = np.ascontiguousarray(matrices, dtype=np.float32)
+        if location != -1 and self._uniform_changed(location, matrices.tobytes()):
+            glUniformMatrix4fv(location, len(matrices), GL_FALSE, matrices)
+    
     def cleanup(self):
         """Delete all shader programs."""
-        for program in self.programs.values():
+        for vertex_shader, fragment_shader, _ in self._pending.values():
+            glDeleteShader(vertex_shader)
+            glDeleteShader(fragment_shader)
+        self._pending.clear()
+        
+        # Several names may share one program
+        for program in set(self.programs.values()) | set(self._source_cache.values()):
             glDeleteProgram(program)
         self.programs.clear()
+        self._source_cache.clear()
+        self._uniform_values.clear()
+        self._uniform_locations.clear()
 
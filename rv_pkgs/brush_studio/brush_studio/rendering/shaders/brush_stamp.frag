@@ -2,12 +2,13 @@
 
 // Input from vertex shader
 in vec2 uv;         // Texture coordinates (0-1)
+in vec2 atlas_uv;   // Texture coordinates in the brush atlas
 in float opacity;    // Opacity for this stamp
 
 // Uniforms
 uniform vec4 brush_color;    // RGBA brush color
 uniform float hardness;      // Edge hardness (0.0 = soft, 1.0 = hard)
-uniform sampler2D brush_texture;  // Optional brush texture
+uniform sampler2D brush_texture;  // Optional brush texture atlas
 uniform int use_texture;     // Whether to use texture (0 or 1)
 
 // Output
@@ -19,7 +20,7 @@ void main() {
     // Use texture if enabled, otherwise use circular falloff
     if (use_texture == 1) {
         // Use texture as primary alpha source
-        vec4 tex_color = texture(brush_texture, uv);
+        vec4 tex_color = texture(brush_texture, atlas_uv);
         alpha = tex_color.r;  // Texture is single-channel (red)
     } else {
         // Calculate distance from center
@@ -49,6 +50,11 @@ void main() {
     // Apply opacity modulation
     alpha *= opacity;
     
+    // Skip the blend for pixels the stamp leaves unchanged
+    if (alpha <= 0.0) {
+        discard;
+    }
+    
     // Final color
     fragColor = vec4(brush_color.rgb, brush_color.a * alpha);
 }
@@ -1,16 +1,18 @@
 #version 330 core
 
-// Vertex attributes
+// Vertex attributes (brush_* are per-instance, one instance per stamp)
 layout(location = 0) in vec2 position;       // Quad corners (-0.5 to 0.5)
 layout(location = 1) in vec2 brush_center;   // Stamp center in normalized space
 layout(location = 2) in float brush_size;    // Pressure-modulated size
 layout(location = 3) in float brush_opacity; // Pressure-modulated opacity
+layout(location = 4) in vec4 brush_uv_rect;  // Brush tile in the texture atlas (u0, v0, u1, v1)
 
 // Uniforms
 uniform mat4 projection;  // Orthographic projection matrix
 
 // Output to fragment shader
 out vec2 uv;           // Texture coordinates (0-1)
+out vec2 atlas_uv;     // Texture coordinates in the brush atlas
 out float opacity;      // Opacity for this stamp
 
 void main() {
@@ -25,6 +27,7 @@ void main() {
     // Pass texture coordinates to fragment shader
     // Map from [-0.5, 0.5] to [0, 1]
     uv = position + vec2(0.5);
+    atlas_uv = mix(brush_uv_rect.xy, brush_uv_rect.zw, uv);
     
     // Pass opacity to fragment shader
     opacity = brush_opacity;
@@ -0,0 +1,16 @@
+#version 330 core
+
+// Vertex attributes
+layout(location = 0) in vec2 position;   // Canvas corner in screen space
+layout(location = 1) in vec2 tex_coord;  // Canvas texture coordinates (0-1)
+
+// Uniforms
+uniform mat4 projection;  // Screen-space orthographic projection
+
+// Output to fragment shader
+out vec2 uv;  // Texture coordinates (0-1)
+
+void main() {
+    gl_Position = projection * vec4(position, 0.0, 1.0);
+    uv = tex_coord;
+}
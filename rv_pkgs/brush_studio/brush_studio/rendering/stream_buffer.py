@@ -0,0 +1,157 @@
+"""
+Streaming buffer for per-flush GPU uploads (vertex data, pixels).
+
+Uses a persistently mapped ring buffer when the context supports
+buffer storage (GL 4.4 / ARB_buffer_storage), so uploads are plain
+memory writes with no driver-side copy.
+"""
+
+from typing import List, Optional, Tuple
+import ctypes
+import numpy as np
+from OpenGL.GL import *
+
+
+# Size of each ring segment in bytes (the largest single write)
+_SEGMENT_BYTES = 1 << 20
+
+# Number of ring segments; one is written while the GPU reads the others
+_SEGMENT_COUNT = 3
+
+# Maximum time to wait for the GPU to release a segment (nanoseconds)
+_FENCE_TIMEOUT_NS = 1000000000
+
+
+class StreamBuffer:
+    """
+    Buffer that streams data written once and used once, by default
+    vertex data bound as GL_ARRAY_BUFFER.
+    
+    With buffer storage, the buffer is mapped persistently and coherently
+    and split into segments used round-robin. A fence is placed when a
+    segment is left, and waited on before that segment is written again.
+    Without buffer storage, each write orphans the buffer via glBufferData.
+    """
+    
+    def __init__(self, target: int = GL_ARRAY_BUFFER, segment_size: int = _SEGMENT_BYTES):
+        """
+        Create the buffer (requires a current GL context).
+        
+        Args:
+            target: Buffer binding target (e.g. GL_PIXEL_UNPACK_BUFFER)
+            segment_size: Size of each ring segment in bytes (the largest single write)
+        """
+        self.buffer_id = glGenBuffers(1)
+        self.target = target
+        self.segment_size = segment_size
+        self.is_persistent = bool(glBufferStorage)
+        self._direct_state_access = bool(glNamedBufferData)
+        
+        self._mapped: Optional[np.ndarray] = None
+        self._fences: List = [None] * _SEGMENT_COUNT
+        self._segment = 0
+        self._offset = 0
+        
+        if self.is_persistent:
+            self._create_persistent()
+        else:
+            # Create the buffer object so it can be used without binding
+            glBindBuffer(self.target, self.buffer_id)
+            glBindBuffer(self.target, 0)
+    
+    def _create_persistent(self):
+        """Allocate immutable storage and map it for the buffer's lifetime."""
+        size = self.segment_size * _SEGMENT_COUNT
+        flags = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+        
+        glBindBuffer(self.target, self.buffer_id)
+        glBufferStorage(self.target, size, None, flags)
+        pointer = glMapBufferRange(self.target, 0, size, flags)
+        glBindBuffer(self.target, 0)
+        
+        address = ctypes.cast(pointer, ctypes.c_void_p).value
+        self._mapped = np.ctypeslib.as_array((ctypes.c_ubyte * size).from_address(address))
+    
+    def write(self, data: np.ndarray, alignment: int = 1) -> int:
+        """
+        Write data for the next draw.
+        
+        Args:
+            data: Contiguous array of at most segment_size - (alignment - 1) bytes
+            alignment: Byte alignment of the returned offset (e.g. vertex stride)
+        
+        Returns:
+            Byte offset of the data within the buffer
+        """
+        nbytes = data.nbytes
+        if nbytes + alignment - 1 > self.segment_size:
+            raise ValueError(f"Write of {nbytes} bytes exceeds segment size {self.segment_size}")
+        
+        if not self.is_persistent:
+            if self._direct_state_access:
+                glNamedBufferData(self.buffer_id, nbytes, data, GL_STREAM_DRAW)
+            else:
+                glBindBuffer(self.target, self.buffer_id)
+                glBufferData(self.target, nbytes, data, GL_STREAM_DRAW)
+                glBindBuffer(self.target, 0)
+            return 0
+        
+        offset, mapped = self.reserve(nbytes, alignment)
+        mapped[:] = data.reshape(-1).view(np.uint8)
+        return offset
+    
+    def reserve(self, nbytes: int, alignment: int = 1) -> Tuple[int, np.ndarray]:
+        """
+        Reserve mapped memory for the next use, to be filled in place.
+        
+        Only available for persistent buffers (is_persistent).
+        
+        Args:
+            nbytes: Number of bytes, at most segment_size - (alignment - 1)
+            alignment: Byte alignment of the returned offset
+        
+        Returns:
+            Tuple of (byte offset within the buffer, uint8 view of the
+            reserved mapped memory)
+        """
+        if nbytes + alignment - 1 > self.segment_size:
+            raise ValueError(f"Write of {nbytes} bytes exceeds segment size {self.segment_size}")
+        
+        offset = -(-self._offset // alignment) * alignment
+        if offset + nbytes > (self._segment + 1) * self.segment_size:
+            self._next_segment()
+            offset = -(-self._offset // alignment) * alignment
+        
+        self._offset = offset + nbytes
+        return offset, self._mapped[offset:offset + nbytes]
+    
+    def _next_segment(self):
+        """Fence the current segment and move to the next free one."""
+        self._fences[self._segment] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+        self._segment = (self._segment + 1) % _SEGMENT_COUNT
+        
+        # Wait until the GPU has finished drawing from the segment
+        fence = self._fences[self._segment]
+        if fence is not None:
+            glClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, _FENCE_TIMEOUT_NS)
+            glDeleteSync(fence)
+            self._fences[self._segment] = None
+        
+        self._offset = self._segment * self.segment_size
+    
+    def destroy(self):
+        """Destroy OpenGL resources."""
+        for fence in self._fences:
+            if fence is not None:
+                glDeleteSync(fence)
+        self._fences = [None] * _SEGMENT_COUNT
+        
+        if self._mapped is not None:
+            glBindBuffer(self.target, self.buffer_id)
+            glUnmapBuffer(self.target)
+            glBindBuffer(self.target, 0)
+            self._mapped = None
+        
+        if self.buffer_id is not None:
+            glDeleteBuffers(1, [self.buffer_id])
+            self.buffer_id = None
@@ -4,8 +4,13 @@ Distance sensor for stroke progression.
 Reads accumulated distance traveled and can create fade effects.
 """
 
+import numpy as np
 from brush_studio.sensors.sensor_base import BaseSensor
-from brush_studio.models.sensor_data import SensorData
+from brush_studio.models.sensor_data import SensorData, SENSOR_FIELDS
+
+
+# Column of the reading in batched sensor readings
+_DISTANCE = SENSOR_FIELDS.index('distance')
 
 
 class DistanceSensor(BaseSensor):
@@ -34,6 +39,25 @@ class DistanceSensor(BaseSensor):
         self.max_distance = max_distance
         self.mode = mode
     
+    @property
+    def max_distance(self) -> float:
+        """Distance value that maps to 1.0 (pixels)."""
+        return self._max_distance
+    
+    @max_distance.setter
+    def max_distance(self, value: float):
+        self._inv_max_distance = self._reciprocal('max_distance', value)
+        self._max_distance = value
+    
+    @property
+    def mode(self) -> str:
+        """How distance is interpreted ('linear', 'fade' or 'periodic')."""
+        return self._mode
+    
+    @mode.setter
+    def mode(self, mode: str):
+        self._bind_mode(mode, self._MODES, 'linear')
+    
     def compute(self, sensor_data: SensorData) -> float:
         """
         Compute distance value from sensor data.
@@ -44,18 +68,46 @@ class DistanceSensor(BaseSensor):
         Returns:
             Distance-based value 0.0-1.0
         """
-        # Normalize distance to 0-1 range
-        normalized = sensor_data.distance / self.max_distance
-        
-        if self.mode == 'fade':
-            # Inverse: 1.0 at start, 0.0 at max_distance
-            return max(0.0, 1.0 - normalized)
+        return self._mode_compute(self, sensor_data)
+    
+    def compute_batch(self, readings: np.ndarray) -> np.ndarray:
+        """
+        Compute distance values for many samples at once.
         
-        elif self.mode == 'periodic':
-            # Cycle from 0 to 1 repeatedly
-            return normalized % 1.0
+        Args:
+            readings: Array of shape (N, len(SENSOR_FIELDS)), see BaseSensor.compute_batch
         
-        else:  # linear
-            # Direct mapping, clamped to 0-1
-            return max(0.0, min(1.0, normalized))
-
+        Returns:
+            Array of N distance-based values 0.0-1.0
+        """
+        return self._mode_compute_batch(self, readings)
+    
+    def _compute_linear(self, sensor_data: SensorData) -> float:
+        """Direct mapping, clamped to 0-1."""
+        return max(0.0, min(1.0, sensor_data.distance * self._inv_max_distance))
+    
+    def _compute_fade(self, sensor_data: SensorData) -> float:
+        """Inverse: 1.0 at start, 0.0 at max_distance."""
+        return max(0.0, 1.0 - sensor_data.distance * self._inv_max_distance)
+    
+    def _compute_periodic(self, sensor_data: SensorData) -> float:
+        """Cycle from 0 to 1 repeatedly."""
+        return (sensor_data.distance * self._inv_max_distance) % 1.0
+    
+    def _compute_linear_batch(self, readings: np.ndarray) -> np.ndarray:
+        """Batched _compute_linear."""
+        return np.clip(readings[:, _DISTANCE] * self._inv_max_distance, 0.0, 1.0)
+    
+    def _compute_fade_batch(self, readings: np.ndarray) -> np.ndarray:
+        """Batched _compute_fade."""
+        return np.maximum(0.0, 1.0 - readings[:, _DISTANCE] * self._inv_max_distance)
+    
+    def _compute_periodic_batch(self, readings: np.ndarray) -> np.ndarray:
+        """Batched _compute_periodic."""
+        return (readings[:, _DISTANCE] * self._inv_max_distance) % 1.0
+    
+    _MODES = {
+        'linear': (_compute_linear, _compute_linear_batch),
+        'fade': (_compute_fade, _compute_fade_batch),
+        'periodic': (_compute_periodic, _compute_periodic_batch),
+    }
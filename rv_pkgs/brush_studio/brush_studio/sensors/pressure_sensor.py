@@ -4,8 +4,13 @@ Pressure sensor for stylus input.
 Reads pressure from stylus/tablet and modulates brush parameters.
 """
 
+import numpy as np
 from brush_studio.sensors.sensor_base import BaseSensor
-from brush_studio.models.sensor_data import SensorData
+from brush_studio.models.sensor_data import SensorData, SENSOR_FIELDS
+
+
+# Column of the reading in batched sensor readings
+_PRESSURE = SENSOR_FIELDS.index('pressure')
 
 
 class PressureSensor(BaseSensor):
@@ -28,4 +33,16 @@ class PressureSensor(BaseSensor):
         """
         # Clamp pressure to valid range
         return max(0.0, min(1.0, sensor_data.pressure))
+    
+    def compute_batch(self, readings: np.ndarray) -> np.ndarray:
+        """
+        Compute pressure values for many samples at once.
+        
+        Args:
+            readings: Array of shape (N, len(SENSOR_FIELDS)), see BaseSensor.compute_batch
+        
+        Returns:
+            Array of N pressure values 0.0-1.0
+        """
+        return np.clip(readings[:, _PRESSURE], 0.0, 1.0)
 
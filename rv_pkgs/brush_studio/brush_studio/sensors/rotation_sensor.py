@@ -4,8 +4,16 @@ Rotation sensor for stylus barrel rotation.
 Reads barrel rotation angle and can rotate brush accordingly.
 """
 
+import numpy as np
 from brush_studio.sensors.sensor_base import BaseSensor
-from brush_studio.models.sensor_data import SensorData
+from brush_studio.models.sensor_data import SensorData, SENSOR_FIELDS
+
+
+# Column of the reading in batched sensor readings
+_ROTATION = SENSOR_FIELDS.index('rotation')
+
+# Scale from degrees to the 0-1 range (multiplied rather than divided)
+_INV_360 = 1.0 / 360.0
 
 
 class RotationSensor(BaseSensor):
@@ -28,7 +36,19 @@ class RotationSensor(BaseSensor):
         """
         # Normalize rotation from 0-360 degrees to 0-1 range
         rotation = sensor_data.rotation % 360.0
-        return rotation / 360.0
+        return rotation * _INV_360
+    
+    def compute_batch(self, readings: np.ndarray) -> np.ndarray:
+        """
+        Compute rotation values for many samples at once.
+        
+        Args:
+            readings: Array of shape (N, len(SENSOR_FIELDS)), see BaseSensor.compute_batch
+        
+        Returns:
+            Array of N normalized rotations 0.0-1.0
+        """
+        return readings[:, _ROTATION] % 360.0 * _INV_360
     
     def get_rotation_degrees(self, sensor_data: SensorData) -> float:
         """
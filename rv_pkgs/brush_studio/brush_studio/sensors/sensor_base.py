@@ -5,9 +5,19 @@ All sensors inherit from BaseSensor and implement the compute() method.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Callable
+from typing import Dict, Optional, Callable, Tuple
+import numpy as np
 from brush_studio.models.sensor_data import SensorData
 
+try:
+    import numba
+except ImportError:
+    numba = None  # numba not available, curves over arrays use numpy
+
+
+# Points at which arbitrary curves are sampled to evaluate them over arrays
+_CURVE_SAMPLES = np.linspace(0.0, 1.0, 1024)
+
 
 class BaseSensor(ABC):
     """
@@ -34,6 +44,7 @@ class BaseSensor(ABC):
         self.enabled = enabled
         self.strength = strength
         self.curve = curve or self._linear_curve
+        self._curve_table = None  # (curve, samples) for apply_curve_batch
     
     @abstractmethod
     def compute(self, sensor_data: SensorData) -> float:
@@ -48,6 +59,60 @@ class BaseSensor(ABC):
         """
         pass
     
+    def compute_batch(self, readings: np.ndarray) -> np.ndarray:
+        """
+        Compute sensor values for many samples at once.
+        
+        Subclasses override this with a vectorized version; the default
+        calls compute() per sample.
+        
+        Args:
+            readings: Array of shape (N, len(SENSOR_FIELDS)), one row of
+                      readings per sample in SENSOR_FIELDS column order
+                      (as BrushStroke.sensors)
+        
+        Returns:
+            Array of N normalized values 0.0-1.0
+        """
+        return np.array([self.compute(SensorData(*row)) for row in readings.tolist()])
+    
+    @staticmethod
+    def _reciprocal(name: str, value: float) -> float:
+        """
+        Validate a normalization range and return its reciprocal.
+        
+        Sensors keep the reciprocal of their range so that computes
+        multiply instead of divide.
+        
+        Args:
+            name: Parameter name, for the error message
+            value: Range value that maps to 1.0
+        
+        Returns:
+            1.0 / value
+        """
+        if value <= 0:
+            raise ValueError(f"{name} must be positive, got {value}")
+        return 1.0 / value
+    
+    def _bind_mode(self, mode: str, modes: Dict[str, Tuple[Callable, Callable]], default: str):
+        """
+        Select the compute functions for a sensor mode.
+        
+        Sensors with modes pick their functions once, when the mode is
+        set, instead of comparing the mode string on every compute call.
+        The functions are kept unbound (avoiding a reference cycle through
+        bound methods) and called with the sensor as first argument, as
+        self._mode_compute(self, ...) and self._mode_compute_batch(self, ...).
+        
+        Args:
+            mode: Mode name
+            modes: Mode name -> (compute function, compute_batch function)
+            default: Mode whose functions are used for unknown mode names
+        """
+        self._mode = mode
+        self._mode_compute, self._mode_compute_batch = modes.get(mode, modes[default])
+    
     def get_value(self, sensor_data: SensorData) -> float:
         """
         Get final sensor value with curve and strength applied.
@@ -71,6 +136,45 @@ class BaseSensor(ABC):
         # Strength interpolates between no effect (1.0) and full effect (curved_value)
         return 1.0 + (curved_value - 1.0) * self.strength
     
+    def get_values_batch(self, readings: np.ndarray) -> np.ndarray:
+        """
+        Get final sensor values for many samples, as get_value does for one.
+        
+        Args:
+            readings: Array of shape (N, len(SENSOR_FIELDS)), see compute_batch
+        
+        Returns:
+            Array of N final modulated values 0.0-1.0
+        """
+        if not self.enabled:
+            return np.ones(len(readings))  # No modulation
+        
+        curved_values = self.apply_curve_batch(self.compute_batch(readings))
+        return 1.0 + (curved_values - 1.0) * self.strength
+    
+    def apply_curve_batch(self, values: np.ndarray) -> np.ndarray:
+        """
+        Apply dynamics curve to an array of raw sensor values.
+        
+        The built-in curves are evaluated exactly; any other curve is
+        sampled once into a table and linearly interpolated.
+        
+        Args:
+            values: Raw sensor values 0.0-1.0
+        
+        Returns:
+            Curved values 0.0-1.0
+        """
+        batch_curve = _BATCH_CURVES.get(self.curve)
+        if batch_curve is not None:
+            return batch_curve(values)
+        
+        if self._curve_table is None or self._curve_table[0] is not self.curve:
+            samples = np.array([self.curve(value) for value in _CURVE_SAMPLES.tolist()])
+            self._curve_table = (self.curve, samples)
+        
+        return np.interp(values, _CURVE_SAMPLES, self._curve_table[1])
+    
     def apply_curve(self, value: float) -> float:
         """
         Apply dynamics curve to raw sensor value.
@@ -106,3 +210,36 @@ class BaseSensor(ABC):
         else:
             return 1.0 - 2.0 * (1.0 - value) * (1.0 - value)
 
+
+def _ease_in_out_batch(values: np.ndarray) -> np.ndarray:
+    """Ease-in-out curve over an array."""
+    return np.where(values < 0.5, 2.0 * values * values, 1.0 - 2.0 * (1.0 - values) * (1.0 - values))
+
+
+def _vectorize(curve: Callable[[float], float], fallback: Callable) -> Callable:
+    """
+    Get the array version of a scalar curve.
+    
+    With numba the scalar curve itself is compiled into a ufunc, which
+    evaluates in a single pass without numpy temporaries.
+    
+    Args:
+        curve: Scalar curve function
+        fallback: Numpy implementation used without numba
+    
+    Returns:
+        Function mapping an array of values to curved values
+    """
+    if numba is None:
+        return fallback
+    return numba.vectorize(cache=True)(curve)
+
+
+# Array versions of the built-in curves, keyed by the scalar curve
+_BATCH_CURVES = {
+    BaseSensor._linear_curve: BaseSensor._linear_curve,
+    BaseSensor.ease_in_curve: _vectorize(BaseSensor.ease_in_curve, BaseSensor.ease_in_curve),
+    BaseSensor.ease_out_curve: _vectorize(BaseSensor.ease_out_curve, BaseSensor.ease_out_curve),
+    BaseSensor.ease_in_out_curve: _vectorize(BaseSensor.ease_in_out_curve, _ease_in_out_batch),
+}
+
@@ -4,8 +4,13 @@ Speed sensor for drawing velocity.
 Reads drawing speed and can modulate brush opacity, size, etc.
 """
 
+import numpy as np
 from brush_studio.sensors.sensor_base import BaseSensor
-from brush_studio.models.sensor_data import SensorData
+from brush_studio.models.sensor_data import SensorData, SENSOR_FIELDS
+
+
+# Column of the reading in batched sensor readings
+_SPEED = SENSOR_FIELDS.index('speed')
 
 
 class SpeedSensor(BaseSensor):
@@ -29,6 +34,16 @@ class SpeedSensor(BaseSensor):
         super().__init__(**kwargs)
         self.max_speed = max_speed
     
+    @property
+    def max_speed(self) -> float:
+        """Speed value that maps to 1.0 (pixels/sec)."""
+        return self._max_speed
+    
+    @max_speed.setter
+    def max_speed(self, value: float):
+        self._inv_max_speed = self._reciprocal('max_speed', value)
+        self._max_speed = value
+    
     def compute(self, sensor_data: SensorData) -> float:
         """
         Compute speed value from sensor data.
@@ -40,8 +55,20 @@ class SpeedSensor(BaseSensor):
             Normalized speed 0.0-1.0
         """
         # Normalize speed to 0-1 range
-        normalized = sensor_data.speed / self.max_speed
+        normalized = sensor_data.speed * self._inv_max_speed
         
         # Clamp to 0-1
         return max(0.0, min(1.0, normalized))
+    
+    def compute_batch(self, readings: np.ndarray) -> np.ndarray:
+        """
+        Compute speed values for many samples at once.
+        
+        Args:
+            readings: Array of shape (N, len(SENSOR_FIELDS)), see BaseSensor.compute_batch
+        
+        Returns:
+            Array of N normalized speeds 0.0-1.0
+        """
+        return np.clip(readings[:, _SPEED] * self._inv_max_speed, 0.0, 1.0)
 
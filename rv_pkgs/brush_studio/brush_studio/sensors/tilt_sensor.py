@@ -5,8 +5,17 @@ Reads tilt angle from stylus and can modulate brush size, rotation, etc.
 """
 
 import math
+import numpy as np
 from brush_studio.sensors.sensor_base import BaseSensor
-from brush_studio.models.sensor_data import SensorData
+from brush_studio.models.sensor_data import SensorData, SENSOR_FIELDS
+
+
+# Columns of the readings in batched sensor readings
+_TILT_X = SENSOR_FIELDS.index('tilt_x')
+_TILT_Y = SENSOR_FIELDS.index('tilt_y')
+
+# Scale from tilt magnitude to the 0-1 range (max tilt is sqrt(2) ≈ 1.414)
+_INV_MAX_TILT = 1.0 / 1.414
 
 
 class TiltSensor(BaseSensor):
@@ -33,6 +42,15 @@ class TiltSensor(BaseSensor):
         super().__init__(**kwargs)
         self.mode = mode
     
+    @property
+    def mode(self) -> str:
+        """How tilt is computed ('magnitude', 'x' or 'y')."""
+        return self._mode
+    
+    @mode.setter
+    def mode(self, mode: str):
+        self._bind_mode(mode, self._MODES, 'magnitude')
+    
     def compute(self, sensor_data: SensorData) -> float:
         """
         Compute tilt value from sensor data.
@@ -43,19 +61,52 @@ class TiltSensor(BaseSensor):
         Returns:
             Tilt value 0.0-1.0
         """
-        if self.mode == 'x':
-            # X-axis tilt only (-1 to 1 -> 0 to 1)
-            return (sensor_data.tilt_x + 1.0) * 0.5
+        return self._mode_compute(self, sensor_data)
+    
+    def compute_batch(self, readings: np.ndarray) -> np.ndarray:
+        """
+        Compute tilt values for many samples at once.
         
-        elif self.mode == 'y':
-            # Y-axis tilt only (-1 to 1 -> 0 to 1)
-            return (sensor_data.tilt_y + 1.0) * 0.5
+        Args:
+            readings: Array of shape (N, len(SENSOR_FIELDS)), see BaseSensor.compute_batch
         
-        else:  # magnitude
-            # Total tilt magnitude (0 = vertical, 1 = fully tilted)
-            magnitude = math.sqrt(
-                sensor_data.tilt_x ** 2 + sensor_data.tilt_y ** 2
-            )
-            # Normalize to 0-1 range (max tilt is sqrt(2) ≈ 1.414)
-            return min(1.0, magnitude / 1.414)
-
+        Returns:
+            Array of N tilt values 0.0-1.0
+        """
+        return self._mode_compute_batch(self, readings)
+    
+    def _compute_magnitude(self, sensor_data: SensorData) -> float:
+        """Total tilt magnitude (0 = vertical, 1 = fully tilted)."""
+        magnitude = math.sqrt(
+            sensor_data.tilt_x ** 2 + sensor_data.tilt_y ** 2
+        )
+        # Normalize to 0-1 range
+        return min(1.0, magnitude * _INV_MAX_TILT)
+    
+    def _compute_x(self, sensor_data: SensorData) -> float:
+        """X-axis tilt only (-1 to 1 -> 0 to 1)."""
+        return (sensor_data.tilt_x + 1.0) * 0.5
+    
+    def _compute_y(self, sensor_data: SensorData) -> float:
+        """Y-axis tilt only (-1 to 1 -> 0 to 1)."""
+        return (sensor_data.tilt_y + 1.0) * 0.5
+    
+    def _compute_magnitude_batch(self, readings: np.ndarray) -> np.ndarray:
+        """Batched _compute_magnitude."""
+        tilt_x = readings[:, _TILT_X]
+        tilt_y = readings[:, _TILT_Y]
+        return np.minimum(1.0, np.sqrt(tilt_x * tilt_x + tilt_y * tilt_y) * _INV_MAX_TILT)
+    
+    def _compute_x_batch(self, readings: np.ndarray) -> np.ndarray:
+        """Batched _compute_x."""
+        return (readings[:, _TILT_X] + 1.0) * 0.5
+    
+    def _compute_y_batch(self, readings: np.ndarray) -> np.ndarray:
+        """Batched _compute_y."""
+        return (readings[:, _TILT_Y] + 1.0) * 0.5
+    
+    _MODES = {
+        'magnitude': (_compute_magnitude, _compute_magnitude_batch),
+        'x': (_compute_x, _compute_x_batch),
+        'y': (_compute_y, _compute_y_batch),
+    }
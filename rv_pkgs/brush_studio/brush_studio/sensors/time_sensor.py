@@ -5,8 +5,13 @@ Reads time since stroke start and can create time-based modulation.
 """
 
 import math
+import numpy as np
 from brush_studio.sensors.sensor_base import BaseSensor
-from brush_studio.models.sensor_data import SensorData
+from brush_studio.models.sensor_data import SensorData, SENSOR_FIELDS
+
+
+# Column of the reading in batched sensor readings
+_TIME = SENSOR_FIELDS.index('time')
 
 
 class TimeSensor(BaseSensor):
@@ -35,6 +40,27 @@ class TimeSensor(BaseSensor):
         self.max_time = max_time
         self.mode = mode
     
+    @property
+    def max_time(self) -> float:
+        """Time value that maps to 1.0 (seconds)."""
+        return self._max_time
+    
+    @max_time.setter
+    def max_time(self, value: float):
+        self._inv_max_time = self._reciprocal('max_time', value)
+        self._max_time = value
+        # Radians per second for 'oscillate' (one cycle per max_time)
+        self._angular_rate = 2.0 * math.pi * self._inv_max_time
+    
+    @property
+    def mode(self) -> str:
+        """How time is interpreted ('linear', 'fade' or 'oscillate')."""
+        return self._mode
+    
+    @mode.setter
+    def mode(self, mode: str):
+        self._bind_mode(mode, self._MODES, 'linear')
+    
     def compute(self, sensor_data: SensorData) -> float:
         """
         Compute time value from sensor data.
@@ -45,19 +71,49 @@ class TimeSensor(BaseSensor):
         Returns:
             Time-based value 0.0-1.0
         """
-        # Normalize time to 0-1 range
-        normalized = sensor_data.time / self.max_time
-        
-        if self.mode == 'fade':
-            # Inverse: 1.0 at start, 0.0 at max_time
-            return max(0.0, 1.0 - normalized)
+        return self._mode_compute(self, sensor_data)
+    
+    def compute_batch(self, readings: np.ndarray) -> np.ndarray:
+        """
+        Compute time values for many samples at once.
         
-        elif self.mode == 'oscillate':
-            # Sine wave: oscillates between 0 and 1
-            # Frequency: 1 complete cycle per max_time
-            return (math.sin(2.0 * math.pi * normalized) + 1.0) * 0.5
+        Args:
+            readings: Array of shape (N, len(SENSOR_FIELDS)), see BaseSensor.compute_batch
         
-        else:  # linear
-            # Direct mapping, clamped to 0-1
-            return max(0.0, min(1.0, normalized))
-
+        Returns:
+            Array of N time-based values 0.0-1.0
+        """
+        return self._mode_compute_batch(self, readings)
+    
+    def _compute_linear(self, sensor_data: SensorData) -> float:
+        """Direct mapping, clamped to 0-1."""
+        return max(0.0, min(1.0, sensor_data.time * self._inv_max_time))
+    
+    def _compute_fade(self, sensor_data: SensorData) -> float:
+        """Inverse: 1.0 at start, 0.0 at max_time."""
+        return max(0.0, 1.0 - sensor_data.time * self._inv_max_time)
+    
+    def _compute_oscillate(self, sensor_data: SensorData) -> float:
+        """Sine wave between 0 and 1, one complete cycle per max_time."""
+        return math.sin(sensor_data.time * self._angular_rate) * 0.5 + 0.5
+    
+    def _compute_linear_batch(self, readings: np.ndarray) -> np.ndarray:
+        """Batched _compute_linear."""
+        return np.clip(readings[:, _TIME] * self._inv_max_time, 0.0, 1.0)
+    
+    def _compute_fade_batch(self, readings: np.ndarray) -> np.ndarray:
+        """Batched _compute_fade."""
+        return np.maximum(0.0, 1.0 - readings[:, _TIME] * self._inv_max_time)
+    
+    def _compute_oscillate_batch(self, readings: np.ndarray) -> np.ndarray:
+        """Batched _compute_oscillate."""
+        values = np.sin(readings[:, _TIME] * self._angular_rate)
+        values *= 0.5
+        values += 0.5
+        return values
+    
+    _MODES = {
+        'linear': (_compute_linear, _compute_linear_batch),
+        'fade': (_compute_fade, _compute_fade_batch),
+        'oscillate': (_compute_oscillate, _compute_oscillate_batch),
+    }
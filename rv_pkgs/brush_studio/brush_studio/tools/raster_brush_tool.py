@@ -7,13 +7,14 @@ Handles stroke input, sensor reading, and coordinates with BrushRenderer.
 from typing import Optional, Tuple
 import time
 import math
+import numpy as np
 
-from brush_studio.models.sensor_data import SensorData
+from brush_studio.models.sensor_data import SensorData, SENSOR_FIELDS
 from brush_studio.models.brush_stroke import BrushStroke
 from brush_studio.models.brush_preset import BrushPreset
 from brush_studio.models.canvas import Canvas
 from brush_studio.sensors import PressureSensor, TiltSensor, RotationSensor, SpeedSensor, DistanceSensor, TimeSensor
-from brush_studio.utils.interpolation import interpolate_points, lerp
+from brush_studio.utils.interpolation import interpolate_points
 
 
 class RasterBrushTool:
@@ -158,17 +159,20 @@ class RasterBrushTool:
         current_frame = getattr(canvas, 'current_frame', 0)
         
         if interpolated:
-            for interp_x, interp_y in interpolated:
-                # Interpolate sensor data
-                t = self._calculate_interpolation_factor(last_x, last_y, interp_x, interp_y, x, y)
-                interp_sensor = self._interpolate_sensor_data(self.last_sensor_data, sensor_data, t)
-                
-                # Add to stroke
-                if self.stroke:
-                    self.stroke.add_point(interp_x, interp_y, interp_sensor)
-                
-                # Stamp
-                self._stamp_at_point(interp_x, interp_y, interp_sensor, current_frame)
+            points = np.array(interpolated)
+            
+            # Interpolate sensor data for all points at once
+            t = self._calculate_interpolation_factors(last_x, last_y, points, x, y)
+            start = self._sensor_row(self.last_sensor_data)
+            end = self._sensor_row(sensor_data)
+            readings = start + (end - start) * t[:, None]
+            
+            # Add to stroke
+            if self.stroke:
+                self.stroke.add_points(points, readings, time.time())
+            
+            # Stamp
+            self._stamp_at_points(points, readings, current_frame)
         else:
             # Points too close - stamp current point
             if self.stroke:
@@ -318,6 +322,48 @@ class RasterBrushTool:
             frame
         )
     
+    def _stamp_at_points(self, points: np.ndarray, readings: np.ndarray, frame: int):
+        """
+        Stamp brush at several points using renderer.
+        
+        Args:
+            points: Array of shape (N, 2) of normalized coordinates
+            readings: Array of shape (N, len(SENSOR_FIELDS)) of sensor readings
+            frame: Frame number
+        """
+        if not self.renderer or not self.current_preset:
+            return
+        
+        # Calculate modulated brush parameters for all points
+        sizes = self._apply_sensor_modulation_batch(
+            self.current_preset.size,
+            self.current_preset.size_modulation,
+            readings
+        )
+        
+        opacities = self._apply_sensor_modulation_batch(
+            self.current_preset.opacity,
+            self.current_preset.opacity_modulation,
+            readings
+        )
+        
+        # Apply flow (affects accumulation, not direct opacity)
+        flows = self._apply_sensor_modulation_batch(
+            self.current_preset.flow,
+            self.current_preset.flow_modulation,
+            readings
+        )
+        
+        # Stamp brush, with opacity adjusted by flow
+        self.renderer.stamp_brushes(
+            points[:, 0], points[:, 1],
+            sizes,
+            opacities * flows,
+            self.current_preset.color,
+            self.current_preset.hardness,
+            frame
+        )
+    
     def _apply_sensor_modulation(
         self,
         base_value: float,
@@ -359,60 +405,67 @@ class RasterBrushTool:
         
         return max(0.0, value)
     
-    def _calculate_interpolation_factor(
+    def _apply_sensor_modulation_batch(
         self,
-        x1: float, y1: float,
-        xi: float, yi: float,
-        x2: float, y2: float
-    ) -> float:
+        base_value: float,
+        sensor_configs: list,
+        readings: np.ndarray
+    ) -> np.ndarray:
         """
-        Calculate interpolation factor for intermediate point.
+        Apply sensor modulation to parameter for several points.
         
         Args:
-            x1, y1: Start point
-            xi, yi: Intermediate point
-            x2, y2: End point
+            base_value: Base parameter value
+            sensor_configs: List of SensorConfig
+            readings: Array of shape (N, len(SENSOR_FIELDS)) of sensor readings
         
         Returns:
-            Interpolation factor 0-1
+            Array of N modulated values
         """
-        # Calculate distances
-        dist_start = math.sqrt((xi - x1) ** 2 + (yi - y1) ** 2)
-        dist_total = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+        values = np.full(len(readings), float(base_value))
         
-        if dist_total < 0.0001:
-            return 0.5
+        for config in sensor_configs:
+            if not config.enabled:
+                continue
+            
+            sensor = self.sensors.get(config.sensor_type)
+            if sensor is None:
+                continue
+            
+            # Apply strength and multiply modulation
+            sensor_values = sensor.compute_batch(readings)
+            values *= 1.0 + (sensor_values - 1.0) * config.strength
         
-        return dist_start / dist_total
+        return np.maximum(0.0, values)
     
-    def _interpolate_sensor_data(
+    def _calculate_interpolation_factors(
         self,
-        data1: SensorData,
-        data2: SensorData,
-        t: float
-    ) -> SensorData:
+        x1: float, y1: float,
+        points: np.ndarray,
+        x2: float, y2: float
+    ) -> np.ndarray:
         """
-        Interpolate between two sensor data points.
+        Calculate interpolation factors for intermediate points.
         
         Args:
-            data1: Start sensor data
-            data2: End sensor data
-            t: Interpolation factor (0-1)
+            x1, y1: Start point
+            points: Array of shape (N, 2) of intermediate points
+            x2, y2: End point
         
         Returns:
-            Interpolated SensorData
+            Array of N interpolation factors 0-1
         """
-        result = SensorData()
-        
-        result.pressure = lerp(data1.pressure, data2.pressure, t)
-        result.tilt_x = lerp(data1.tilt_x, data2.tilt_x, t)
-        result.tilt_y = lerp(data1.tilt_y, data2.tilt_y, t)
-        result.rotation = lerp(data1.rotation, data2.rotation, t)
-        result.speed = lerp(data1.speed, data2.speed, t)
-        result.distance = lerp(data1.distance, data2.distance, t)
-        result.time = lerp(data1.time, data2.time, t)
-        result.x = lerp(data1.x, data2.x, t)
-        result.y = lerp(data1.y, data2.y, t)
-        
-        return result
-
+        # Calculate distances
+        dist_total = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+        
+        if dist_total < 0.0001:
+            return np.full(len(points), 0.5)
+        
+        dx = points[:, 0] - x1
+        dy = points[:, 1] - y1
+        return np.sqrt(dx ** 2 + dy ** 2) / dist_total
+    
+    @staticmethod
+    def _sensor_row(sensor_data: SensorData) -> np.ndarray:
+        """Get sensor readings as an array in SENSOR_FIELDS order."""
+        return np.array([getattr(sensor_data, name) for name in SENSOR_FIELDS])
@@ -14,7 +14,7 @@ except ImportError:
     from PySide2.QtGui import QPixmap, QImage
     from PySide2.QtCore import Qt
 
-from brush_studio.rendering.brush_textures import BrushTextureGenerator
+from brush_studio.rendering.brush_textures import BrushTextureGenerator, BRUSH_TEXTURE_TYPES
 
 
 class BrushTipThumbnailGenerator:
@@ -25,21 +25,8 @@ class BrushTipThumbnailGenerator:
     with caching to avoid regeneration.
     """
     
-    # Mapping of texture type names to generator methods
-    TEXTURE_GENERATORS = {
-        'soft_circle': BrushTextureGenerator.create_soft_circle,
-        'hard_circle': BrushTextureGenerator.create_hard_circle,
-        'noise': BrushTextureGenerator.create_noise_texture,
-        'square_hard': BrushTextureGenerator.create_square_hard,
-        'square_soft': BrushTextureGenerator.create_square_soft,
-        'triangle': BrushTextureGenerator.create_triangle,
-        'star': BrushTextureGenerator.create_star,
-        'splatter': BrushTextureGenerator.create_splatter,
-        'stipple': BrushTextureGenerator.create_stipple,
-        'grainy': BrushTextureGenerator.create_grainy,
-        'scratchy': BrushTextureGenerator.create_scratchy,
-        'diamond': BrushTextureGenerator.create_diamond,
-    }
+    # Texture types that have thumbnails
+    TEXTURE_TYPES = BRUSH_TEXTURE_TYPES
     
     def __init__(self):
         """Initialize thumbnail generator with empty cache."""
@@ -62,12 +49,12 @@ class BrushTipThumbnailGenerator:
             return self._thumbnail_cache[cache_key]
         
         # Generate texture data
-        if texture_type not in self.TEXTURE_GENERATORS:
+        if texture_type not in self.TEXTURE_TYPES:
             # Fallback to soft circle for unknown types
             texture_type = 'soft_circle'
         
-        generator_func = self.TEXTURE_GENERATORS[texture_type]
-        _, texture_data = generator_func(size=128)  # Generate at higher res
+        # Generate at higher res; pixel data only, no GL texture is needed
+        texture_data = BrushTextureGenerator.generate(texture_type, 128)
         
         # Convert numpy array to QImage
         # texture_data is float32 in range 0-1
@@ -120,7 +107,7 @@ class BrushTipThumbnailGenerator:
         Returns:
             List of texture type names
         """
-        return list(cls.TEXTURE_GENERATORS.keys())
+        return list(cls.TEXTURE_TYPES)
 
 
 # Singleton instance for convenience
@@ -391,7 +391,7 @@ class BrushStudioMode(rvt.MinorMode):
                 for stroke in strokes:
                     stroke_data = {
                         "preset_name": stroke.preset_name,
-                        "color": list(stroke.color),  # Convert tuple to list for JSON
+                        "color": stroke.color.tolist(),  # Convert array to list for JSON
                         "texture_type": stroke.texture_type,
                         "size": stroke.size,
                         "opacity": stroke.opacity,
@@ -506,7 +506,8 @@ class BrushStudioMode(rvt.MinorMode):
                         flow=saved_flow,
                         frame=frame_num,
                         start_time=stroke_data.get("start_time", 0.0),
-                        end_time=stroke_data.get("end_time", 0.0)
+                        end_time=stroke_data.get("end_time", 0.0),
+                        expected_points=len(stroke_data["points"])
                     )
                     
                     # Recreate points
@@ -524,9 +525,7 @@ class BrushStudioMode(rvt.MinorMode):
                         stroke.add_point(point_data["x"], point_data["y"], sensor)
                     
                     # Add stroke to canvas
-                    if frame_num not in self.canvas.strokes_by_frame:
-                        self.canvas.strokes_by_frame[frame_num] = []
-                    self.canvas.strokes_by_frame[frame_num].append(stroke)
+                    self.canvas.add_stroke(stroke)
                     
                     # Replay stroke through renderer to recreate FBO
                     self.renderer.set_source_transform(rvc.sources()[0] if rvc.sources() else None)